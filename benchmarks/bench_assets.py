@@ -0,0 +1,57 @@
+"""
+Scene asset load times with a cold and a warm decoded-asset cache.
+Run from the project root: python -m benchmarks.bench_assets
+"""
+import os
+import shutil
+import tempfile
+import time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+import pygame as pg
+from src.core import asset_cache
+from src.core.assets import AssetManager, SCENE_MANIFESTS
+
+RUNS = 5
+
+def load_all():
+    manager = AssetManager()
+    t0 = time.perf_counter()
+    for scene in SCENE_MANIFESTS:
+        manager.request(scene)
+    while manager.busy:
+        manager.poll(budget_ms=1000.0)
+        time.sleep(0.0005)
+    ms = (time.perf_counter() - t0) * 1000.0
+    manager.shutdown()
+    return ms
+
+def timed(label, runs, before=None):
+    times = []
+    for _ in range(runs):
+        if before:
+            before()
+        times.append(load_all())
+    times.sort()
+    print(f"  {label:<22} median {times[len(times) // 2]:8.1f} ms   min {times[0]:8.1f} ms")
+
+def main():
+    pg.init()
+    pg.mixer.init()
+    pg.display.set_mode((320, 240))
+    tmp = tempfile.mkdtemp()
+    asset_cache.ASSET_CACHE_DIR = tmp
+    try:
+        print(f"All scenes ({sum(len(m) for m in SCENE_MANIFESTS.values())} assets), {RUNS} runs")
+        asset_cache.ASSET_CACHE_ENABLED = False
+        timed("no cache", RUNS)
+        asset_cache.ASSET_CACHE_ENABLED = True
+        clear = lambda: (shutil.rmtree(tmp, ignore_errors=True), os.makedirs(tmp))
+        timed("cold cache (filling)", RUNS, clear)
+        timed("warm cache", RUNS)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+        pg.quit()
+
+if __name__ == "__main__":
+    main()
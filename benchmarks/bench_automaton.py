@@ -0,0 +1,32 @@
+"""
+Traffic automaton throughput in cell updates per second.
+Run from the project root: python -m benchmarks.bench_automaton
+"""
+import os
+import time
+import numpy as np
+from src.constants import CA_DENSITY
+from src.game.automaton import TrafficCA, TiledTrafficCA, seed_grid
+
+# (lanes, cells): the 1024x576 map raster and a large 4096x4096 grid
+GRIDS = ((576, 1024), (4096, 4096))
+STEPS = 20
+
+def run(ca):
+    ca.step()  # Warm-up (pool start-up in tiled mode)
+    t0 = time.perf_counter()
+    for _ in range(STEPS):
+        ca.step()
+    elapsed = time.perf_counter() - t0
+    ca.close()
+    return ca.cells * STEPS / elapsed
+
+if __name__ == "__main__":
+    workers = os.cpu_count() or 1
+    print(f"{'grid':>12} {'mode':>14} {'cell-updates/s':>16}")
+    for shape in GRIDS:
+        grid = seed_grid(shape, CA_DENSITY, np.random.default_rng(0))
+        label = f"{shape[1]}x{shape[0]}"
+        print(f"{label:>12} {'single':>14} {run(TrafficCA(grid.copy(), seed=0)):>16.3e}")
+        tiled = TiledTrafficCA(grid.copy(), seed=0, workers=workers)
+        print(f"{label:>12} {f'tiled x{workers}':>14} {run(tiled):>16.3e}")
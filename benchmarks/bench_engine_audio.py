@@ -0,0 +1,45 @@
+"""
+Engine voice selection cost as the field grows: cars spread over a fixed map,
+so the spatial hash query sees the same local density whatever the field size.
+Run from the project root: python -m benchmarks.bench_engine_audio
+"""
+import time
+import numpy as np
+from src.constants import ENGINE_HASH_CELL, ENGINE_HEAR_RADIUS, ENGINE_VOICES
+from src.core.engine_audio import SpatialHash
+
+FIELDS = (50, 500, 5000)
+MAP_PX_PER_CAR = 1024 * 576 / 50    # Map area per car at the smallest field
+TICKS = 200
+
+def bench(n, rng):
+    # Map grows with the field so cars around the listener stay as dense
+    side = np.sqrt(MAP_PX_PER_CAR * n)
+    pos = rng.random((n, 2)) * side
+    loud = rng.random(n)
+    spatial = SpatialHash(ENGINE_HASH_CELL)
+    build = query = 0.0
+    for _ in range(TICKS):
+        listener = pos[rng.integers(n)]
+        t0 = time.perf_counter()
+        spatial.build(pos)
+        t1 = time.perf_counter()
+        near = spatial.query(listener, ENGINE_HEAR_RADIUS)
+        d = np.hypot(*(pos[near] - listener).T)
+        score = loud[near] / (1.0 + d)
+        if len(near) > ENGINE_VOICES:
+            np.argpartition(-score, ENGINE_VOICES)
+        t2 = time.perf_counter()
+        build += t1 - t0
+        query += t2 - t1
+    return build / TICKS * 1e6, query / TICKS * 1e6
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'cars':>6}  {'hash build':>12}  {'select':>10}")
+    for n in FIELDS:
+        b, q = bench(n, rng)
+        print(f"{n:>6}  {b:>9.1f} us  {q:>7.1f} us")
+
+if __name__ == "__main__":
+    main()
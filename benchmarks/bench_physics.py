@@ -0,0 +1,44 @@
+"""
+Batched car physics throughput.
+Run from the project root: python -m benchmarks.bench_physics
+"""
+import json
+import os
+import time
+import numpy as np
+from src.constants import DATA_DIR, PHYSICS_HZ, PART_DEFAULTS, CAR_DEFAULTS
+from src.game import physics
+from src.game.physics import CarBatch
+
+SIZES = (10, 100, 10000)
+STEPS = 600
+
+def build_batch(count, track):
+    stats = dict(CAR_DEFAULTS)
+    for slot_stats in PART_DEFAULTS.values():
+        stats.update(slot_stats)
+    rng = np.random.default_rng(0)
+    sx, sy = track['spawn']
+    batch = CarBatch(count)
+    for i in range(count):
+        batch.set_car(i, f"car_{i % 18}", stats, sx + rng.uniform(-8, 8), sy + rng.uniform(-40, 40),
+                      np.radians(track['heading']))
+    return batch
+
+def run(count, track):
+    batch = build_batch(count, track)
+    waypoints = np.asarray(track['waypoints'], dtype=float)
+    dt = 1.0 / PHYSICS_HZ
+    t0 = time.perf_counter()
+    for n in range(STEPS):
+        physics.step(batch, dt, waypoints, (n + 1) * dt)
+    elapsed_ms = (time.perf_counter() - t0) * 1000.0
+    return elapsed_ms / STEPS
+
+if __name__ == "__main__":
+    with open(os.path.join(DATA_DIR, 'tracks', 'map_0.json'), encoding='utf-8') as f:
+        track = json.load(f)
+    print(f"{'cars':>8} {'ms/step':>10} {'cars/ms':>12}")
+    for count in SIZES:
+        ms = run(count, track)
+        print(f"{count:>8} {ms:>10.4f} {count / ms:>12.1f}")
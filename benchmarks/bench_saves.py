@@ -0,0 +1,66 @@
+"""
+JSON vs binary player saves for a heavy profile.
+Run from the project root: python -m benchmarks.bench_saves
+"""
+import json
+import os
+import tempfile
+import time
+from src.core.data_manager import write_json_atomic
+from src.core.savefile import SaveFile, SaveState, write_save_file
+
+CARS = 500
+PARTS = 2000
+REPEATS = 20
+
+def heavy_profile():
+    garage = [{
+        "instance_id": f"auto_{i:04d}",
+        "model_id": f"car_{i % 18}",
+        "custom_name": f"Car {i}",
+        "mounted_parts": {"engine": f"m_{i % 6}_engine", "breaks": f"m_{i % 6}_breaks", "boost": f"m_{i % 6}_boost"}
+    } for i in range(CARS)]
+    inventory = {
+        "engines": [f"l_{i % 6}_engine" for i in range(PARTS // 3)],
+        "breaks": [f"l_{i % 6}_breaks" for i in range(PARTS // 3)],
+        "boosts": [f"l_{i % 6}_boost" for i in range(PARTS // 3)]
+    }
+    player = {"name": "Bench", "money": 0, "level": 30, "exp": 0, "current_car": "car_0"}
+    return {"player": player, "garage": garage, "inventory": inventory}
+
+def timed(fn):
+    t0 = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - t0) * 1000.0 / REPEATS
+
+def bump_money(data):
+    data["player"]["money"] += 1
+
+def main():
+    data = heavy_profile()
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, 'player_state.json')
+        bin_path = os.path.join(tmp, 'player_state.bin')
+        write_json_atomic(json_path, data)
+        write_save_file(bin_path, data)
+
+        def load_json():
+            with open(json_path, encoding='utf-8') as f:
+                return json.load(f)
+        rows = [
+            ("json  full load", timed(load_json)),
+            ("bin   open + player only", timed(lambda: SaveState(SaveFile(bin_path))["player"])),
+            ("bin   full load", timed(lambda: dict(SaveState(SaveFile(bin_path))))),
+            ("json  save (money changed)", timed(lambda: (bump_money(data), write_json_atomic(json_path, data)))),
+            ("bin   save (money changed)", timed(lambda: (bump_money(data), write_save_file(bin_path, data)))),
+        ]
+        sizes = (os.path.getsize(json_path), os.path.getsize(bin_path))
+
+    print(f"{CARS} cars, {PARTS} parts, mean of {REPEATS} runs")
+    for label, ms in rows:
+        print(f"  {label:<28} {ms:8.3f} ms")
+    print(f"  file size: json {sizes[0]} B, bin {sizes[1]} B (after {REPEATS} appends)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Shop filtering and drawing with a 5,900-part catalog: masking the prebuilt
+sort indexes, incremental search per keystroke, and one full shop frame.
+Run from the project root: python -m benchmarks.bench_shop
+"""
+import json
+import os
+import time
+from types import SimpleNamespace
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame as pg
+from src.core.data_manager import DataManager
+from src.core.locale import LanguageManager
+from src.game.catalog import GameCatalog
+from src.game.player import Player
+from src.ui.menu_shop import ShopMenu, SORT_KEYS, SLOT_FILTERS
+
+COPIES = 130  # Template parts are repeated this many times on top of the originals
+QUERY = "engine mk2 #1"
+REPEATS = 20
+
+def big_catalog(game_db):
+    base = dict(game_db['parts'])
+    for k in range(COPIES):
+        for part_id, part in base.items():
+            game_db['parts'][f"{part_id}_{k}"] = dict(part, name=f"{part['name']} #{k}", price=part['price'] + k)
+    return GameCatalog(game_db)
+
+def timed(fn):
+    """(mean, max) ms of fn over REPEATS calls."""
+    times = []
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    return sum(times) / len(times), max(times)
+
+def main():
+    pg.init()
+    screen = pg.display.set_mode((1280, 720))
+    dm = DataManager()
+    catalog = big_catalog(dm.load_game_data())
+    with open(os.path.join(dm.template_dir, 'player_state.json'), encoding='utf-8') as f:
+        player = Player(json.load(f), catalog)
+    # The shop only needs the screen and texts until something is bought
+    app = SimpleNamespace(screen=screen, lang=LanguageManager('en'))
+    shop = ShopMenu(app, player, lambda: None)
+    print(f"{len(catalog.part_ids)} parts, mean / max of {REPEATS} runs")
+
+    for sort_key in SORT_KEYS:
+        for slot in SLOT_FILTERS:
+            shop.sort_key, shop.slot_filter = sort_key, slot
+            mean, worst = timed(shop.refresh_rows)
+            print(f"  sort {sort_key:<5} slot {slot or 'all':<7} {mean:7.3f} / {worst:7.3f} ms")
+    shop.sort_key, shop.slot_filter = 'price', None
+
+    def type_query():
+        times = []
+        for n in range(1, len(QUERY) + 1):
+            t0 = time.perf_counter()
+            shop.apply_query(QUERY[:n])
+            times.append((time.perf_counter() - t0) * 1000.0)
+        for n in range(len(QUERY) - 1, -1, -1):
+            t0 = time.perf_counter()
+            shop.apply_query(QUERY[:n])
+            times.append((time.perf_counter() - t0) * 1000.0)
+        return times
+    keys = [ms for _ in range(REPEATS) for ms in type_query()]
+    print(f"  search per keystroke      {sum(keys) / len(keys):7.3f} / {max(keys):7.3f} ms")
+
+    shop.draw(screen)  # Warm-up: row texts go through the render cache
+    mean, worst = timed(lambda: shop.draw(screen))
+    print(f"  shop frame                {mean:7.3f} / {worst:7.3f} ms")
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Per-frame cost of HUD text that changes every frame (a race timer) and of
+text that repeats (a position and speed line at cruising speed):
+font.render, the render_text LRU, and the glyph atlas.
+Run from the project root: python -m benchmarks.bench_text
+"""
+import os
+import time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame as pg
+from src.constants import TEXT_MAIN
+from src.core.fonts import get_font, render_text, get_glyph_atlas
+
+FRAMES = 2000
+
+def changing(frame):
+    return f"Time: {frame / 60.0:6.2f}   P3/4  {frame % 400} px/s"
+
+def repeating(frame):
+    return f"P3/4  {240 + frame % 3} px/s"
+
+def timed(label, draw, text):
+    t0 = time.perf_counter()
+    for frame in range(FRAMES):
+        draw(text(frame))
+    us = (time.perf_counter() - t0) / FRAMES * 1e6
+    print(f"  {label:<14} {us:8.1f} us/frame")
+
+def main():
+    pg.init()
+    screen = pg.display.set_mode((640, 120))
+    font = get_font(24, bold=True)
+    atlas = get_glyph_atlas(24, TEXT_MAIN, bold=True)
+    for name, text in (("changing", changing), ("repeating", repeating)):
+        print(f"{name} text:")
+        timed("font.render", lambda s: screen.blit(font.render(s, True, TEXT_MAIN), (10, 10)), text)
+        timed("render_text", lambda s: screen.blit(render_text(s, 24, TEXT_MAIN, bold=True), (10, 10)), text)
+        timed("glyph atlas", lambda s: atlas.draw(screen, s, (10, 10)), text)
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,22 @@
-from src.core.app import Main
+import argparse
+import sys
+from src.core.profiler import profiler
+
+def parse_args(argv):
+    p = argparse.ArgumentParser(prog='main.py', description="CA Racing")
+    p.add_argument('--profile-startup', nargs='?', const='startup_profile.json', default=None, metavar='PATH',
+                   help="write startup phase timings as JSON to PATH and exit after the first frame")
+    return p.parse_args(argv)
 
 if __name__ == "__main__":
     # Entry point for the application
+    args = parse_args(sys.argv[1:])
+    if args.profile_startup:
+        profiler.enable(args.profile_startup)
+    # pygame (and numpy with it) dominates import time; keep it apart from our own modules
+    with profiler.phase('import_pygame'):
+        import pygame
+    with profiler.phase('import_game'):
+        from src.core.app import Main
     app = Main()
-    app.run()
\ No newline at end of file
+    app.run()
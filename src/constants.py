@@ -21,6 +21,19 @@ RESOLUTIONS = [
 
 FPS_LIMITS = [30, 60, 120, 144]
 
+# --- CAR SPRITE SHEET ---
+CAR_SHEET_COLS = 6
+CAR_SHEET_ROWS = 3
+CAR_MODEL_COUNT = CAR_SHEET_COLS * CAR_SHEET_ROWS
+SPRITE_CACHE_BYTES = 32 * 1024 * 1024   # Cap for cached scaled/rotated car sprites
+# Pre-rotated frames per car in the race view, by graphics quality
+ROTATION_BANK_FRAMES = {"LOW": 32, "MED": 64, "HIGH": 128}
+
+# --- FONTS ---
+FONT_FAMILY = 'Consolas'
+TEXT_CACHE_SIZE = 512       # Rendered text surfaces kept in the LRU
+ATLAS_LINE_CACHE = 32       # Laid-out lines kept per glyph atlas
+
 # --- COLORS (R, G, B) ---
 BG_COLOR = (30, 30, 30)
 PANEL_BG = (50, 50, 55)
@@ -33,4 +46,125 @@ ACCENT_BLUE = (50, 100, 200)
 ACCENT_GOLD = (255, 215, 0)
 
 BUTTON_COLOR = (70, 70, 80)
-BUTTON_HOVER_COLOR = (100, 100, 120)
\ No newline at end of file
+BUTTON_HOVER_COLOR = (100, 100, 120)
+
+# --- RACE SIMULATION ---
+# Physics runs at a fixed rate, independent of the render FPS limit.
+PHYSICS_HZ = 120
+MAX_STEPS_PER_FRAME = 8     # Spiral-of-death guard: drop time beyond this
+STEP_BUDGET_MS = 1.0        # Target wall time for one physics step
+STEP_STATS_WINDOW = 240     # Steps kept for timing statistics
+
+RACE_AI_OPPONENTS = 3
+CAR_LENGTH_PX = 18          # Car length in map pixels
+WAYPOINT_RADIUS = 14
+
+# Fallback stats used when a part is missing from game_data.json
+PART_DEFAULTS = {
+    "engine": {"accel": 120.0, "top_speed": 180.0},
+    "breaks": {"brake": 260.0},
+    "boost": {"boost_power": 1.35, "boost_time": 2.5}
+}
+CAR_DEFAULTS = {"turn_rate": 3.2}
+
+# --- TRACK SURFACES ---
+# Per-pixel surface classes stored in the precomputed track mask
+SURFACE_WALL = 0
+SURFACE_ASPHALT = 1
+SURFACE_GRASS = 2
+SURFACE_CURB = 3
+SURFACE_CHECKPOINT = 4
+
+# Map image colours -> surface class. Transparent pixels are always walls;
+# any other colour is matched to the nearest palette entry.
+SURFACE_PALETTE = {
+    (108, 108, 108): SURFACE_ASPHALT,
+    (176, 176, 176): SURFACE_ASPHALT,   # Lane markings
+    (64, 64, 64): SURFACE_ASPHALT,      # Road edge
+    (144, 144, 144): SURFACE_ASPHALT,   # Road edge
+    (200, 152, 112): SURFACE_CURB,
+    (160, 192, 112): SURFACE_GRASS,
+    (176, 212, 132): SURFACE_GRASS,
+    (116, 144, 60): SURFACE_GRASS,
+    (255, 0, 255): SURFACE_CHECKPOINT,
+    (0, 0, 0): SURFACE_WALL
+}
+# Extra speed loss per second, indexed by surface class
+SURFACE_DRAG = [0.0, 0.0, 1.6, 0.4, 0.0]
+WALL_SPEED_KEEP = 0.5       # Speed kept when sliding along a wall
+
+# --- TRAFFIC AUTOMATON (Nagel-Schreckenberg) ---
+CA_VMAX = 3                 # Cells per CA step
+CA_P_SLOW = 0.25            # Random slowdown probability
+CA_CELL_PX = 20             # Cell length along the track, in map pixels
+CA_STEP_S = 0.4             # Race time between CA steps
+CA_DENSITY = 0.08
+CA_LANE_OFFSETS = (-6, 6)   # Lane offsets from the track centreline
+CA_START_CLEAR_CELLS = 4    # Cells kept empty around the starting grid
+TRAFFIC_HIT_RADIUS = 10
+TRAFFIC_DRAG = 6.0          # Speed loss per second while touching traffic
+
+# --- HEADLESS SIMULATION ---
+SIM_MAX_RACE_S = 300.0      # Races still running after this are recorded as DNF
+
+# --- FRAME PACING ---
+IDLE_WAIT_MS = 250          # Max block on pg.event.wait when nothing animates
+TRANSITION_ACTIVE_S = 0.25  # Full frame rate kept after a view change
+FRAME_STATS_WINDOW = 600    # Active frames kept for p50/p99
+DEADLINE_SLACK = 1.25       # Frame counts as missed beyond this x the frame budget
+
+# --- SAVES ---
+SAVE_FORMAT = 'json'                # 'json' or 'bin' (see src/core/savefile.py)
+SAVE_COMPACT_MIN_BYTES = 64 * 1024  # Dead bytes tolerated in a binary save before compacting
+
+# --- GARAGE GRID ---
+GARAGE_CELL = (220, 230)        # Grid pitch: tile plus "selected" label and name
+GARAGE_TILE = 160
+GARAGE_WHEEL_IMPULSE = 900.0    # Scroll velocity (px/s) added per wheel notch
+GARAGE_FRICTION = 6.0           # Exponential decay rate of the scroll velocity (1/s)
+GARAGE_MIN_SPEED = 15.0         # Below this (px/s) kinetic scrolling stops
+GARAGE_DRAG_SLOP = 6            # Pointer travel (px) that turns a click into a drag
+
+# --- ASSET STREAMING ---
+ASSET_WORKERS = 4               # Decode threads
+ASSET_CONVERT_BUDGET_MS = 4.0   # Main-thread convert() time per poll
+ASSET_CACHE_ENABLED = True      # Decoded pixel/PCM cache, see src/core/asset_cache.py
+ASSET_CACHE_DIR = os.path.join(ASSETS_DIR, '.cache')
+
+# --- AUDIO CHANNELS ---
+# Reserved mixer channel groups, in channel order; SFX never spill across groups
+AUDIO_GROUPS = (('ui', 4), ('engines', 8), ('stingers', 2))
+SFX_MIN_INTERVAL_MS = 40        # Default gap before the same sound may start again
+# Sound key -> (group, priority, min interval ms); higher priority steals lower
+SFX_PROFILES = {
+    'ui_hover': ('ui', 0, 70),
+    'ui_click': ('ui', 1, SFX_MIN_INTERVAL_MS),
+    'ui_select': ('ui', 2, SFX_MIN_INTERVAL_MS),
+    'ui_back': ('ui', 2, SFX_MIN_INTERVAL_MS),
+    'ui_cancel': ('ui', 2, SFX_MIN_INTERVAL_MS),
+    'ui_popup': ('ui', 2, SFX_MIN_INTERVAL_MS),
+    'ui_swipe': ('ui', 1, SFX_MIN_INTERVAL_MS),
+    'ui_error': ('ui', 3, 120)
+}
+
+# --- ENGINE AUDIO ---
+ENGINE_VOICES = 6               # Cars heard at once (taken from the 'engines' group)
+ENGINE_HEAR_RADIUS = 420.0      # Map px beyond which a car is silent
+ENGINE_REF_DIST = 80.0          # Distance (map px) at which a car is at half gain
+ENGINE_PAN_DIST = 300.0         # Horizontal offset (map px) panned fully to one side
+ENGINE_HASH_CELL = 140          # Spatial hash cell size (map px)
+ENGINE_BASE_HZ = 36.0           # Firing frequency of the engine loop at idle
+ENGINE_PITCHES = 10             # Pitched variants of the loop, idle to redline
+ENGINE_PITCH_RANGE = (1.0, 3.2) # Idle and redline pitch, relative to ENGINE_BASE_HZ
+ENGINE_GEARS = 4
+ENGINE_TRAFFIC_GAIN = 0.5       # Traffic engines relative to racers
+ENGINE_FADE_MS = 80             # Fade of a car leaving the heard set, and of pitch crossfades
+ENGINE_PITCH_HYSTERESIS = 0.3   # Pitch steps RPM must pass a switch point by before the loop changes
+
+# --- MUSIC ---
+MUSIC_FADE_MS = 600             # Fade out of the old track, and fade in of the new one
+MUSIC_FALLBACK = 'main_theme'   # Plays in place of tracks whose file is missing
+
+# --- LOCALES ---
+LANGUAGES = ('en', 'pl', 'de', 'es', 'fr', 'pt')    # data/lang/<code>.json; 'en' fills gaps
+LOCALE_BUNDLE = os.path.join(DATA_DIR, 'lang', 'bundle.json')  # See src/core/locale.py
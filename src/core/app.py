@@ -1,47 +1,64 @@
 import pygame as pg
 import sys
+import time
 from src.constants import *
 from src.core.data_manager import DataManager
 from src.core.locale import LanguageManager
-from src.core.assets import load_game_assets
+from src.core.assets import AssetManager
 from src.core.audio import AudioManager # NEW
+from src.core.music import MUSIC_END
+from src.core.fonts import evict_text
+from src.core.pacing import FramePacer
+from src.core.profiler import profiler
 from src.ui.menu_main import MainMenu
-from src.ui.menu_settings import GlobalSettingsMenu
-from src.game.session import GameSession
+from src.ui.loading import LoadingScreen
 
 class Main:
     def __init__(self):
         # 1. Init Pygame & Mixer
-        pg.init()
-        pg.mixer.init()
+        with profiler.phase('pygame_init'):
+            pg.init()
+            pg.mixer.init()
         
-        self.data_manager = DataManager()
-        self.global_settings = self.data_manager.load_global_settings()
+        with profiler.phase('settings_load'):
+            self.data_manager = DataManager()
+            self.global_settings = self.data_manager.load_global_settings()
         
-        self.lang = LanguageManager(self.global_settings.get("language", "en"))
+        with profiler.phase('locale_load'):
+            self.lang = LanguageManager(self.global_settings.get("language", "en"))
+            self.lang.add_listener(evict_text)
         
         self.screen = None
-        self.apply_graphics(self.global_settings)
+        with profiler.phase('display_init'):
+            self.apply_graphics(self.global_settings)
         
         pg.display.set_caption("CA Racing")
         self.clock = pg.time.Clock()
+        self.pacer = FramePacer(self.clock)
         self.running = True
+        # Next frame repaints the whole screen (set on view changes and most input)
+        self.full_redraw = True
         
-        # 2. Load Assets
-        try:
-            self.assets = load_game_assets()
-        except Exception as e:
-            print(f"[MAIN] Critical Asset Error: {e}")
-            self.assets = {'sfx': {}, 'music': {}}
+        # 2. Load Assets: menu scene now, race scene streams in behind the menu
+        self.asset_manager = AssetManager()
+        self.assets = self.asset_manager.assets
+        self.loading = LoadingScreen(self)
+        with profiler.phase('asset_load'):
+            self.load_scene('menu')
+        self.asset_manager.request('race')
             
         # 3. Init Audio Manager & Start Music
-        self.audio = AudioManager(self)
-        self.audio.play_music('main_theme')
+        with profiler.phase('audio_init'):
+            self.audio = AudioManager(self)
+            self.audio.play_music('main_theme')
             
         self.state = 'MENU'
-        self.menu = MainMenu(self)
-        self.settings = GlobalSettingsMenu(self, self.return_to_menu)
+        with profiler.phase('menu_init'):
+            self.menu = MainMenu(self)
+        # Settings views and the game session are built on first use
+        self._settings = None
         self.session = None
+        self.constructed_at = time.perf_counter()
 
     def apply_graphics(self, s):
         idx = s.get("resolution_idx", 0)
@@ -50,49 +67,138 @@ class Main:
         flags = pg.DOUBLEBUF
         if s.get("fullscreen"): flags |= pg.FULLSCREEN
         self.screen = pg.display.set_mode((w, h), flags)
+        self.request_redraw()
+
+    def load_scene(self, scene):
+        """Blocks on a scene's assets behind the loading screen (no-op once loaded)."""
+        if self.asset_manager.is_ready(scene):
+            return
+        def show_progress(loaded, total):
+            pg.event.pump()
+            self.loading.draw(self.screen, loaded, total)
+            pg.display.flip()
+        self.asset_manager.load_scene(scene, show_progress)
+        self.request_redraw()
+
+    def request_redraw(self):
+        self.full_redraw = True
+        # View changes get a short burst of full-rate frames
+        if hasattr(self, 'pacer'): self.pacer.kick()
+
+    def is_animating(self):
+        """True while the current view needs frames without input (e.g. a race)."""
+        # Keep polling while background asset loads are in flight
+        if self.asset_manager.busy or self.audio.music.waiting:
+            return True
+        return self.state == 'GAME' and self.session is not None and self.session.is_animating()
+
+    @property
+    def settings(self):
+        if self._settings is None:
+            from src.ui.menu_settings import GlobalSettingsMenu
+            self._settings = GlobalSettingsMenu(self, self.return_to_menu)
+        return self._settings
 
     def start_game_session(self, slot_id):
+        # Imported on first use: pulls in the race engine, shop and garage
+        from src.game.session import GameSession
         slots = self.data_manager.check_save_slots()
         if not slots[slot_id]:
             if not self.data_manager.create_new_save(slot_id): return
         self.session = GameSession(self, slot_id)
         self.state = 'GAME'
+        self.request_redraw()
 
     def close_session(self):
         self.session = None
         self.state = 'MENU'
+        self.request_redraw()
         self.audio.play_music('main_theme') # Resume main music
         self.menu.init_main_view()
 
     def open_global_settings(self):
         self.state = 'SETTINGS'
+        self.request_redraw()
         self.settings.init_main_view()
 
     def return_to_menu(self):
         self.state = 'MENU'
+        self.request_redraw()
         self.menu.init_main_view()
 
     def quit_game(self):
+        """Ends the main loop; queued saves are flushed before exit."""
         self.running = False
 
+    def render(self, events):
+        """
+        Retained-mode frame: anything but mouse motion may have changed the view,
+        so it gets a full redraw and flip. Otherwise widgets repaint only what their
+        hover state changed, and a frame with nothing dirty is not presented at all.
+        """
+        full = self.full_redraw or any(e.type != pg.MOUSEMOTION for e in events)
+        if not full:
+            if self.state == 'MENU':
+                rects = self.menu.draw_dirty(self.screen)
+            elif self.state == 'SETTINGS':
+                rects = self.settings.draw_dirty(self.screen)
+            elif self.state == 'GAME' and self.session:
+                rects = self.session.draw_dirty()
+            else:
+                rects = None
+            if rects is None:
+                full = True
+            elif rects:
+                pg.display.update(rects)
+
+        if full:
+            if self.state == 'MENU':
+                self.menu.draw(self.screen)
+            elif self.state == 'SETTINGS':
+                self.settings.draw(self.screen)
+            elif self.state == 'GAME' and self.session:
+                self.session.draw()
+            pg.display.flip()
+            self.full_redraw = False
+
+    def finish_startup_profile(self):
+        """Records the first presented frame; a --profile-startup run writes its report and exits."""
+        profiler.phases['first_frame'] = round((time.perf_counter() - self.constructed_at) * 1000.0, 3)
+        if profiler.enabled:
+            profiler.write({"assets": self.asset_manager.timings})
+            self.running = False
+
     def run(self):
         while self.running:
-            events = pg.event.get()
+            active = self.pacer.is_active(self.is_animating())
+            events = self.pacer.get_events(active)
             for e in events:
                 if e.type == pg.QUIT: self.running = False
+            self.asset_manager.poll()
+            # MUSIC_END only wakes the loop so the next track starts on time
+            self.audio.music.update()
+            events = [e for e in events if e.type != MUSIC_END]
             
             if self.state == 'MENU':
                 for e in events: self.menu.update(e)
-                self.menu.draw(self.screen)
             elif self.state == 'SETTINGS':
                 for e in events: self.settings.update(e)
-                self.settings.draw(self.screen)
             elif self.state == 'GAME' and self.session:
                 self.session.update(events)
-                if self.session: self.session.draw()
 
-            pg.display.flip()
-            self.clock.tick(self.global_settings.get("max_fps", 60))
+            self.render(events)
+            if 'first_frame' not in profiler.phases:
+                self.finish_startup_profile()
+            self.pacer.end_frame(active, self.global_settings.get("max_fps", 60))
         
+        s = self.pacer.stats()
+        print(f"[PACING] active frames: {s['frames']}, p50 {s['p50_ms']:.2f}ms, "
+              f"p99 {s['p99_ms']:.2f}ms, missed {s['missed']}, idle waits {s['idle_waits']}")
+        a = self.audio.stats()
+        print(f"[AUDIO] sfx played: {a['played']}, rate limited {a['limited']}, "
+              f"stolen {a['stolen']}, dropped {a['dropped']}")
+        self.data_manager.flush()
+        self.asset_manager.shutdown()
+        self.audio.music.shutdown()
         pg.quit()
         sys.exit()
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+Preprocessed asset cache: decoded images as raw RGBA and short sounds as PCM
+in the mixer's output format, keyed by the SHA-1 of the source file.
+A cache hit is memory-mapped straight into pg.image.frombuffer /
+pg.mixer.Sound(buffer=...), skipping PNG/SVG and Ogg decoding.
+
+Misses are filled at runtime. To build the whole cache ahead of time:
+
+    python -m src.core.asset_cache
+"""
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import pygame as pg
+from src.constants import ASSET_CACHE_DIR, ASSET_CACHE_ENABLED
+
+IMAGE_HEADER = struct.Struct('<4sII')     # magic, width, height
+SOUND_HEADER = struct.Struct('<4siii')    # magic, frequency, format, channels
+IMAGE_MAGIC = b'RGBA'
+SOUND_MAGIC = b'PCM0'
+
+def source_hash(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def cache_path(kind, digest):
+    if kind == 'sound':
+        # PCM is only valid for the mixer format it was produced in
+        freq, fmt, channels = pg.mixer.get_init()
+        return os.path.join(ASSET_CACHE_DIR, f"{digest}_{freq}_{fmt}_{channels}.pcm")
+    return os.path.join(ASSET_CACHE_DIR, f"{digest}.rgba")
+
+def _write_atomic(path, header, payload):
+    os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+def _map(path):
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _read_image(path):
+    mm = _map(path)
+    magic, w, h = IMAGE_HEADER.unpack_from(mm)
+    if magic != IMAGE_MAGIC or len(mm) != IMAGE_HEADER.size + w * h * 4:
+        mm.close()
+        raise ValueError("bad image cache")
+    # The surface keeps the mapping alive until it is converted and dropped
+    return pg.image.frombuffer(memoryview(mm)[IMAGE_HEADER.size:], (w, h), 'RGBA')
+
+def _read_sound(path):
+    with _map(path) as mm:
+        magic, *fmt = SOUND_HEADER.unpack_from(mm)
+        if magic != SOUND_MAGIC or tuple(fmt) != pg.mixer.get_init():
+            raise ValueError("bad sound cache")
+        view = memoryview(mm)[SOUND_HEADER.size:]
+        try:
+            return pg.mixer.Sound(buffer=view)
+        finally:
+            view.release()
+
+def load_cached(kind, path):
+    """
+    Decodes an image or sound file, through the cache when enabled.
+    Safe to call from worker threads (no display access).
+    """
+    if not ASSET_CACHE_ENABLED:
+        return pg.mixer.Sound(path) if kind == 'sound' else pg.image.load(path)
+
+    cached = cache_path(kind, source_hash(path))
+    if os.path.exists(cached):
+        try:
+            return _read_sound(cached) if kind == 'sound' else _read_image(cached)
+        except (ValueError, OSError, struct.error, pg.error) as e:
+            print(f"[ASSETS] Ignoring cache {os.path.basename(cached)}: {e}")
+
+    if kind == 'sound':
+        data = pg.mixer.Sound(path)
+        header = SOUND_HEADER.pack(SOUND_MAGIC, *pg.mixer.get_init())
+        payload = data.get_raw()
+    else:
+        data = pg.image.load(path)
+        header = IMAGE_HEADER.pack(IMAGE_MAGIC, *data.get_size())
+        payload = pg.image.tobytes(data, 'RGBA')
+    try:
+        _write_atomic(cached, header, payload)
+    except OSError as e:
+        print(f"[ASSETS] Could not cache {os.path.basename(path)}: {e}")
+    return data
+
+def build_all():
+    """Fills the cache for every scene manifest. Returns the number of assets processed."""
+    from src.core.assets import SCENE_MANIFESTS, _asset_file
+    count = 0
+    for scene, manifest in SCENE_MANIFESTS.items():
+        for kind, key, filename, _ in manifest:
+            path = _asset_file(kind, filename)
+            if os.path.exists(path):
+                load_cached(kind, path)
+                count += 1
+        print(f"[ASSETS] Cached scene '{scene}'")
+    return count
+
+def main():
+    # Building needs no window or sound card; PCM is produced in the default mixer format
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pg.init()
+    pg.mixer.init()
+    print(f"[ASSETS] {build_all()} assets cached in {ASSET_CACHE_DIR}")
+    pg.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
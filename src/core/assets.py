@@ -1,6 +1,12 @@
 import pygame as pg
 import os
-from src.constants import ASSETS_DIR
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from src.constants import (ASSETS_DIR, CAR_SHEET_COLS, CAR_SHEET_ROWS, SPRITE_CACHE_BYTES, ROTATION_BANK_FRAMES,
+                           ASSET_WORKERS, ASSET_CONVERT_BUDGET_MS)
+from src.core.asset_cache import load_cached
 
 def get_asset_path(category, filename):
     """Helper to construct path to assets subfolders."""
@@ -30,96 +36,303 @@ def load_sound(filename):
         print(f"[ASSETS] Error loading sound {filename}: {e}")
         return None
 
-def get_car_sprite(assets, car_id):
+def car_model_id(car_id):
     """
-    Extracts a specific car sprite from the 6x3 tilemap based on car_id string (e.g., 'car_5').
-    Robust: handles car_id being a dict (object) or a string.
+    Normalises a car reference to its model id string ('car_5').
+    Robust: handles car_id being a dict (garage entry) or a string.
     Checks for 'model_id' first, then 'name'.
     """
-    if 'cars' not in assets or not assets['cars']:
-        return None
-    
-    if not car_id:
-        return None
-
-    # FIX: Handle case where car_id is passed as a full dictionary object
     if isinstance(car_id, dict):
         car_id = car_id.get('model_id') or car_id.get('name', '')
-        
-    if not isinstance(car_id, str):
-        return None
+    return car_id if isinstance(car_id, str) else None
 
-    try:
-        # Extract index from ID (e.g., "car_5" -> 5)
-        parts = car_id.split('_')
-        if len(parts) < 2:
+class SpriteAtlas:
+    """
+    Car sprites sliced once from the 6x3 tilemap, keyed by model id ('car_0'..'car_17').
+    Scaled/rotated variants are memoized in an LRU bounded by SPRITE_CACHE_BYTES,
+    so menus and the race view blit ready-made surfaces instead of transforming per frame.
+    """
+    def __init__(self, sheet, cols=CAR_SHEET_COLS, rows=CAR_SHEET_ROWS, max_bytes=SPRITE_CACHE_BYTES):
+        self.tiles = {}
+        sheet_w, sheet_h = sheet.get_size()
+        tile_w, tile_h = sheet_w // cols, sheet_h // rows
+        for index in range(cols * rows):
+            row, col = divmod(index, cols)
+            rect = pg.Rect(col * tile_w, row * tile_h, tile_w, tile_h)
+            self.tiles[f"car_{index}"] = sheet.subsurface(rect)
+
+        self.max_bytes = max_bytes
+        self.cache = OrderedDict()
+        self.cache_bytes = 0
+
+        # Rotation banks: (model, size, frames) -> RotationBank, built off the main thread
+        self.banks = {}
+        self.pending_banks = set()
+        self.bank_builder = None
+        # Set on shutdown; a bank build in progress stops at its next frame
+        self.closing = threading.Event()
+
+    def tile(self, car_id):
+        """Unscaled sprite for car_id, or None if the id is not on the sheet."""
+        return self.tiles.get(car_model_id(car_id))
+
+    def get(self, car_id, size=None, angle=0):
+        """Sprite for car_id scaled to size (w, h) and rotated counter-clockwise by angle degrees."""
+        model = car_model_id(car_id)
+        base = self.tiles.get(model)
+        if base is None:
             return None
-        index = int(parts[1])
-    except (IndexError, ValueError):
-        print(f"[ASSETS] Invalid car ID format: {car_id}")
-        return None
+        angle = int(round(angle)) % 360
+        if size is None and angle == 0:
+            return base
+
+        key = (model, tuple(size) if size else None, angle)
+        surf = self.cache.get(key)
+        if surf is not None:
+            self.cache.move_to_end(key)
+            return surf
+
+        surf = pg.transform.scale(base, size) if size else base
+        if angle:
+            surf = pg.transform.rotate(surf, angle)
+        self._store(key, surf)
+        return surf
+
+    def bank(self, car_id, size, frames):
+        """
+        Pre-rotated bank for car_id at size, or None while it is still being built.
+        The first request schedules the build on a background thread.
+        """
+        model = car_model_id(car_id)
+        key = (model, tuple(size), frames)
+        bank = self.banks.get(key)
+        if bank is None and key not in self.pending_banks and model in self.tiles:
+            if self.bank_builder is None:
+                self.bank_builder = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sprite-bank')
+            self.pending_banks.add(key)
+            self.bank_builder.submit(self._build_bank, key)
+        return bank
+
+    def shutdown(self):
+        """Cancels queued bank builds and stops the one in progress."""
+        self.closing.set()
+        if self.bank_builder is not None:
+            self.bank_builder.shutdown(wait=False, cancel_futures=True)
+
+    def _build_bank(self, key):
+        model, size, frames = key
+        try:
+            base = pg.transform.scale(self.tiles[model], size)
+            bank = RotationBank(base, frames, self.closing)
+            if not self.closing.is_set():
+                self.banks[key] = bank
+        except pg.error as e:
+            print(f"[ASSETS] Error building rotation bank for {model}: {e}")
+        finally:
+            self.pending_banks.discard(key)
+
+    def _store(self, key, surf):
+        self.cache[key] = surf
+        self.cache_bytes += surf.get_width() * surf.get_height() * surf.get_bytesize()
+        while self.cache_bytes > self.max_bytes and len(self.cache) > 1:
+            _, old = self.cache.popitem(last=False)
+            self.cache_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+
+class RotationBank:
+    """
+    N pre-rotated frames of one sprite with collision masks and centre offsets.
+    Drawing a car at any heading becomes a table lookup instead of pg.transform.rotate.
+    """
+    def __init__(self, sprite, frames, cancel=None):
+        self.frames = frames
+        self.step = 360.0 / frames
+        self.surfaces = []
+        self.masks = []
+        self.offsets = []   # Top-left relative to the sprite centre
+        for i in range(frames):
+            if cancel is not None and cancel.is_set():
+                break  # Incomplete; the caller discards it
+            surf = pg.transform.rotate(sprite, i * self.step)
+            rect = surf.get_rect(center=(0, 0))
+            self.surfaces.append(surf)
+            self.masks.append(pg.mask.from_surface(surf))
+            self.offsets.append(rect.topleft)
+
+    def index(self, angle):
+        """Frame index nearest to angle (degrees, counter-clockwise)."""
+        return int(round(angle / self.step)) % self.frames
 
-    sheet = assets['cars']
-    sheet_w, sheet_h = sheet.get_size()
-    
-    # Grid configuration: 6 columns, 3 rows
-    cols = 6
-    rows = 3
-    
-    tile_w = sheet_w // cols
-    tile_h = sheet_h // rows
-    
-    # Calculate position
-    row = index // cols
-    col = index % cols
-    
-    # Safety check
-    if row >= rows:
-        print(f"[ASSETS] Car index {index} out of bounds for sprite sheet.")
+    def blit(self, screen, angle, center):
+        i = self.index(angle)
+        ox, oy = self.offsets[i]
+        screen.blit(self.surfaces[i], (center[0] + ox, center[1] + oy))
+
+def bank_frames(quality):
+    """Rotation bank size for a LOW/MED/HIGH quality setting."""
+    return ROTATION_BANK_FRAMES.get(quality, ROTATION_BANK_FRAMES["HIGH"])
+
+def get_car_sprite(assets, car_id, size=None, angle=0):
+    """
+    Returns the sprite for car_id (e.g. 'car_5' or a garage entry dict) from the car atlas,
+    optionally scaled to size and rotated by angle degrees. None if unavailable.
+    """
+    atlas = assets.get('car_atlas')
+    if not atlas or not car_id:
         return None
-        
-    rect = pg.Rect(col * tile_w, row * tile_h, tile_w, tile_h)
-    return sheet.subsurface(rect)
+    sprite = atlas.get(car_id, size, angle)
+    if sprite is None:
+        print(f"[ASSETS] Invalid car ID: {car_id}")
+    return sprite
+
+# --- SCENE MANIFESTS ---
+SFX_FILES = {
+    'ui_select': 'JDSherbert - Ultimate UI SFX Pack - Select - 1.ogg',
+    'ui_click': 'JDSherbert - Ultimate UI SFX Pack - Select - 2.ogg',
+    'ui_cancel': 'JDSherbert - Ultimate UI SFX Pack - Cancel - 1.ogg',
+    'ui_back': 'JDSherbert - Ultimate UI SFX Pack - Cancel - 2.ogg',
+    'ui_hover': 'JDSherbert - Ultimate UI SFX Pack - Cursor - 1.ogg',
+    'ui_error': 'JDSherbert - Ultimate UI SFX Pack - Error - 1.ogg',
+    'ui_popup': 'JDSherbert - Ultimate UI SFX Pack - Popup Open - 1.ogg',
+    'ui_swipe': 'JDSherbert - Ultimate UI SFX Pack - Swipe - 1.ogg'
+}
+
+MUSIC_FILES = {
+    'main_theme': 'Track 1.ogg',
+    'race_theme': 'Track 2.ogg',
+    'garage_theme': 'Track 3.ogg'
+}
+
+# Assets each scene needs before it can be shown: (kind, key, file, alpha).
+# 'image' lands in assets[key], 'map' in assets['maps'], 'sound' in assets['sfx'][key].
+SCENE_MANIFESTS = {
+    'menu': [('image', 'cars', 'car-tilemap.png', True)] +
+            [('sound', key, filename, False) for key, filename in SFX_FILES.items()],
+    'race': [('map', 'map_0', os.path.join('maps', 'map_0.png'), False)]
+}
+
+def _asset_file(kind, filename):
+    if kind == 'sound':
+        return get_asset_path(os.path.join('sounds', 'sfx'), filename)
+    return get_asset_path('images', filename)
+
+def _decode_asset(kind, path):
+    """Worker-thread half of a load: file read and decode, no display access."""
+    t0 = time.perf_counter()
+    data = load_cached(kind, path)
+    return data, (time.perf_counter() - t0) * 1000.0
+
+class AssetManager:
+    """
+    Loads scene manifests on demand.
+    Files are decoded on a thread pool; finished decodes are handed back to the
+    main thread by poll(), which does the display-bound convert()/convert_alpha()
+    within a per-call time budget. Per-asset decode and convert times are kept in timings.
+    """
+    def __init__(self, workers=ASSET_WORKERS):
+        music_dir = os.path.join(ASSETS_DIR, 'sounds', 'music')
+        self.assets = {
+            'sfx': {},
+            'maps': [],
+            'music': {key: os.path.join(music_dir, f) for key, f in MUSIC_FILES.items()}
+        }
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='AssetLoad')
+        self.pending = {}   # future -> manifest entry
+        self.done = set()   # (kind, key) finished or failed
+        self.timings = {}   # key -> {"kind", "file", "decode_ms", "convert_ms"}
+
+    @property
+    def busy(self):
+        return bool(self.pending)
+
+    def request(self, scene):
+        """Queues every not-yet-loaded asset of scene for background decoding."""
+        queued = {(e[0], e[1]) for e in self.pending.values()}
+        for entry in SCENE_MANIFESTS.get(scene, []):
+            kind, key, filename, _ = entry
+            if (kind, key) in self.done or (kind, key) in queued:
+                continue
+            path = _asset_file(kind, filename)
+            if not os.path.exists(path):
+                print(f"[ASSETS] ERROR: File not found: {path}")
+                self.done.add((kind, key))
+                continue
+            self.pending[self.pool.submit(_decode_asset, kind, path)] = entry
+
+    def progress(self, scene):
+        """(loaded, total) for scene."""
+        manifest = SCENE_MANIFESTS.get(scene, [])
+        return sum((e[0], e[1]) in self.done for e in manifest), len(manifest)
+
+    def is_ready(self, scene):
+        loaded, total = self.progress(scene)
+        return loaded == total
+
+    def poll(self, budget_ms=ASSET_CONVERT_BUDGET_MS):
+        """Finishes decoded assets on the main thread until budget_ms is spent."""
+        t0 = time.perf_counter()
+        for future in [f for f in self.pending if f.done()]:
+            entry = self.pending.pop(future)
+            self._finish(entry, future)
+            if (time.perf_counter() - t0) * 1000.0 >= budget_ms:
+                break
+
+    def _finish(self, entry, future):
+        kind, key, filename, alpha = entry
+        self.done.add((kind, key))
+        try:
+            data, decode_ms = future.result()
+        except (pg.error, OSError) as e:
+            print(f"[ASSETS] Error loading {filename}: {e}")
+            return
+        t0 = time.perf_counter()
+        if kind == 'sound':
+            self.assets['sfx'][key] = data
+        else:
+            surf = data.convert_alpha() if alpha else data.convert()
+            if kind == 'map':
+                self.assets['maps'].append(surf)
+            else:
+                self.assets[key] = surf
+            if key == 'cars':
+                self.assets['car_atlas'] = SpriteAtlas(surf)
+        self.timings[key] = {"kind": kind, "file": filename, "decode_ms": round(decode_ms, 3),
+                             "convert_ms": round((time.perf_counter() - t0) * 1000.0, 3)}
+
+    def load_scene(self, scene, on_progress=None):
+        """
+        Blocks until scene is loaded, calling on_progress(loaded, total) between
+        polls so the caller can draw a loading screen.
+        """
+        t0 = time.perf_counter()
+        self.request(scene)
+        while not self.is_ready(scene):
+            self.poll()
+            if on_progress:
+                on_progress(*self.progress(scene))
+            time.sleep(0.001)
+        self.report(scene, (time.perf_counter() - t0) * 1000.0)
+
+    def report(self, scene, wall_ms):
+        keys = [e[1] for e in SCENE_MANIFESTS.get(scene, []) if e[1] in self.timings]
+        decode = sum(self.timings[k]["decode_ms"] for k in keys)
+        convert = sum(self.timings[k]["convert_ms"] for k in keys)
+        print(f"[ASSETS] Scene '{scene}': {len(keys)} assets in {wall_ms:.1f}ms "
+              f"(decode {decode:.1f}ms on workers, convert {convert:.1f}ms)")
+        slowest = sorted(keys, key=lambda k: -self.timings[k]["decode_ms"])[:3]
+        for k in slowest:
+            t = self.timings[k]
+            print(f"[ASSETS]   {t['file']}: decode {t['decode_ms']:.1f}ms, convert {t['convert_ms']:.1f}ms")
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        atlas = self.assets.get('car_atlas')
+        if atlas:
+            atlas.shutdown()
 
 def load_game_assets():
-    """Loads all game resources including images and sounds."""
-    assets = {}
-    print("[ASSETS] Loading resources...")
-    
-    # --- IMAGES ---
-    assets['cars'] = load_image('car-tilemap.png', alpha=True)
-    
-    map_path = os.path.join('maps', 'map_0.png')
-    map_img = load_image(map_path, alpha=False)
-    assets['maps'] = []
-    if map_img:
-        assets['maps'].append(map_img)
-        
-    # --- AUDIO (SFX) ---
-    sfx_map = {
-        'ui_select': 'JDSherbert - Ultimate UI SFX Pack - Select - 1.ogg',
-        'ui_click': 'JDSherbert - Ultimate UI SFX Pack - Select - 2.ogg',
-        'ui_cancel': 'JDSherbert - Ultimate UI SFX Pack - Cancel - 1.ogg',
-        'ui_back': 'JDSherbert - Ultimate UI SFX Pack - Cancel - 2.ogg',
-        'ui_hover': 'JDSherbert - Ultimate UI SFX Pack - Cursor - 1.ogg',
-        'ui_error': 'JDSherbert - Ultimate UI SFX Pack - Error - 1.ogg',
-        'ui_popup': 'JDSherbert - Ultimate UI SFX Pack - Popup Open - 1.ogg',
-        'ui_swipe': 'JDSherbert - Ultimate UI SFX Pack - Swipe - 1.ogg'
-    }
-    
-    assets['sfx'] = {}
-    for key, filename in sfx_map.items():
-        snd = load_sound(filename)
-        if snd:
-            assets['sfx'][key] = snd
-            
-    # --- MUSIC ---
-    music_dir = os.path.join(ASSETS_DIR, 'sounds', 'music')
-    assets['music'] = {
-        'main_theme': os.path.join(music_dir, 'Track 1.ogg'),
-        'race_theme': os.path.join(music_dir, 'Track 2.ogg'),
-        'garage_theme': os.path.join(music_dir, 'Track 3.ogg')
-    }
-
-    print(f"[ASSETS] Loaded. SFX count: {len(assets['sfx'])}")
-    return assets
\ No newline at end of file
+    """Loads every scene synchronously; for tools that need all resources up front."""
+    manager = AssetManager()
+    for scene in SCENE_MANIFESTS:
+        manager.load_scene(scene)
+    manager.shutdown()
+    return manager.assets
@@ -1,9 +1,63 @@
 import pygame as pg
+from src.constants import AUDIO_GROUPS, SFX_MIN_INTERVAL_MS, SFX_PROFILES
+from src.core.music import MusicController
+
+class ChannelGroup:
+    """
+    A fixed block of reserved mixer channels (e.g. all UI sounds).
+    A new sound takes an idle channel; when all are busy it steals the voice
+    with the lowest priority (oldest first) if that is not above its own,
+    otherwise it is dropped. Volume is set on the channels, once per change.
+    """
+    def __init__(self, name, first, count):
+        self.name = name
+        self.channels = [pg.mixer.Channel(i) for i in range(first, first + count)]
+        # Per channel: (priority, start ms) of the voice last started on it
+        self.voices = [(0, 0)] * count
+        self.volume = 1.0
+        self.stolen = 0
+        self.dropped = 0
+
+    def set_volume(self, volume):
+        self.volume = volume
+        for channel in self.channels:
+            channel.set_volume(volume)
+
+    def acquire(self, priority):
+        """Index of the channel a new voice of this priority should use, or None."""
+        victim = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+            if self.voices[i][0] <= priority and (victim is None or self.voices[i] < self.voices[victim]):
+                victim = i
+        if victim is None:
+            self.dropped += 1
+        else:
+            self.stolen += 1
+        return victim
+
+    def play(self, sound, priority=0, loops=0, now=None):
+        """Starts sound on a free or stolen channel; returns the channel or None."""
+        i = self.acquire(priority)
+        if i is None:
+            return None
+        self.voices[i] = (priority, pg.time.get_ticks() if now is None else now)
+        # Channel.play cuts off whatever the channel was playing
+        self.channels[i].play(sound, loops=loops)
+        return self.channels[i]
+
+    def stop(self):
+        for channel in self.channels:
+            channel.stop()
 
 class AudioManager:
     """
     Handles music streaming and SFX playback.
     Integrates with global settings for volume control.
+    SFX go through reserved channel groups (see AUDIO_GROUPS and SFX_PROFILES),
+    so bursts of UI sounds are rate limited per sound and can never take the
+    channels of engines or stingers.
     Credits: SFX by JDSherbert.
     """
     def __init__(self, app):
@@ -11,60 +65,86 @@ class AudioManager:
         self.assets = app.assets
         self.music_volume = 0.5
         self.sfx_volume = 0.5
-        
+
+        # --- CHANNEL GROUPS ---
+        reserved = sum(count for _, count in AUDIO_GROUPS)
+        # Groups come first; stray Sound.play() calls keep the mixer's default channels after them
+        pg.mixer.set_num_channels(reserved + pg.mixer.get_num_channels())
+        pg.mixer.set_reserved(reserved)
+        self.groups = {}
+        first = 0
+        for name, count in AUDIO_GROUPS:
+            self.groups[name] = ChannelGroup(name, first, count)
+            first += count
+        # Sound key -> ticks of its last start, for rate limiting
+        self.last_played = {}
+        self.played = 0
+        self.limited = 0
+
+        # Validates the playlist and starts reading every track off-thread
+        self.music = MusicController(self.assets['music'])
+
         # Load initial volume from settings
         self.load_volume_settings()
-        
-        # Current track tracking
-        self.current_music = None
 
     def load_volume_settings(self):
         """Updates internal volume variables from global settings."""
         settings = self.app.global_settings
         self.music_volume = settings.get("vol_music", 50) / 100.0
         self.sfx_volume = settings.get("vol_sfx", 50) / 100.0
-        
+
         # Apply immediately
-        pg.mixer.music.set_volume(self.music_volume)
-        
+        self.music.set_volume(self.music_volume)
+        self.apply_sfx_volume()
+
+    def apply_sfx_volume(self):
+        for group in self.groups.values():
+            group.set_volume(self.sfx_volume)
+
     def play_music(self, track_key):
-        """Streams music from disk."""
-        path = self.assets['music'].get(track_key)
-        if not path:
-            print(f"[AUDIO] Music track not found: {track_key}")
-            return
-
-        if self.current_music == track_key and pg.mixer.music.get_busy():
-            return # Already playing this track
-
-        try:
-            pg.mixer.music.load(path)
-            pg.mixer.music.play(-1) # Loop indefinitely
-            pg.mixer.music.set_volume(self.music_volume)
-            self.current_music = track_key
-            print(f"[AUDIO] Playing music: {track_key}")
-        except Exception as e:
-            print(f"[AUDIO] Error playing music: {e}")
-
-    def play_sfx(self, sfx_key):
-        """Plays a sound effect if loaded."""
+        """Crossfades to a track (see MusicController); never blocks on file I/O."""
+        self.music.play(track_key)
+
+    def play_sfx(self, sfx_key, group=None, priority=None):
+        """
+        Plays a sound effect if loaded, on its group's channels (see SFX_PROFILES).
+        Repeats of the same sound inside its minimum interval are skipped.
+        Returns the channel, or None if the sound was missing, limited or dropped.
+        """
         sound = self.assets['sfx'].get(sfx_key)
-        if sound:
-            sound.set_volume(self.sfx_volume)
-            sound.play()
-        else:
-            # Silent fail or debug print
-            pass
+        if not sound:
+            return None
+        profile_group, profile_priority, interval = SFX_PROFILES.get(sfx_key, ('ui', 1, SFX_MIN_INTERVAL_MS))
+        now = pg.time.get_ticks()
+        last = self.last_played.get(sfx_key)
+        if last is not None and now - last < interval:
+            self.limited += 1
+            return None
+        channel = self.groups[group or profile_group].play(
+            sound, profile_priority if priority is None else priority, now=now)
+        if channel:
+            self.last_played[sfx_key] = now
+            self.played += 1
+        return channel
+
+    def stats(self):
+        return {
+            "played": self.played,
+            "limited": self.limited,
+            "stolen": sum(g.stolen for g in self.groups.values()),
+            "dropped": sum(g.dropped for g in self.groups.values())
+        }
 
     def set_music_volume(self, percent):
         """Sets music volume (0-100) and saves to settings."""
         self.app.global_settings["vol_music"] = percent
         self.music_volume = percent / 100.0
-        pg.mixer.music.set_volume(self.music_volume)
+        self.music.set_volume(self.music_volume)
         self.app.data_manager.save_global_settings(self.app.global_settings)
 
     def set_sfx_volume(self, percent):
         """Sets SFX volume (0-100) and saves to settings."""
         self.app.global_settings["vol_sfx"] = percent
         self.sfx_volume = percent / 100.0
-        self.app.data_manager.save_global_settings(self.app.global_settings)
\ No newline at end of file
+        self.apply_sfx_volume()
+        self.app.data_manager.save_global_settings(self.app.global_settings)
@@ -1,14 +1,88 @@
 import os
+import copy
 import json
 import shutil
-from src.constants import DATA_DIR
+import threading
+from src.constants import DATA_DIR, SAVE_FORMAT
+from src.core.savefile import SaveFile, SaveState, write_save_file
+
+class SaveWriter:
+    """
+    Background JSON writer. Saves are queued per path, so repeated saves of the
+    same file before the thread gets to it collapse into one write of the latest
+    data. Each file is written to a temp file, fsynced and swapped in with
+    os.replace, so a crash leaves either the old or the new file, never half of one.
+    """
+    def __init__(self):
+        self.pending = {}       # path -> latest snapshot, insertion-ordered
+        self.in_flight = None   # path currently being written
+        self.cond = threading.Condition()
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name='SaveWriter', daemon=True)
+        self.thread.start()
+
+    def submit(self, path, data, write=None):
+        """Queues a snapshot of data to be saved by write(path, data); returns immediately."""
+        write = write or write_json_atomic
+        snapshot = copy.deepcopy(data)
+        with self.cond:
+            if self.closed:
+                return write(path, snapshot)
+            self.pending.pop(path, None)
+            self.pending[path] = (write, snapshot)
+            self.cond.notify_all()
+        return True
+
+    def wait(self, path=None):
+        """Blocks until path (or every queued file, if None) is on disk."""
+        with self.cond:
+            while (path in self.pending or self.in_flight == path) if path else (self.pending or self.in_flight):
+                self.cond.wait()
+
+    def close(self):
+        """Writes out everything still queued and stops the thread."""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        self.thread.join()
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while not self.pending and not self.closed:
+                    self.cond.wait()
+                if not self.pending:
+                    return
+                path = next(iter(self.pending))
+                write, data = self.pending.pop(path)
+                self.in_flight = path
+            write(path, data)
+            with self.cond:
+                self.in_flight = None
+                self.cond.notify_all()
+
+def write_json_atomic(path, data):
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return True
+    except Exception as e:
+        print(f"[DATA] Error saving {path}: {e}")
+        return False
 
 class DataManager:
     def __init__(self):
         self.data_dir = DATA_DIR
         self.saves_dir = os.path.join(self.data_dir, 'saves')
         self.template_dir = os.path.join(self.saves_dir, 'template')
+        self.tracks_dir = os.path.join(self.data_dir, 'tracks')
         self.global_settings_path = os.path.join(self.data_dir, 'settings.json')
+        self.writer = SaveWriter()
+        self.save_format = SAVE_FORMAT
         
         # Ensure directories exist
         if not os.path.exists(self.saves_dir):
@@ -18,10 +92,14 @@ class DataManager:
         """Returns dict {1: bool, ...} indicating if save exists."""
         status = {}
         for i in range(1, 4):
-            save_path = os.path.join(self.saves_dir, f'save_{i}', 'player_state.json')
-            status[i] = os.path.exists(save_path)
+            status[i] = any(os.path.exists(p) for p in self._player_state_paths(i))
         return status
 
+    def _player_state_paths(self, slot_id):
+        """(json path, binary path) of a slot's player state."""
+        base = os.path.join(self.saves_dir, f'save_{slot_id}', 'player_state')
+        return base + '.json', base + '.bin'
+
     def create_new_save(self, slot_id):
         target_dir = os.path.join(self.saves_dir, f'save_{slot_id}')
         if not os.path.exists(target_dir):
@@ -42,13 +120,38 @@ class DataManager:
         path = os.path.join(self.template_dir, 'game_data.json')
         return self._load_json(path)
 
-    def load_player_state(self, slot_id):
-        path = os.path.join(self.saves_dir, f'save_{slot_id}', 'player_state.json')
+    def load_track(self, track_id):
+        """Loads a track layout (spawn point, waypoints) from data/tracks."""
+        path = os.path.join(self.tracks_dir, f'{track_id}.json')
         return self._load_json(path)
 
+    def load_player_state(self, slot_id):
+        """
+        Binary saves come back as a lazily parsed SaveState, JSON saves as a dict.
+        With save_format 'bin', a JSON-only slot is migrated on first load and
+        the original kept as player_state.json.bak.
+        """
+        json_path, bin_path = self._player_state_paths(slot_id)
+        self.writer.wait(bin_path)
+        if os.path.exists(bin_path):
+            try:
+                return SaveState(SaveFile(bin_path))
+            except (OSError, ValueError) as e:
+                print(f"[DATA] Error loading {bin_path}: {e}")
+                if not os.path.exists(json_path):
+                    return {}
+
+        data = self._load_json(json_path)
+        if data and self.save_format == 'bin' and write_save_file(bin_path, data):
+            os.replace(json_path, json_path + '.bak')
+            print(f"[DATA] Migrated Slot {slot_id} to binary save")
+        return data
+
     def save_player_state(self, slot_id, data):
-        path = os.path.join(self.saves_dir, f'save_{slot_id}', 'player_state.json')
-        return self._save_json(path, data)
+        json_path, bin_path = self._player_state_paths(slot_id)
+        if self.save_format == 'bin' or os.path.exists(bin_path):
+            return self.writer.submit(bin_path, data, write_save_file)
+        return self._save_json(json_path, data)
 
     def load_global_settings(self):
         default_settings = {
@@ -58,7 +161,8 @@ class DataManager:
             "quality": "HIGH",
             "language": "en",
             "vol_music": 50, # NEW
-            "vol_sfx": 50    # NEW
+            "vol_sfx": 50,   # NEW
+            "save_format": SAVE_FORMAT
         }
         
         if not os.path.exists(self.global_settings_path):
@@ -69,23 +173,19 @@ class DataManager:
         for key, val in default_settings.items():
             if key not in data:
                 data[key] = val
-        return data
-        
-        if not os.path.exists(self.global_settings_path):
-            self._save_json(self.global_settings_path, default_settings)
-            return default_settings
-        
-        data = self._load_json(self.global_settings_path)
-        # Merge defaults
-        for key, val in default_settings.items():
-            if key not in data:
-                data[key] = val
+        self.save_format = data["save_format"]
         return data
 
     def save_global_settings(self, data):
         return self._save_json(self.global_settings_path, data)
 
+    def flush(self):
+        """Blocks until every queued save is on disk and stops the writer."""
+        self.writer.close()
+
     def _load_json(self, path):
+        # A save of this file may still be queued
+        self.writer.wait(path)
         try:
             with open(path, mode='r', encoding='utf-8') as f:
                 return json.load(f)
@@ -94,10 +194,5 @@ class DataManager:
             return {}
 
     def _save_json(self, path, data):
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
-            return True
-        except Exception as e:
-            print(f"[DATA] Error saving {path}: {e}")
-            return False
\ No newline at end of file
+        """Queues an asynchronous save; see SaveWriter."""
+        return self.writer.submit(path, data)
\ No newline at end of file
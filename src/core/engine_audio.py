@@ -0,0 +1,168 @@
+import math
+import numpy as np
+import pygame as pg
+from src.constants import *
+
+# Engine loops of the current mixer, one per pitch step, see engine_loops()
+_loops = None
+
+# Traffic moves at most this fast (map px/s)
+TRAFFIC_TOP_SPEED = CA_VMAX * CA_CELL_PX / CA_STEP_S
+PCM_TYPES = {-16: (np.int16, 0, 32767), 16: (np.uint16, 32768, 32767),
+             -8: (np.int8, 0, 127), 8: (np.uint8, 128, 127), 32: (np.float32, 0, 1.0)}
+
+def build_engine_loop(hz):
+    """
+    Procedural engine loop at firing frequency hz: a whole number of periods
+    of a decaying pulse plus harmonics, so it repeats without a seam.
+    Returns a Sound in the mixer's format, or None if the format is unsupported.
+    """
+    freq, fmt, channels = pg.mixer.get_init()
+    if fmt not in PCM_TYPES:
+        return None
+    dtype, offset, scale = PCM_TYPES[fmt]
+    period = max(2, round(freq / hz))
+    t = np.arange(period) / period
+    wave = np.exp(-t * 7.0) - (1 - math.exp(-7.0)) / 7.0
+    for harmonic, amp in ((1, 0.5), (2, 0.3), (3, 0.2), (5, 0.1)):
+        wave += amp * np.sin(2 * np.pi * harmonic * t)
+    wave = np.tile(wave / np.abs(wave).max() * 0.6, max(1, round(0.2 * freq / period)))
+    pcm = (wave * scale + offset).astype(dtype)
+    return pg.mixer.Sound(buffer=np.repeat(pcm[:, None], channels, axis=1).tobytes())
+
+def engine_loops():
+    """ENGINE_PITCHES loops from idle to redline, built once per process."""
+    global _loops
+    if _loops is None:
+        lo, hi = ENGINE_PITCH_RANGE
+        steps = np.linspace(lo, hi, ENGINE_PITCHES)
+        _loops = [build_engine_loop(ENGINE_BASE_HZ * p) for p in steps]
+        if None in _loops:
+            print(f"[AUDIO] Engine audio disabled: mixer format {pg.mixer.get_init()[1]} unsupported")
+            _loops = []
+    return _loops
+
+def engine_rpm(speed, top_speed):
+    """0..1 engine speed through ENGINE_GEARS gears; drops at each shift."""
+    ratio = np.clip(speed / np.maximum(top_speed, 1.0), 0.0, 1.0)
+    gear = ratio * ENGINE_GEARS
+    return np.where(ratio >= 1.0, 1.0, 0.2 + 0.8 * (gear - np.floor(gear)))
+
+class SpatialHash:
+    """
+    Uniform grid over map positions. Points are sorted by cell once per build;
+    a radius query then only binary-searches the cell columns it overlaps,
+    so its cost depends on local density, not on how many cars there are.
+    """
+    STRIDE = 1 << 20  # Key = column * STRIDE + row; rows must stay below this
+
+    def __init__(self, cell):
+        self.cell = cell
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.order = np.zeros(0, dtype=np.intp)
+
+    def build(self, pos):
+        cells = np.floor(pos / self.cell).astype(np.int64) + self.STRIDE // 2
+        keys = cells[:, 0] * self.STRIDE + cells[:, 1]
+        self.order = np.argsort(keys, kind='stable')
+        self.keys = keys[self.order]
+
+    def query(self, center, radius):
+        """Indices of points in the cells overlapping the square around center."""
+        (c0, r0), (c1, r1) = (np.floor((np.asarray(center) + d) / self.cell).astype(np.int64) + self.STRIDE // 2
+                              for d in (-radius, radius))
+        cols = np.arange(c0, c1 + 1) * self.STRIDE
+        lo = np.searchsorted(self.keys, cols + r0, 'left')
+        hi = np.searchsorted(self.keys, cols + r1, 'right')
+        if not len(lo):
+            return self.order[:0]
+        return np.concatenate([self.order[a:b] for a, b in zip(lo, hi)])
+
+class EngineAudio:
+    """
+    Race engine sound on the 'engines' channel group.
+    Each tick the loudest ENGINE_VOICES cars around the listener (the player's
+    car) are picked through a spatial hash. Each gets a channel looping the
+    engine variant nearest its RPM, panned and attenuated by its offset from
+    the listener. Cars keep their channel while they stay in the heard set.
+    A pitch change crossfades to the new loop on an idle channel, so loops are
+    never restarted mid-wave; spare channels cover the fades.
+    """
+    def __init__(self, audio):
+        self.group = audio.groups['engines']
+        self.loops = engine_loops()
+        self.voices = min(ENGINE_VOICES, len(self.group.channels))
+        self.hash = SpatialHash(ENGINE_HASH_CELL)
+        # Car key -> (channel index, pitch index); racers are 0..n-1, traffic follows
+        self.playing = {}
+
+    def sources(self, race):
+        """Positions, RPM and base gain of every engine on track."""
+        pos, _ = race.interpolated()
+        cars = race.cars
+        rpm = engine_rpm(cars.speed, cars.stats['top_speed'])
+        gain = np.ones(len(pos))
+        if race.traffic and race.traffic.count:
+            t_pos, _ = race.traffic.positions()
+            pos = np.concatenate([pos, t_pos])
+            rpm = np.concatenate([rpm, engine_rpm(race.traffic.speeds(), TRAFFIC_TOP_SPEED)])
+            gain = np.concatenate([gain, np.full(len(t_pos), ENGINE_TRAFFIC_GAIN)])
+        return pos, rpm, gain
+
+    def select(self, pos, rpm, gain, listener):
+        """(indices, gains) of the loudest cars within hearing range, at most self.voices."""
+        self.hash.build(pos)
+        near = self.hash.query(listener, ENGINE_HEAR_RADIUS)
+        d = np.hypot(*(pos[near] - listener).T)
+        heard = gain[near] / (1.0 + (d / ENGINE_REF_DIST) ** 2) * (d < ENGINE_HEAR_RADIUS)
+        loudness = heard * (0.5 + 0.5 * rpm[near])
+        if len(near) > self.voices:
+            top = np.argpartition(-loudness, self.voices)[:self.voices]
+        else:
+            top = np.arange(len(near))
+        top = top[heard[top] > 0]
+        return near[top], heard[top]
+
+    def update(self, race):
+        """Re-picks the heard cars and updates their pitch, pan and volume."""
+        if not self.loops or not race.count:
+            return
+        pos, rpm, gain = self.sources(race)
+        i = race.player_index
+        listener = pos[i] if i is not None else pos[:race.count].mean(axis=0)
+        chosen, heard = self.select(pos, rpm, gain, listener)
+
+        # Release channels of cars that dropped out of the heard set. A channel
+        # only counts as free once its fade-out has finished.
+        keys = set(chosen.tolist())
+        for key in [k for k in self.playing if k not in keys]:
+            self.group.channels[self.playing.pop(key)[0]].fadeout(ENGINE_FADE_MS)
+        used = {c for c, _ in self.playing.values()}
+        free = [c for c, channel in enumerate(self.group.channels) if c not in used and not channel.get_busy()]
+
+        master = self.group.volume
+        steps = len(self.loops) - 1
+        for key, g in zip(chosen.tolist(), heard.tolist()):
+            target = rpm[key] * steps
+            index, pitch = self.playing.get(key, (None, None))
+            if pitch is None or abs(target - pitch) > 0.5 + ENGINE_PITCH_HYSTERESIS:
+                if free:
+                    if index is not None:
+                        self.group.channels[index].fadeout(ENGINE_FADE_MS)
+                    index, pitch = free.pop(), int(round(target))
+                    self.group.channels[index].play(self.loops[pitch], loops=-1, fade_ms=ENGINE_FADE_MS)
+                elif index is None:
+                    # Heard next tick, once a fade has released its channel
+                    continue
+            self.playing[key] = (index, pitch)
+            channel = self.group.channels[index]
+            pan = max(-1.0, min(1.0, (pos[key][0] - listener[0]) / ENGINE_PAN_DIST))
+            v = master * g
+            channel.set_volume(v * min(1.0, 1.0 - pan), v * min(1.0, 1.0 + pan))
+
+    def stop(self):
+        """Silences every engine, fading ones included, and hands the channels back at the group volume."""
+        for channel in self.group.channels:
+            channel.stop()
+        self.playing.clear()
+        self.group.set_volume(self.group.volume)
@@ -0,0 +1,155 @@
+import pygame as pg
+from collections import OrderedDict
+from src.constants import FONT_FAMILY, TEXT_CACHE_SIZE, ATLAS_LINE_CACHE
+
+# Shared by every UI module: (family, size, bold) -> pg.font.Font
+_fonts = {}
+# (text, family, size, bold, colour) -> rendered Surface, least recently used first
+_text_cache = OrderedDict()
+# (family, size, bold, colour) -> GlyphAtlas
+_atlases = {}
+# Glyphs packed up front; anything else is rendered the first time it is drawn
+ATLAS_CHARSET = ''.join(chr(c) for c in range(32, 127))
+
+def get_font(size, bold=False, family=FONT_FAMILY):
+    """Returns a cached SysFont; the system font lookup happens once per key."""
+    key = (family, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = pg.font.SysFont(family, size, bold=bold)
+        _fonts[key] = font
+    return font
+
+def render_text(text, size, color, bold=False, family=FONT_FAMILY):
+    """
+    Returns an antialiased text surface, re-rendered only on a cache miss.
+    Callers must not draw onto the returned surface: it is shared.
+    """
+    key = (text, family, size, bold, tuple(color))
+    surf = _text_cache.get(key)
+    if surf is not None:
+        _text_cache.move_to_end(key)
+        return surf
+
+    surf = get_font(size, bold, family).render(text, True, color)
+    _text_cache[key] = surf
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surf
+
+def evict_text(changed):
+    """
+    Drops rendered text containing any of the changed strings (e.g. translations
+    replaced by a language switch); everything else stays cached.
+    """
+    changed = [s for s in changed if s]
+    if not changed:
+        return
+    stale = [key for key in _text_cache if any(s in key[0] for s in changed)]
+    for key in stale:
+        del _text_cache[key]
+
+def clear_text_cache():
+    """Drops all rendered text (e.g. after a language switch)."""
+    _text_cache.clear()
+
+
+class GlyphAtlas:
+    """
+    One font and colour rendered glyph by glyph into a single surface, for text
+    that changes every frame (timers, speeds, positions). Strings are composed
+    with one Surface.blits call over cached glyph rects, so drawing never
+    rasterises text or allocates surfaces.
+    The pen moves by the font's own spacing for each pair of characters
+    (font.size(a + b) - font.size(b): kerning and synthetic bold included),
+    measured once per pair, so layout matches font.render.
+    The last ATLAS_LINE_CACHE lines drawn keep their rect and blit list, so a
+    line repeated at the same spot (a position, an unchanged speed) is a
+    single blits call.
+    """
+    def __init__(self, font, color, charset=ATLAS_CHARSET):
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        # char -> (source surface or None for blanks, area or None, rendered width)
+        self.glyphs = {}
+        # (char, next char) -> pen advance in px
+        self.pairs = {}
+        # (text, pos, anchor) -> (rect, blit list), least recently used first
+        self.lines = OrderedDict()
+        rendered = [(ch, font.render(ch, True, color)) for ch in dict.fromkeys(charset)]
+        width = sum(s.get_width() for _, s in rendered)
+        self.surface = pg.Surface((max(1, width), self.height), pg.SRCALPHA)
+        areas = {}
+        x = 0
+        for ch, surf in rendered:
+            # MAX keeps the glyph's own alpha instead of blending it onto the empty atlas
+            self.surface.blit(surf, (x, 0), special_flags=pg.BLEND_RGBA_MAX)
+            areas[ch] = pg.Rect(x, 0, surf.get_width(), self.height)
+            x += surf.get_width()
+        if pg.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        for ch, area in areas.items():
+            # Spaces only move the pen
+            self.glyphs[ch] = (None if ch.isspace() else self.surface, area, area.width)
+
+    def glyph(self, ch):
+        g = self.glyphs.get(ch)
+        if g is None:
+            surf = self.font.render(ch, True, self.color)
+            g = self.glyphs[ch] = (None if ch.isspace() else surf, None, surf.get_width())
+        return g
+
+    def advance(self, a, b):
+        """Pen movement from a to the following b."""
+        adv = self.pairs.get((a, b))
+        if adv is None:
+            adv = self.pairs[(a, b)] = self.font.size(a + b)[0] - self.font.size(b)[0]
+        return adv
+
+    def layout(self, text):
+        """(glyphs, pen x of each glyph, total width) of text."""
+        glyphs = self.glyphs
+        try:
+            gs = [glyphs[ch] for ch in text]
+        except KeyError:
+            gs = [self.glyph(ch) for ch in text]
+        if not gs:
+            return gs, [], 0
+        pairs = self.pairs
+        xs = [0]
+        x = 0
+        for a, b in zip(text, text[1:]):
+            adv = pairs.get((a, b))
+            x += adv if adv is not None else self.advance(a, b)
+            xs.append(x)
+        return gs, xs, x + gs[-1][2]
+
+    def size(self, text):
+        return self.layout(text)[2], self.height
+
+    def draw(self, surface, text, pos, anchor='topleft'):
+        """Blits text with its anchor point at pos; returns the covered rect."""
+        key = (text, tuple(pos), anchor)
+        line = self.lines.get(key)
+        if line is not None:
+            self.lines.move_to_end(key)
+        else:
+            glyphs, xs, width = self.layout(text)
+            rect = pg.Rect(0, 0, width, self.height)
+            setattr(rect, anchor, pos)
+            left, y = rect.topleft
+            line = self.lines[key] = (rect, [(source, (left + x, y), area)
+                                             for (source, area, _), x in zip(glyphs, xs) if source is not None])
+            if len(self.lines) > ATLAS_LINE_CACHE:
+                self.lines.popitem(last=False)
+        surface.blits(line[1], doreturn=False)
+        return line[0].copy()
+
+def get_glyph_atlas(size, color, bold=False, family=FONT_FAMILY):
+    """Shared GlyphAtlas per font and colour, built on first use."""
+    key = (family, size, bold, tuple(color))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(get_font(size, bold, family), color)
+    return atlas
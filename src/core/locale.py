@@ -1,11 +1,109 @@
+"""
+Translations, compiled from data/lang/<code>.json into one bundle: a key table
+giving every string key an integer id, and per language a list of texts in key
+id order. All languages stay resident, so switching is a table swap.
+
+The bundle is rebuilt from the catalogs whenever a source file changes. To build
+it ahead of time and validate it against the keys the code uses (reports
+MISSING: keys instead of showing them in game):
+
+    python -m src.core.locale
+"""
 import json
 import os
+import re
+import sys
 import locale
-from src.constants import DATA_DIR
+from src.constants import DATA_DIR, BASE_DIR, LANGUAGES, LOCALE_BUNDLE
+
+BUNDLE_VERSION = 1
+# Literal keys in lang.get("...") calls, checked by the build
+KEY_USE = re.compile(r"""lang\.get\(\s*["'](\w+)["']\s*\)""")
+
+def _source_path(code):
+    return os.path.join(DATA_DIR, "lang", f"{code}.json")
+
+def _source_stamps():
+    """(mtime_ns, size) of every source catalog, or None for missing ones."""
+    stamps = {}
+    for code in LANGUAGES:
+        try:
+            st = os.stat(_source_path(code))
+            stamps[code] = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stamps[code] = None
+    return stamps
+
+def used_keys(root=os.path.join(BASE_DIR, 'src')):
+    """Literal translation keys used in the code: key -> first file using it."""
+    keys = {}
+    for folder, _, files in os.walk(root):
+        for name in sorted(files):
+            if name.endswith('.py'):
+                path = os.path.join(folder, name)
+                with open(path, encoding='utf-8') as f:
+                    for key in KEY_USE.findall(f.read()):
+                        keys.setdefault(key, os.path.relpath(path, BASE_DIR))
+    return keys
+
+def compile_bundle():
+    """
+    Reads every source catalog into a bundle dict; returns (bundle, problems).
+    Keys a language lacks fall back to the English text and are reported.
+    """
+    catalogs, problems = {}, []
+    for code in LANGUAGES:
+        try:
+            with open(_source_path(code), "r", encoding="utf-8") as f:
+                catalogs[code] = json.load(f)
+        except (OSError, ValueError) as e:
+            problems.append(f"{code}: unreadable ({e})")
+            catalogs[code] = {}
+
+    english = catalogs.get("en", {})
+    keys = list(english) + sorted({k for c in catalogs.values() for k in c} - english.keys())
+    languages = {}
+    for code, catalog in catalogs.items():
+        missing = [k for k in keys if k not in catalog]
+        if missing:
+            problems.append(f"{code}: MISSING:{', MISSING:'.join(missing)}")
+        languages[code] = [catalog.get(k, english.get(k, f"MISSING:{k}")) for k in keys]
+    bundle = {"version": BUNDLE_VERSION, "sources": _source_stamps(), "keys": keys, "languages": languages}
+    return bundle, problems
+
+def write_bundle(bundle, path=LOCALE_BUNDLE):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(bundle, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def load_bundle(path=LOCALE_BUNDLE):
+    """The compiled bundle, rebuilt (and rewritten) if missing or older than its sources."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            bundle = json.load(f)
+        if bundle.get("version") == BUNDLE_VERSION and bundle.get("sources") == _source_stamps():
+            return bundle
+    except (OSError, ValueError):
+        pass
+    bundle, problems = compile_bundle()
+    if problems:
+        print(f"[LANG] Bundle rebuilt with {len(problems)} problems, see python -m src.core.locale")
+    try:
+        write_bundle(bundle, path)
+    except OSError as e:
+        print(f"[LANG] Could not write bundle: {e}")
+    return bundle
 
 class LanguageManager:
     def __init__(self, lang_code=None):
-        self.translations = {}
+        bundle = load_bundle()
+        # Integer id per key; each language is a list of texts indexed by id
+        self.key_ids = {key: i for i, key in enumerate(bundle["keys"])}
+        self.tables = bundle["languages"]
+        self.table = []
+        # Callbacks run after every language switch with the set of texts that changed
+        self.listeners = []
         self.current_lang = lang_code if lang_code else self.detect_system_language()
         self.load_language(self.current_lang)
 
@@ -19,23 +117,39 @@ class LanguageManager:
         return "en"
 
     def load_language(self, lang_code):
+        """Switches to a resident language table; listeners get the texts it replaced."""
+        if lang_code not in self.tables:
+            print(f"[LANG] Unknown language: {lang_code}")
+            lang_code = "en"
+        old, self.table = self.table, self.tables.get(lang_code, [])
         self.current_lang = lang_code
-        # Path fixed to point to data/lang
-        path = os.path.join(DATA_DIR, "lang", f"{lang_code}.json")
-        
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                self.translations = json.load(f)
-            print(f"[LANG] Loaded language: {lang_code}")
-        except FileNotFoundError:
-            print(f"[LANG] File not found: {path}")
-            if lang_code != "en":
-                self.load_language("en")
-            else:
-                self.translations = {}
-        except Exception as e:
-            print(f"[LANG] Error: {e}")
-            self.translations = {}
+        print(f"[LANG] Loaded language: {lang_code}")
+
+        changed = {a for a, b in zip(old, self.table) if a != b}
+        for callback in self.listeners:
+            callback(changed)
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
 
     def get(self, key):
-        return self.translations.get(key, f"MISSING:{key}")
\ No newline at end of file
+        i = self.key_ids.get(key)
+        return self.table[i] if i is not None else f"MISSING:{key}"
+
+def undefined_keys(keys):
+    """Problems for keys the code uses that no catalog defines."""
+    defined = set(keys)
+    return [f"MISSING:{key} (used in {path}, no language defines it)"
+            for key, path in sorted(used_keys().items()) if key not in defined]
+
+def main():
+    bundle, problems = compile_bundle()
+    problems += undefined_keys(bundle['keys'])
+    for msg in problems:
+        print(f"[LANG] {msg}")
+    write_bundle(bundle)
+    print(f"[LANG] {len(bundle['keys'])} keys x {len(bundle['languages'])} languages -> {LOCALE_BUNDLE}")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame as pg
+from src.constants import MUSIC_FADE_MS, MUSIC_FALLBACK
+
+# Posted by pygame.mixer.music when a track stops (e.g. at the end of a fade-out)
+MUSIC_END = pg.event.custom_type()
+
+def _read_track(path):
+    """Worker-thread half of opening a track: the file read."""
+    t0 = time.perf_counter()
+    with open(path, 'rb') as f:
+        data = f.read()
+    return data, (time.perf_counter() - t0) * 1000.0
+
+def validate_playlist(paths, fallback=MUSIC_FALLBACK):
+    """
+    Maps each track key to a playable file. Keys whose file is missing or empty
+    are pointed at the fallback track (or dropped if that is missing too).
+    """
+    valid = {key: path for key, path in paths.items() if os.path.isfile(path) and os.path.getsize(path)}
+    tracks = dict(valid)
+    for key in paths.keys() - valid.keys():
+        if fallback in valid:
+            print(f"[AUDIO] Music '{key}': {os.path.basename(paths[key])} missing, using '{fallback}'")
+            tracks[key] = valid[fallback]
+        else:
+            print(f"[AUDIO] Music '{key}': {os.path.basename(paths[key])} missing")
+    return tracks
+
+class MusicController:
+    """
+    Streams music through pygame.mixer.music without blocking a frame.
+    Every playlist file is read into memory on a worker thread at startup, so
+    opening a track on the main thread only parses a buffer. A switch fades the
+    current track out and starts the next one, fading in, on the MUSIC_END event.
+    Per-track read/open times and request-to-start latency are kept in timings.
+    """
+    def __init__(self, paths, volume=0.5):
+        self.tracks = validate_playlist(paths)
+        self.volume = volume
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='MusicLoad')
+        self.buffers = {path: self.pool.submit(_read_track, path) for path in set(self.tracks.values())}
+        self.current = None     # Key of the track playing (or fading out)
+        self.current_path = None
+        self.pending = None     # (key, path, request time) waiting for the fade-out
+        self.stream = None      # In-memory file the mixer is reading from
+        self.timings = {}       # key -> {"file", "read_ms", "open_ms", "switch_ms"}
+        pg.mixer.music.set_endevent(MUSIC_END)
+
+    @property
+    def waiting(self):
+        """True while a switch waits on its file read rather than on the fade-out."""
+        return self.pending is not None and not pg.mixer.music.get_busy()
+
+    def play(self, key):
+        """Switches to track key; a no-op if it (or its fallback file) is already the target."""
+        path = self.tracks.get(key)
+        if not path:
+            print(f"[AUDIO] Music track not found: {key}")
+            return
+        target = self.pending[1] if self.pending else self.current_path
+        if path == target and (self.pending or pg.mixer.music.get_busy()):
+            return
+        fading = self.pending is not None
+        self.pending = (key, path, time.perf_counter())
+        if pg.mixer.music.get_busy():
+            # The next track starts from update() once MUSIC_END arrives
+            if not fading:
+                pg.mixer.music.fadeout(MUSIC_FADE_MS)
+        else:
+            self.update()
+
+    def update(self):
+        """Starts the pending track once the old one has faded out and its file is in memory."""
+        if self.pending is None or pg.mixer.music.get_busy():
+            return
+        key, path, requested = self.pending
+        future = self.buffers[path]
+        if not future.done():
+            return
+        self.pending = None
+        try:
+            data, read_ms = future.result()
+            t0 = time.perf_counter()
+            stream = io.BytesIO(data)
+            pg.mixer.music.load(stream, os.path.splitext(path)[1].lstrip('.'))
+            pg.mixer.music.play(-1, fade_ms=MUSIC_FADE_MS)
+            pg.mixer.music.set_volume(self.volume)
+            open_ms = (time.perf_counter() - t0) * 1000.0
+        except (OSError, pg.error) as e:
+            print(f"[AUDIO] Error playing music: {e}")
+            return
+        self.stream = stream
+        self.current, self.current_path = key, path
+        switch_ms = (time.perf_counter() - requested) * 1000.0
+        self.timings[key] = {"file": os.path.basename(path), "read_ms": round(read_ms, 3),
+                             "open_ms": round(open_ms, 3), "switch_ms": round(switch_ms, 3)}
+        print(f"[AUDIO] Playing music: {key} (read {read_ms:.1f}ms on worker, "
+              f"open {open_ms:.1f}ms, switch {switch_ms:.0f}ms)")
+
+    def set_volume(self, volume):
+        self.volume = volume
+        pg.mixer.music.set_volume(volume)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,65 @@
+import time
+from collections import deque
+import pygame as pg
+from src.constants import *
+
+class FramePacer:
+    """
+    Adaptive main-loop scheduler.
+    While something animates (a race, a scroll, a view transition) frames run at
+    max_fps; otherwise the loop blocks in pg.event.wait until input arrives.
+    Frame times of active frames are kept for p50/p99 and missed-deadline stats.
+    """
+    def __init__(self, clock):
+        self.clock = clock
+        self.active_until = 0.0
+        self.frame_times = deque(maxlen=FRAME_STATS_WINDOW)
+        self.missed = 0
+        self.active_frames = 0
+        self.idle_waits = 0
+        self.last_frame = None
+
+    def kick(self, seconds=TRANSITION_ACTIVE_S):
+        """Keeps the full frame rate for a short while (e.g. after a view change)."""
+        self.active_until = max(self.active_until, time.perf_counter() + seconds)
+
+    def is_active(self, animating):
+        return animating or time.perf_counter() < self.active_until
+
+    def get_events(self, active):
+        """Polls when active; otherwise sleeps until an event or IDLE_WAIT_MS passes."""
+        if active:
+            return pg.event.get()
+        self.idle_waits += 1
+        self.last_frame = None
+        first = pg.event.wait(IDLE_WAIT_MS)
+        events = [] if first.type == pg.NOEVENT else [first]
+        events.extend(pg.event.get())
+        return events
+
+    def end_frame(self, active, max_fps):
+        """Caps the frame rate and records the frame time of active frames."""
+        self.clock.tick(max_fps)
+        now = time.perf_counter()
+        if active and self.last_frame is not None:
+            ms = (now - self.last_frame) * 1000.0
+            self.frame_times.append(ms)
+            self.active_frames += 1
+            if ms > 1000.0 / max_fps * DEADLINE_SLACK:
+                self.missed += 1
+        self.last_frame = now if active else None
+
+    def stats(self):
+        """Frame-time statistics (ms) over the last FRAME_STATS_WINDOW active frames."""
+        times = sorted(self.frame_times)
+        if not times:
+            return {"frames": 0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0,
+                    "missed": self.missed, "idle_waits": self.idle_waits}
+        return {
+            "frames": self.active_frames,
+            "p50_ms": times[len(times) // 2],
+            "p99_ms": times[min(len(times) - 1, int(len(times) * 0.99))],
+            "max_ms": times[-1],
+            "missed": self.missed,
+            "idle_waits": self.idle_waits
+        }
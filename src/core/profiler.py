@@ -0,0 +1,56 @@
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+
+class StartupProfiler:
+    """
+    Wall-clock timings of the startup phases up to the first presented frame.
+    Phases are always recorded (a perf_counter pair each); the JSON report is
+    only written when enabled with python main.py --profile-startup [PATH].
+    """
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.phases = {}
+        self.output = None
+
+    @property
+    def enabled(self):
+        return self.output is not None
+
+    def enable(self, output):
+        self.output = output
+
+    @contextmanager
+    def phase(self, name):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - t) * 1000.0, 3)
+
+    def report(self, extra=None):
+        data = {
+            "total_ms": round((time.perf_counter() - self.t0) * 1000.0, 3),
+            "phases_ms": dict(self.phases),
+            "python": platform.python_version(),
+            "platform": sys.platform
+        }
+        data.update(extra or {})
+        return data
+
+    def write(self, extra=None):
+        """Writes the report to the configured path; returns it."""
+        data = self.report(extra)
+        folder = os.path.dirname(self.output)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(self.output, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
+        print(f"[PROFILE] Startup {data['total_ms']:.1f}ms, report written to {self.output}")
+        return data
+
+# Shared by main.py and Main; started when this module is first imported
+profiler = StartupProfiler()
@@ -0,0 +1,178 @@
+"""
+Binary player-save container.
+
+    header   <4sHHQI>  magic, version, flags, index offset, index size
+    sections           compact UTF-8 JSON, one blob per top-level key
+    index    <H> count, then per section <B> name length, name, <QII> offset, length, crc32
+
+The header is the only thing ever rewritten in place. A save appends the
+sections whose bytes changed plus a fresh index, then points the header at it,
+so a crash before the header write leaves the previous save intact. Blobs
+orphaned this way are dropped by compacting once they outweigh the live data.
+"""
+import json
+import os
+import struct
+import zlib
+from collections.abc import Mapping
+from src.constants import SAVE_COMPACT_MIN_BYTES
+
+MAGIC = b'CARS'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQI')
+INDEX_COUNT = struct.Struct('<H')
+INDEX_NAME = struct.Struct('<B')
+INDEX_ENTRY = struct.Struct('<QII')
+
+def encode_section(value):
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def read_index(f):
+    """Returns ({name: (offset, length, crc)}, index size) from an open save file."""
+    f.seek(0)
+    magic, version, _, index_offset, index_size = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a save file (magic {magic!r}, version {version})")
+    f.seek(index_offset)
+    raw = f.read(index_size)
+    (count,), pos = INDEX_COUNT.unpack_from(raw), INDEX_COUNT.size
+    index = {}
+    for _ in range(count):
+        (name_len,) = INDEX_NAME.unpack_from(raw, pos)
+        pos += INDEX_NAME.size
+        name = raw[pos:pos + name_len].decode('utf-8')
+        pos += name_len
+        index[name] = INDEX_ENTRY.unpack_from(raw, pos)
+        pos += INDEX_ENTRY.size
+    return index, index_size
+
+def pack_index(index):
+    parts = [INDEX_COUNT.pack(len(index))]
+    for name, entry in index.items():
+        raw_name = name.encode('utf-8')
+        parts.append(INDEX_NAME.pack(len(raw_name)) + raw_name + INDEX_ENTRY.pack(*entry))
+    return b''.join(parts)
+
+class SaveFile:
+    """Read side: only the header and index are read on open, sections on demand."""
+    def __init__(self, path):
+        self.path = path
+        self.reload()
+
+    def reload(self):
+        with open(self.path, 'rb') as f:
+            self.index, _ = read_index(f)
+
+    def names(self):
+        return list(self.index.keys())
+
+    def read(self, name):
+        blob = self._read_blob(name)
+        if blob is None:
+            # The file was compacted since the index was read; offsets moved
+            self.reload()
+            blob = self._read_blob(name)
+            if blob is None:
+                raise ValueError(f"corrupt section '{name}' in {self.path}")
+        return json.loads(blob.decode('utf-8'))
+
+    def _read_blob(self, name):
+        offset, length, crc = self.index[name]
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            blob = f.read(length)
+        return blob if len(blob) == length and zlib.crc32(blob) == crc else None
+
+class SaveState(Mapping):
+    """
+    Dict-like view of a binary save. Each section is parsed the first time it
+    is accessed, so e.g. showing the player name never decodes the garage.
+    """
+    def __init__(self, save_file):
+        self.file = save_file
+        self.loaded = {}
+
+    def __getitem__(self, key):
+        if key not in self.loaded:
+            if key not in self.file.index:
+                raise KeyError(key)
+            self.loaded[key] = self.file.read(key)
+        return self.loaded[key]
+
+    def __iter__(self):
+        return iter(self.file.names())
+
+    def __len__(self):
+        return len(self.file.index)
+
+def _write_full(path, sections):
+    """Writes a fresh, garbage-free file next to path and swaps it in."""
+    tmp_path = f"{path}.tmp"
+    index = {}
+    offset = HEADER.size
+    with open(tmp_path, 'wb') as f:
+        f.write(b'\0' * HEADER.size)
+        for name, blob in sections.items():
+            f.write(blob)
+            index[name] = (offset, len(blob), zlib.crc32(blob))
+            offset += len(blob)
+        raw_index = pack_index(index)
+        f.write(raw_index)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, offset, len(raw_index)))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def write_save_file(path, data):
+    """
+    Saves a dict of sections, appending only those whose bytes changed.
+    Compacts the file instead once dead blobs outweigh the live ones.
+    """
+    try:
+        sections = {name: encode_section(value) for name, value in data.items()}
+        if not os.path.exists(path):
+            _write_full(path, sections)
+            return True
+
+        with open(path, 'r+b') as f:
+            try:
+                index, _ = read_index(f)
+            except (ValueError, struct.error):
+                index = None
+            if index is not None:
+                changed = {name: blob for name, blob in sections.items()
+                           if index.get(name, (0, -1, 0))[1:] != (len(blob), zlib.crc32(blob))}
+                if not changed and set(index) == set(sections):
+                    return True
+
+                size = f.seek(0, os.SEEK_END)
+                live = sum(len(blob) for blob in sections.values())
+                appended = sum(len(blob) for blob in changed.values())
+                garbage = size + appended - HEADER.size - live
+                if garbage <= max(live, SAVE_COMPACT_MIN_BYTES):
+                    new_index = {}
+                    offset = size
+                    for name, blob in sections.items():
+                        if name in changed:
+                            f.write(blob)
+                            new_index[name] = (offset, len(blob), zlib.crc32(blob))
+                            offset += len(blob)
+                        else:
+                            new_index[name] = index[name]
+                    raw_index = pack_index(new_index)
+                    f.write(raw_index)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    # Commit point: the old index stays valid until this write lands
+                    f.seek(0)
+                    f.write(HEADER.pack(MAGIC, VERSION, 0, offset, len(raw_index)))
+                    f.flush()
+                    os.fsync(f.fileno())
+                    return True
+
+        _write_full(path, sections)
+        return True
+    except Exception as e:
+        print(f"[DATA] Error saving {path}: {e}")
+        return False
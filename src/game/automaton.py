@@ -0,0 +1,259 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from src.constants import *
+
+EMPTY = -1
+
+def nasch_step(grid, vmax, p_slow, rng, ids=None, periodic=True):
+    """
+    One Nagel-Schreckenberg update of a (lanes, cells) int8 grid, in place.
+    Each row is an independent lane; a cell holds EMPTY or the velocity of the
+    car in it. ids, if given, is a same-shaped array moved along with the cars.
+    Periodic lanes wrap around; open lanes have free road past the last cell
+    and cars driving off the end are removed.
+    Returns the number of cars before the update.
+    """
+    width = grid.shape[1]
+    rows, cols = np.nonzero(grid != EMPTY)
+    n = len(rows)
+    if not n:
+        return 0
+    v = grid[rows, cols].astype(np.int16)
+
+    # np.nonzero is row-major, so the car ahead is the next entry in the same row;
+    # the last car of a row wraps around to the first one.
+    idx = np.arange(n)
+    is_last = np.append(rows[1:] != rows[:-1], True)
+    row_first = np.searchsorted(rows, rows, side='left')
+    ahead = np.where(is_last, row_first, idx + 1)
+    gap = (cols[ahead] - cols - 1) % width
+    if not periodic:
+        gap = np.where(is_last, vmax, gap)
+
+    # 1. Accelerate  2. Brake to gap  3. Random slowdown  4. Move
+    v = np.minimum(v + 1, vmax)
+    v = np.minimum(v, gap)
+    slow = rng.random(n, dtype=np.float32) < p_slow
+    v = np.where(slow, np.maximum(v - 1, 0), v)
+    new_cols = cols + v
+    if periodic:
+        new_cols %= width
+    else:
+        stay = new_cols < width
+        rows, cols, v, new_cols = rows[stay], cols[stay], v[stay], new_cols[stay]
+
+    if ids is not None:
+        moved_ids = ids[rows, cols]
+        ids.fill(EMPTY)
+        ids[rows, new_cols] = moved_ids
+    grid.fill(EMPTY)
+    grid[rows, new_cols] = v
+    return n
+
+def seed_grid(shape, density, rng, vmax=CA_VMAX):
+    """Random initial grid: each cell holds a car with probability density."""
+    grid = np.full(shape, EMPTY, dtype=np.int8)
+    occupied = rng.random(shape, dtype=np.float32) < density
+    grid[occupied] = rng.integers(0, vmax + 1, size=int(occupied.sum()), dtype=np.int8)
+    return grid
+
+class TrafficCA:
+    """Single-process NaSch automaton over a (lanes, cells) grid."""
+    def __init__(self, grid, vmax=CA_VMAX, p_slow=CA_P_SLOW, seed=None, ids=None, periodic=True):
+        self.grid = grid
+        self.ids = ids
+        self.periodic = periodic
+        self.vmax = vmax
+        self.p_slow = p_slow
+        self.rng = np.random.default_rng(seed)
+        self.steps = 0
+
+    @property
+    def cells(self):
+        return self.grid.size
+
+    def step(self):
+        self.steps += 1
+        return nasch_step(self.grid, self.vmax, self.p_slow, self.rng, self.ids, self.periodic)
+
+    def close(self):
+        pass
+
+# --- MULTI-PROCESS TILED MODE ---
+# Lanes never interact, so horizontal bands of rows can be stepped independently.
+_worker = {}
+
+def _init_tile_worker(shm_name, shape, vmax, p_slow, seed):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker['shm'] = shm
+    _worker['grid'] = np.ndarray(shape, dtype=np.int8, buffer=shm.buf)
+    _worker['vmax'] = vmax
+    _worker['p_slow'] = p_slow
+    _worker['seed'] = seed
+
+def _step_tile(row_start, row_end, step_no):
+    rng = np.random.default_rng((_worker['seed'], row_start, step_no))
+    band = _worker['grid'][row_start:row_end]
+    return nasch_step(band, _worker['vmax'], _worker['p_slow'], rng)
+
+class TiledTrafficCA:
+    """
+    NaSch automaton whose grid lives in shared memory and is stepped by a
+    process pool, one band of lanes per task. For large maps only: the
+    per-step dispatch overhead outweighs the gain on small grids.
+    """
+    def __init__(self, grid, vmax=CA_VMAX, p_slow=CA_P_SLOW, seed=0, workers=None, tiles=None):
+        self.vmax = vmax
+        self.p_slow = p_slow
+        self.steps = 0
+        self.cells = grid.size
+        workers = workers or os.cpu_count() or 1
+
+        self.shm = shared_memory.SharedMemory(create=True, size=grid.nbytes)
+        self.grid = np.ndarray(grid.shape, dtype=np.int8, buffer=self.shm.buf)
+        self.grid[:] = grid
+
+        lanes = grid.shape[0]
+        tiles = max(1, min(lanes, tiles or workers * 2))
+        bounds = np.linspace(0, lanes, tiles + 1).astype(int)
+        self.bands = [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+        self.pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_tile_worker,
+            initargs=(self.shm.name, grid.shape, vmax, p_slow, seed))
+
+    def step(self):
+        self.steps += 1
+        futures = [self.pool.submit(_step_tile, a, b, self.steps) for a, b in self.bands]
+        return sum(f.result() for f in futures)
+
+    def close(self):
+        self.pool.shutdown()
+        self.grid = None
+        self.shm.close()
+        self.shm.unlink()
+
+# --- TRACK TRAFFIC ---
+def rasterise_lanes(waypoints, offsets, cell_px, mask=None):
+    """
+    Samples the waypoint polyline every cell_px pixels, once per lane offset.
+    Returns (xy, heading): xy is (lanes, cells, 2) map coordinates.
+    Cells landing on a wall in mask are dropped from every lane.
+    """
+    pts = np.asarray(waypoints, dtype=float).reshape(-1, 2)
+    if len(pts) < 2:
+        # No polyline to follow: no cells in any lane
+        return np.zeros((len(offsets), 0, 2)), np.zeros(0)
+    seg = np.diff(pts, axis=0)
+    seg_len = np.hypot(seg[:, 0], seg[:, 1])
+    dist = np.concatenate(([0.0], np.cumsum(seg_len)))
+    samples = np.arange(0.0, dist[-1], cell_px)
+
+    i = np.clip(np.searchsorted(dist, samples, side='right') - 1, 0, len(seg) - 1)
+    t = (samples - dist[i]) / seg_len[i]
+    centre = pts[i] + seg[i] * t[:, None]
+    heading = np.arctan2(seg[i, 1], seg[i, 0])
+    normal = np.column_stack((-np.sin(heading), np.cos(heading)))
+
+    xy = np.stack([centre + normal * off for off in offsets])
+    if mask is not None:
+        h, w = mask.grid.shape
+        xi = np.clip(xy[..., 0].astype(np.intp), 0, w - 1)
+        yi = np.clip(xy[..., 1].astype(np.intp), 0, h - 1)
+        keep = (mask.grid[yi, xi] != SURFACE_WALL).all(axis=0)
+        xy, heading = xy[:, keep], heading[keep]
+    return xy, heading
+
+class TrafficLayer:
+    """
+    AI traffic for a race: a NaSch automaton over lanes rasterised along the track,
+    stepped every CA_STEP_S of race time and mapped back to map coordinates.
+    Lanes wrap around only on closed tracks. On open ones a car driving off the
+    last cell re-enters at the first cell of a lane with room there, or waits
+    on the last cell until one has.
+    """
+    def __init__(self, track, mask=None, density=CA_DENSITY, seed=None):
+        waypoints = np.asarray(track.get('waypoints', []), dtype=float).reshape(-1, 2)
+        self.xy, self.heading = rasterise_lanes(waypoints, CA_LANE_OFFSETS, CA_CELL_PX, mask)
+        lanes, cells = self.xy.shape[:2]
+        self.loop = len(waypoints) > 2 and np.hypot(*(waypoints[-1] - waypoints[0])) <= CA_CELL_PX
+        rng = np.random.default_rng(seed)
+
+        grid = seed_grid((lanes, cells), density, rng)
+        # Keep the cells nearest the starting grid clear of traffic
+        if cells:
+            spawn = track.get('spawn', waypoints[0])
+            dist = np.hypot(*(self.xy.mean(axis=0) - spawn).T)
+            grid[:, np.argsort(dist)[:CA_START_CLEAR_CELLS]] = EMPTY
+        ids = np.full(grid.shape, EMPTY, dtype=np.int32)
+        occupied = np.nonzero(grid != EMPTY)
+        self.count = len(occupied[0])
+        ids[occupied] = np.arange(self.count)
+
+        self.ca = TrafficCA(grid, seed=rng.integers(1 << 31), ids=ids, periodic=self.loop)
+        self.model_ids = [f"car_{n}" for n in rng.integers(0, CAR_MODEL_COUNT, self.count)]
+        self.lane = np.zeros(self.count, dtype=np.intp)
+        self.cell = np.zeros(self.count, dtype=np.intp)
+        self._read_positions()
+        self.prev_cell = self.cell.copy()
+        self.timer = 0.0
+
+    def _read_positions(self):
+        lanes, cells = np.nonzero(self.ca.ids != EMPTY)
+        order = self.ca.ids[lanes, cells]
+        self.lane[order] = lanes
+        self.cell[order] = cells
+
+    def _reenter(self):
+        """Puts cars that drove off the end of an open track back at the start."""
+        grid, ids = self.ca.grid, self.ca.ids
+        present = np.zeros(self.count, dtype=bool)
+        present[ids[ids != EMPTY]] = True
+        last = grid.shape[1] - 1
+        for car in np.flatnonzero(~present):
+            # Own lane first, then any other lane with its first cell free
+            lanes = [self.lane[car]] + [l for l in range(grid.shape[0]) if l != self.lane[car]]
+            lane = next((l for l in lanes if grid[l, 0] == EMPTY), None)
+            if lane is None:
+                # The last cell is always free right after a car left it
+                lane, cell = self.lane[car], last
+            else:
+                cell = 0
+                self.prev_cell[car] = 0
+            grid[lane, cell] = 0
+            ids[lane, cell] = car
+
+    def update(self, dt):
+        """Advances the automaton in CA_STEP_S increments of race time."""
+        self.timer += dt
+        while self.timer >= CA_STEP_S:
+            self.timer -= CA_STEP_S
+            self.prev_cell = self.cell.copy()
+            self.ca.step()
+            if not self.loop:
+                self._reenter()
+            self._read_positions()
+
+    def _moved(self):
+        """Cells every traffic car advanced in the last CA step."""
+        moved = self.cell - self.prev_cell
+        return moved % self.xy.shape[1] if self.loop else moved
+
+    def speeds(self):
+        """Speed of every traffic car over the last CA step, in map px/s."""
+        return self._moved() * (CA_CELL_PX / CA_STEP_S)
+
+    def positions(self, alpha=None):
+        """Map coordinates and headings of every traffic car, blended between CA steps."""
+        if not self.count:
+            return np.zeros((0, 2)), np.zeros(0)
+        cells = self.xy.shape[1]
+        a = self.timer / CA_STEP_S if alpha is None else alpha
+        f = self.prev_cell + self._moved() * a
+        c0 = np.floor(f).astype(np.intp) % cells
+        c1 = np.minimum(c0 + 1, cells - 1) if not self.loop else (c0 + 1) % cells
+        frac = (f - np.floor(f))[:, None]
+        xy = self.xy[self.lane, c0] * (1 - frac) + self.xy[self.lane, c1] * frac
+        return xy, self.heading[c0]
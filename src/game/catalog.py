@@ -0,0 +1,161 @@
+import numbers
+import numpy as np
+from src.constants import *
+from src.game.physics import STAT_FIELDS
+
+PART_SLOTS = ('engine', 'breaks', 'boost')
+PART_TIERS = ('xs', 's', 'm', 'l', 'xl')
+# Player inventory list holding unmounted parts of each slot
+INVENTORY_CATEGORY = {'engine': 'engines', 'breaks': 'breaks', 'boost': 'boosts'}
+FIELD_INDEX = {field: i for i, field in enumerate(STAT_FIELDS)}
+
+# Catalog of the current process, see load_catalog()
+_catalog = None
+
+class GameCatalog:
+    """
+    Car and part definitions from game_data.json, validated and compiled into
+    dense stat tables indexed by integer ids:
+
+        car_base  (cars + 1, fields)   additive car stats (turn_rate)
+        car_mult  (cars + 1, fields)   per-model multipliers on the summed stats
+        part_stats (parts + slots, fields)  each part only fills its slot's fields
+
+    The extra car row and the trailing per-slot part rows hold CAR_DEFAULTS and
+    PART_DEFAULTS, so unknown ids and empty slots resolve without branching.
+    Effective stats of any number of cars are then one gather and a sum.
+    """
+    def __init__(self, game_db):
+        game_db = game_db or {}
+        self.cars = {}
+        self.parts = {}
+        self.errors = []
+
+        for model_id, car in game_db.get('cars', {}).items():
+            if self._valid_car(model_id, car):
+                self.cars[model_id] = car
+        for part_id, part in game_db.get('parts', {}).items():
+            if self._valid_part(part_id, part):
+                self.parts[part_id] = part
+        for msg in self.errors:
+            print(f"[CATALOG] {msg}")
+
+        # --- ID TABLES ---
+        self.car_ids = list(self.cars.keys())
+        self.car_index = {model_id: i for i, model_id in enumerate(self.car_ids)}
+        self.default_car = len(self.car_ids)
+        self.part_ids = list(self.parts.keys())
+        self.part_index = {part_id: i for i, part_id in enumerate(self.part_ids)}
+        self.default_part = {slot: len(self.part_ids) + s for s, slot in enumerate(PART_SLOTS)}
+
+        # --- STAT TABLES ---
+        fields = len(STAT_FIELDS)
+        self.car_base = np.zeros((len(self.car_ids) + 1, fields))
+        self.car_mult = np.ones((len(self.car_ids) + 1, fields))
+        for i, model_id in enumerate(self.car_ids + [None]):
+            car = self.cars.get(model_id, {})
+            for field, value in dict(CAR_DEFAULTS, **car.get('stats', {})).items():
+                self.car_base[i, FIELD_INDEX[field]] = value
+            for field, value in car.get('mult', {}).items():
+                self.car_mult[i, FIELD_INDEX[field]] = value
+
+        self.part_stats = np.zeros((len(self.part_ids) + len(PART_SLOTS), fields))
+        self.part_slot = np.zeros(len(self.part_ids) + len(PART_SLOTS), dtype=np.int8)
+        self.part_price = np.zeros(len(self.part_ids), dtype=np.int64)
+        for i, part_id in enumerate(self.part_ids):
+            part = self.parts[part_id]
+            slot = part['slot']
+            self.part_slot[i] = PART_SLOTS.index(slot)
+            self.part_price[i] = part.get('price', 0)
+            # Fields the part leaves out keep the slot default
+            for field, value in dict(PART_DEFAULTS[slot], **part['stats']).items():
+                self.part_stats[i, FIELD_INDEX[field]] = value
+        for slot, row in self.default_part.items():
+            self.part_slot[row] = PART_SLOTS.index(slot)
+            for field, value in PART_DEFAULTS[slot].items():
+                self.part_stats[row, FIELD_INDEX[field]] = value
+        self.car_price = np.array([self.cars[m].get('price', 0) for m in self.car_ids], dtype=np.int64)
+
+        # --- BROWSING ---
+        n = len(self.part_ids)
+        self.part_names = [self.parts[p].get('name', p) for p in self.part_ids]
+        # Lower-case text matched by shop searches
+        self.search_keys = [f"{name} {p}".lower() for name, p in zip(self.part_names, self.part_ids)]
+        tier = [self.parts[p].get('tier') for p in self.part_ids]
+        self.part_tier = np.array([PART_TIERS.index(t) if t in PART_TIERS else len(PART_TIERS) for t in tier],
+                                  dtype=np.int8)
+        # Rating: mean ratio of the part's stats to its slot defaults (1.0 = stock)
+        self.part_rating = np.zeros(n)
+        for s, slot in enumerate(PART_SLOTS):
+            cols = [FIELD_INDEX[f] for f in PART_DEFAULTS[slot]]
+            rows = self.part_slot[:n] == s
+            defaults = self.part_stats[self.default_part[slot], cols]
+            self.part_rating[rows] = (self.part_stats[:n][rows][:, cols] / defaults).mean(axis=1)
+        # Sort indexes are built once; the shop only masks them
+        self.sort_indexes = {
+            'price': np.lexsort((self.part_tier, self.part_price)),
+            'tier': np.lexsort((self.part_price, self.part_tier)),
+            'stat': np.lexsort((self.part_price, -self.part_rating))
+        }
+
+    # --- VALIDATION ---
+    def _valid_car(self, model_id, car):
+        if not isinstance(car, dict):
+            self.errors.append(f"Car {model_id}: not an object")
+            return False
+        for key in ('stats', 'mult'):
+            for field, value in car.get(key, {}).items():
+                if field not in FIELD_INDEX or not isinstance(value, numbers.Real):
+                    self.errors.append(f"Car {model_id}: bad {key} entry {field}={value!r}")
+                    return False
+        return True
+
+    def _valid_part(self, part_id, part):
+        if not isinstance(part, dict) or part.get('slot') not in PART_SLOTS:
+            self.errors.append(f"Part {part_id}: missing or unknown slot")
+            return False
+        allowed = PART_DEFAULTS[part['slot']]
+        for field, value in part.get('stats', {}).items():
+            if field not in allowed or not isinstance(value, numbers.Real):
+                self.errors.append(f"Part {part_id}: bad stat {field}={value!r} for slot {part['slot']}")
+                return False
+        part.setdefault('stats', {})
+        return True
+
+    # --- LOOKUPS ---
+    def encode(self, model_id, mounted_parts):
+        """(car row, part rows per PART_SLOTS) for one loadout; unknown ids map to defaults."""
+        mounted_parts = mounted_parts or {}
+        car = self.car_index.get(model_id, self.default_car)
+        parts = []
+        for s, slot in enumerate(PART_SLOTS):
+            row = self.part_index.get(mounted_parts.get(slot), self.default_part[slot])
+            # A part mounted in the wrong slot counts as an empty slot
+            parts.append(row if self.part_slot[row] == s else self.default_part[slot])
+        return car, parts
+
+    def encode_many(self, loadouts):
+        """Vectors for [(model_id, mounted_parts), ...]: (car rows (n,), part rows (n, slots))."""
+        encoded = [self.encode(m, p) for m, p in loadouts]
+        cars = np.array([c for c, _ in encoded], dtype=np.intp)
+        parts = np.array([p for _, p in encoded], dtype=np.intp).reshape(-1, len(PART_SLOTS))
+        return cars, parts
+
+    def stats_table(self, cars, parts):
+        """Effective stats (n, STAT_FIELDS) of encoded loadouts: one gather, no Python loop."""
+        return (self.car_base[cars] + self.part_stats[parts].sum(axis=1)) * self.car_mult[cars]
+
+    def effective_stats(self, model_id, mounted_parts):
+        """Effective stats of one loadout as a {field: value} dict."""
+        cars, parts = self.encode_many([(model_id, mounted_parts)])
+        return dict(zip(STAT_FIELDS, self.stats_table(cars, parts)[0].tolist()))
+
+    def part_ids_for_slot(self, slot):
+        return [p for p in self.part_ids if self.parts[p]['slot'] == slot]
+
+def load_catalog(data_manager):
+    """Loads and compiles game_data.json once per process."""
+    global _catalog
+    if _catalog is None:
+        _catalog = GameCatalog(data_manager.load_game_data())
+    return _catalog
@@ -0,0 +1,158 @@
+import numpy as np
+from src.constants import *
+
+# Per-car stat columns resolved from mounted parts (see catalog.GameCatalog)
+STAT_FIELDS = ('accel', 'top_speed', 'brake', 'boost_power', 'boost_time', 'turn_rate')
+WAYPOINT_RADIUS_SQ = WAYPOINT_RADIUS ** 2
+SURFACE_DRAG_TABLE = np.asarray(SURFACE_DRAG, dtype=float)
+
+def model_index(model_id):
+    """Maps a garage model_id ('car_5') to its sprite sheet index, or -1."""
+    try:
+        return int(str(model_id).split('_')[1])
+    except (IndexError, ValueError):
+        return -1
+
+class CarBatch:
+    """
+    Structure-of-arrays state for every car in a race.
+    Row i of every array belongs to car i, so one NumPy pass updates the whole grid.
+    """
+    def __init__(self, count):
+        self.count = count
+        self.pos = np.zeros((count, 2))
+        self.prev_pos = np.zeros((count, 2))
+        self.heading = np.zeros(count)
+        self.prev_heading = np.zeros(count)
+        self.speed = np.zeros(count)
+
+        # Controls (0..1, steer -1..1)
+        self.throttle = np.zeros(count)
+        self.brake = np.zeros(count)
+        self.steer = np.zeros(count)
+        self.boost = np.zeros(count, dtype=bool)
+        self.boost_left = np.zeros(count)
+
+        self.stats = {field: np.zeros(count) for field in STAT_FIELDS}
+        self.ai = np.ones(count, dtype=bool)
+
+        self.next_wp = np.zeros(count, dtype=np.int32)
+        self.finish_time = np.full(count, np.nan)
+
+    def set_car(self, i, model_id, stats, x, y, heading, ai=True):
+        for field in STAT_FIELDS:
+            self.stats[field][i] = stats[field]
+        self.pos[i] = (x, y)
+        self.prev_pos[i] = (x, y)
+        self.heading[i] = heading
+        self.prev_heading[i] = heading
+        self.boost_left[i] = stats['boost_time']
+        self.ai[i] = ai
+
+    @property
+    def running(self):
+        return np.isnan(self.finish_time)
+
+def drive_ai(b, waypoints):
+    """Waypoint follower for every AI car: steer at the next waypoint, lift in corners."""
+    if not len(waypoints):
+        return
+    ai = b.ai & b.running
+    wp = waypoints[np.minimum(b.next_wp, len(waypoints) - 1)]
+    delta = wp - b.pos
+    target = np.arctan2(delta[:, 1], delta[:, 0])
+    diff = (target - b.heading + np.pi) % (2 * np.pi) - np.pi
+
+    sharp = np.abs(diff) > 0.5
+    b.steer = np.where(ai, np.clip(diff * 2.5, -1.0, 1.0), b.steer)
+    b.throttle = np.where(ai, np.where(sharp, 0.35, 1.0), b.throttle)
+    b.brake = np.where(ai, (sharp & (b.speed > 70)).astype(float), b.brake)
+    b.boost = np.where(ai, ~sharp & (b.boost_left > 0), b.boost)
+
+def integrate(b, dt):
+    """Advances speed, heading and position of every running car by dt."""
+    s = b.stats
+    running = b.running
+
+    boosting = b.boost & (b.boost_left > 0) & running
+    power = np.where(boosting, s['boost_power'], 1.0)
+    b.boost_left = np.where(boosting, np.maximum(0.0, b.boost_left - dt), b.boost_left)
+
+    top = s['top_speed'] * power
+    accel = s['accel'] * power
+    # Linear drag chosen so terminal velocity equals top speed at full throttle
+    drag = accel / top
+    speed = b.speed + (accel * b.throttle - s['brake'] * b.brake - drag * b.speed) * dt
+    b.speed = np.where(running, np.maximum(0.0, speed), 0.0)
+
+    # Steering authority grows with speed so parked cars can't spin in place
+    grip = np.minimum(1.0, b.speed / 40.0)
+    b.heading = b.heading + b.steer * s['turn_rate'] * grip * dt
+    b.pos[:, 0] += np.cos(b.heading) * b.speed * dt
+    b.pos[:, 1] += np.sin(b.heading) * b.speed * dt
+
+def surface_at(surface, pos):
+    """Gathers the surface class under each position; outside the grid counts as wall."""
+    h, w = surface.shape
+    xi = pos[:, 0].astype(np.intp)
+    yi = pos[:, 1].astype(np.intp)
+    inside = (xi >= 0) & (xi < w) & (yi >= 0) & (yi < h)
+    cls = surface[np.clip(yi, 0, h - 1), np.clip(xi, 0, w - 1)]
+    return np.where(inside, cls, SURFACE_WALL)
+
+def apply_surface(b, surface, dt):
+    """
+    Resolves wall contacts and off-track drag against a TrackMask grid.
+    Cars that move into a wall keep whichever single-axis move stays clear (sliding),
+    or stop if both are blocked.
+    """
+    cls = surface_at(surface, b.pos)
+    hit = cls == SURFACE_WALL
+    if hit.any():
+        idx = np.nonzero(hit)[0]
+        old, new = b.prev_pos[idx], b.pos[idx]
+        slide_x = np.column_stack((new[:, 0], old[:, 1]))
+        slide_y = np.column_stack((old[:, 0], new[:, 1]))
+        x_ok = surface_at(surface, slide_x) != SURFACE_WALL
+        y_ok = surface_at(surface, slide_y) != SURFACE_WALL
+        b.pos[idx] = np.where(x_ok[:, None], slide_x, np.where(y_ok[:, None], slide_y, old))
+        b.speed[idx] *= np.where(x_ok | y_ok, WALL_SPEED_KEEP, 0.0)
+        cls[idx] = surface_at(surface, b.pos[idx])
+
+    b.speed *= np.maximum(0.0, 1.0 - SURFACE_DRAG_TABLE[cls] * dt)
+
+def apply_traffic(b, traffic_pos, dt):
+    """Slows cars that overlap any traffic car (traffic_pos is (M, 2))."""
+    if not len(traffic_pos):
+        return
+    d = b.pos[:, None, :] - traffic_pos[None, :, :]
+    touching = ((d ** 2).sum(axis=2) < TRAFFIC_HIT_RADIUS ** 2).any(axis=1)
+    b.speed = np.where(touching, b.speed * max(0.0, 1.0 - TRAFFIC_DRAG * dt), b.speed)
+
+def check_progress(b, waypoints, time):
+    """Advances next_wp for cars inside their waypoint radius and stamps finishers."""
+    n = len(waypoints)
+    if not n:
+        return
+    pending = b.next_wp < n
+    wp = waypoints[np.minimum(b.next_wp, n - 1)]
+    dist_sq = ((wp - b.pos) ** 2).sum(axis=1)
+    hit = pending & (dist_sq < WAYPOINT_RADIUS_SQ)
+    b.next_wp += hit
+    b.finish_time = np.where(hit & (b.next_wp == n), time, b.finish_time)
+
+def step(b, dt, waypoints, time, surface=None, traffic_pos=None):
+    """
+    One fixed timestep for the whole batch. time is the race clock before this step,
+    surface an optional TrackMask grid for collisions and friction, traffic_pos
+    optional positions of automaton traffic cars.
+    """
+    b.prev_pos[:] = b.pos
+    b.prev_heading[:] = b.heading
+    drive_ai(b, waypoints)
+    integrate(b, dt)
+    if surface is not None:
+        apply_surface(b, surface, dt)
+    if traffic_pos is not None:
+        apply_traffic(b, traffic_pos, dt)
+    check_progress(b, waypoints, time)
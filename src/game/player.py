@@ -1,62 +1,182 @@
+from collections import Counter
+
+# Key order of garage entries created in-game
+CAR_ENTRY_KEYS = ('instance_id', 'model_id', 'custom_name', 'mounted_parts')
+
+class CarInstance:
+    """
+    One owned car, normalized from its save entry.
+    The entry's original shape (key order, extra keys, legacy bare-string form)
+    is kept so to_entry() writes back exactly what was loaded.
+    """
+    __slots__ = ('instance_id', 'model_id', 'custom_name', 'mounted_parts', 'extra', 'keys', 'legacy')
+
+    def __init__(self, instance_id, model_id, custom_name=None, mounted_parts=None,
+                 extra=None, keys=CAR_ENTRY_KEYS, legacy=False):
+        self.instance_id = instance_id
+        self.model_id = model_id
+        self.custom_name = custom_name
+        self.mounted_parts = dict(mounted_parts or {})
+        self.extra = extra or {}
+        self.keys = keys
+        self.legacy = legacy
+
+    @classmethod
+    def from_entry(cls, entry, fallback_id):
+        """Builds an instance from a garage entry: a dict, or a bare model_id string from old saves."""
+        if not isinstance(entry, dict):
+            return cls(fallback_id, entry, keys=(), legacy=True)
+        known = set(CAR_ENTRY_KEYS)
+        return cls(
+            entry.get('instance_id') or fallback_id,
+            # Old saves name the model under 'name'
+            entry.get('model_id') or entry.get('name'),
+            entry.get('custom_name'),
+            entry.get('mounted_parts'),
+            extra={k: v for k, v in entry.items() if k not in known},
+            keys=tuple(entry.keys())
+        )
+
+    def to_entry(self):
+        """Save form, identical in shape to the entry it was loaded from."""
+        if self.legacy:
+            return self.model_id
+        entry = {}
+        for key in self.keys:
+            entry[key] = getattr(self, key) if key in CAR_ENTRY_KEYS else self.extra[key]
+        return entry
+
+    def as_dict(self):
+        """Normalized dict (always has model_id and mounted_parts), e.g. for race entrants."""
+        return {
+            "instance_id": self.instance_id,
+            "model_id": self.model_id,
+            "custom_name": self.custom_name,
+            "mounted_parts": dict(self.mounted_parts)
+        }
+
 class Player:
-    def __init__(self, player_data, game_db):
+    def __init__(self, player_data, catalog):
         self.name = player_data['player']['name']
         self.money = player_data['player']['money']
         self.level = player_data['player']['level']
         self.exp = player_data['player']['exp']
-        
-        self.garage = player_data.get('garage', [])
+
+        # --- GARAGE ---
+        # cars: instance_id -> CarInstance, in garage order
+        # by_model: model_id -> [instance_id], by_part: part_id -> {instance_id}
+        self.cars = {}
+        self.by_model = {}
+        self.by_part = {}
+        for n, entry in enumerate(player_data.get('garage', [])):
+            car = CarInstance.from_entry(entry, f"legacy_{n:03d}")
+            if car.instance_id in self.cars:
+                # Duplicate ids in hand-edited saves must not drop a car
+                car.instance_id = f"legacy_{n:03d}"
+            self._index_car(car)
+
+        # --- INVENTORY ---
+        # Unmounted parts per category list; part_counts counts them by part_id
         self.inventory = player_data.get('inventory', {})
-        
+        self.part_counts = Counter(p for parts in self.inventory.values() for p in parts)
+
         # Determine current car (load from save or default to first in garage)
         self.current_car = player_data['player'].get('current_car')
-        
+
         # Validation and Fix: Ensure current_car is a String ID, not a Dict object
         # The save file might store the full object or just the ID. We want the ID string.
         if isinstance(self.current_car, dict):
              self.current_car = self.current_car.get('model_id') or self.current_car.get('name')
 
         # Fallback: If no car selected (or it was null), pick first from garage
-        if not self.current_car and self.garage:
-            first_car = self.garage[0]
-            # Handle if garage contains dict objects (structure: {"model_id": "car_0", ...})
-            if isinstance(first_car, dict):
-                self.current_car = first_car.get('model_id') or first_car.get('name')
-            else:
-                self.current_car = first_car
-        
-        self.game_db = game_db
+        if not self.current_car and self.cars:
+            self.current_car = next(iter(self.cars.values())).model_id
+
+        self.catalog = catalog
+
+    def _index_car(self, car):
+        self.cars[car.instance_id] = car
+        self.by_model.setdefault(car.model_id, []).append(car.instance_id)
+        for part_id in car.mounted_parts.values():
+            self.by_part.setdefault(part_id, set()).add(car.instance_id)
+
+    @property
+    def garage(self):
+        """Owned cars in garage order."""
+        return list(self.cars.values())
 
     def set_name(self, new_name):
         """Updates player name."""
-        if new_name: 
+        if new_name:
             self.name = new_name
 
+    def owns_car(self, model_id):
+        return model_id in self.by_model
+
     def set_current_car(self, car_id):
-        """
-        Sets the active car if the player owns it. 
-        Robust check: handles garage being list of strings OR list of dicts.
-        """
-        found = False
-        
-        # Iterate to check ownership regardless of data structure
-        for item in self.garage:
-            if isinstance(item, dict):
-                # Check match against model_id (preferred) or name
-                item_id = item.get('model_id') or item.get('name')
-                if item_id == car_id:
-                    found = True
-                    break
-            else:
-                if item == car_id:
-                    found = True
-                    break
-        
-        if found:
+        """Sets the active car if the player owns it."""
+        if self.owns_car(car_id):
             self.current_car = car_id
             return True
         return False
 
+    def get_instance(self, instance_id):
+        return self.cars.get(instance_id)
+
+    def get_car(self, car_id):
+        """Returns the first owned car of model car_id as a normalized dict, or None."""
+        ids = self.by_model.get(car_id)
+        return self.cars[ids[0]].as_dict() if ids else None
+
+    def cars_with_part(self, part_id):
+        """Owned cars that have part_id mounted."""
+        return [self.cars[i] for i in self.by_part.get(part_id, ())]
+
+    def add_car(self, model_id, custom_name=None, mounted_parts=None):
+        """Adds a newly bought car to the garage and returns it."""
+        n = len(self.cars) + 1
+        while f"auto_{n:03d}" in self.cars:
+            n += 1
+        car = CarInstance(f"auto_{n:03d}", model_id, custom_name, mounted_parts)
+        self._index_car(car)
+        return car
+
+    def mount_part(self, instance_id, slot, part_id):
+        """Mounts part_id into slot of a car, keeping the part index current."""
+        car = self.cars[instance_id]
+        # Entries saved without parts gain the mounted_parts key from now on
+        if car.legacy:
+            car.legacy, car.keys = False, CAR_ENTRY_KEYS
+        elif 'mounted_parts' not in car.keys:
+            car.keys += ('mounted_parts',)
+        old = car.mounted_parts.get(slot)
+        if old is not None:
+            users = self.by_part.get(old)
+            if users is not None:
+                users.discard(instance_id)
+                if not users:
+                    del self.by_part[old]
+        car.mounted_parts[slot] = part_id
+        self.by_part.setdefault(part_id, set()).add(instance_id)
+        return old
+
+    def owns_part(self, part_id):
+        """True if part_id is in the inventory or mounted on any car."""
+        return self.part_counts[part_id] > 0 or part_id in self.by_part
+
+    def add_part(self, category, part_id):
+        self.inventory.setdefault(category, []).append(part_id)
+        self.part_counts[part_id] += 1
+
+    def remove_part(self, category, part_id):
+        """Takes one part_id out of the inventory; False if there is none."""
+        parts = self.inventory.get(category, [])
+        if part_id not in parts:
+            return False
+        parts.remove(part_id)
+        self.part_counts[part_id] -= 1
+        return True
+
     def to_dict(self):
         """Serializes player state for saving."""
         return {
@@ -67,6 +187,6 @@ class Player:
                 "exp": self.exp,
                 "current_car": self.current_car  # Save selected car ID
             },
-            "garage": self.garage,
+            "garage": [car.to_entry() for car in self.cars.values()],
             "inventory": self.inventory
-        }
\ No newline at end of file
+        }
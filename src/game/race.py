@@ -0,0 +1,148 @@
+import math
+import time
+from collections import deque
+import numpy as np
+from src.constants import *
+from src.game import physics
+from src.game.physics import CarBatch, STAT_FIELDS
+
+class Race:
+    """
+    Fixed-timestep race simulation.
+    update() accumulates real frame time and advances physics in PHYSICS_HZ steps,
+    so lap times and physics cost do not depend on the render FPS.
+    Has no pygame dependency; rendering lives in src.ui.race_view.
+    mask is an optional TrackMask used for wall collisions and surface drag,
+    traffic an optional TrafficLayer providing automaton-driven AI traffic.
+    catalog is the GameCatalog resolving each entrant's stats from its parts.
+    """
+    def __init__(self, track, entrants, catalog, mask=None, traffic=None, tick_rate=PHYSICS_HZ):
+        self.track = track
+        self.mask = mask
+        self.traffic = traffic
+        self.waypoints = np.asarray(track.get('waypoints', []), dtype=float).reshape(-1, 2)
+        self.dt = 1.0 / tick_rate
+        self.accumulator = 0.0
+        self.time = 0.0
+        self.ticks = 0
+        self.dropped_time = 0.0
+
+        # Step timing (ms) for budget checks
+        self.step_times = deque(maxlen=STEP_STATS_WINDOW)
+        self.overruns = 0
+
+        self.entrants = list(entrants)
+        self.player_index = None
+        self.cars = CarBatch(len(self.entrants))
+        self.spawn_grid(catalog)
+
+    def spawn_grid(self, catalog):
+        """Places entrants two abreast behind the spawn point."""
+        sx, sy = self.track.get('spawn', (0, 0))
+        heading = math.radians(self.track.get('heading', 0))
+        fx, fy = math.cos(heading), math.sin(heading)
+        # Perpendicular (right-hand side of the heading)
+        rx, ry = -fy, fx
+        cars, parts = catalog.encode_many([(e.get('model_id'), e.get('mounted_parts')) for e in self.entrants])
+        table = catalog.stats_table(cars, parts)
+        for i, entrant in enumerate(self.entrants):
+            back = (i // 2) * CAR_LENGTH_PX * 1.4
+            side = (-1 if i % 2 == 0 else 1) * CAR_LENGTH_PX * 0.3
+            x = sx - fx * back + rx * side
+            y = sy - fy * back + ry * side
+            stats = dict(zip(STAT_FIELDS, table[i]))
+            is_player = entrant.get('driver') == 'player'
+            if is_player and self.player_index is None:
+                self.player_index = i
+            self.cars.set_car(i, entrant.get('model_id'), stats, x, y, heading, ai=not is_player)
+
+    @property
+    def count(self):
+        return self.cars.count
+
+    @property
+    def finished(self):
+        return not self.cars.running.any()
+
+    def finish_time(self, i):
+        t = self.cars.finish_time[i]
+        return None if np.isnan(t) else float(t)
+
+    @property
+    def alpha(self):
+        """Fraction of a step left in the accumulator, for render interpolation."""
+        return self.accumulator / self.dt
+
+    def set_controls(self, i, throttle, brake, steer, boost):
+        """Applies driver input to car i (used for the player's car)."""
+        c = self.cars
+        c.throttle[i], c.brake[i], c.steer[i], c.boost[i] = throttle, brake, steer, boost
+
+    def update(self, frame_dt):
+        """Advances the simulation by real elapsed time. Returns steps taken."""
+        self.accumulator += frame_dt
+        steps = 0
+        while self.accumulator >= self.dt:
+            if steps >= MAX_STEPS_PER_FRAME:
+                # Too far behind (e.g. window drag): drop time instead of spiralling
+                self.dropped_time += self.accumulator
+                self.accumulator = 0.0
+                break
+            self.step()
+            self.accumulator -= self.dt
+            steps += 1
+        return steps
+
+    def step(self):
+        """Advances every car by one fixed timestep in a single batched pass."""
+        t0 = time.perf_counter()
+        surface = self.mask.grid if self.mask else None
+        traffic_pos = None
+        if self.traffic:
+            self.traffic.update(self.dt)
+            traffic_pos = self.traffic.positions()[0]
+        physics.step(self.cars, self.dt, self.waypoints, self.time, surface, traffic_pos)
+        self.time += self.dt
+        self.ticks += 1
+
+        ms = (time.perf_counter() - t0) * 1000.0
+        self.step_times.append(ms)
+        if ms > STEP_BUDGET_MS:
+            self.overruns += 1
+
+    def interpolated(self):
+        """Returns (pos, heading) arrays blended between the last two physics steps."""
+        a = self.alpha
+        c = self.cars
+        pos = c.prev_pos + (c.pos - c.prev_pos) * a
+        heading = c.prev_heading + (c.heading - c.prev_heading) * a
+        return pos, heading
+
+    def standings(self):
+        """Car indices ordered by race position."""
+        c = self.cars
+        n = len(self.waypoints)
+        wp = self.waypoints[np.minimum(c.next_wp, n - 1)] if n else c.pos
+        dist = np.hypot(*(wp - c.pos).T)
+        finished = ~c.running
+        # Finishers first (by time), then waypoints cleared, then closeness to the next one
+        key_time = np.where(finished, c.finish_time, np.inf)
+        return np.lexsort((dist, -c.next_wp, key_time))
+
+    def position(self, i):
+        return int(np.nonzero(self.standings() == i)[0][0]) + 1
+
+    def budget_stats(self):
+        """Physics step timing against STEP_BUDGET_MS."""
+        times = sorted(self.step_times)
+        if not times:
+            return {"budget_ms": STEP_BUDGET_MS, "mean_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0,
+                    "overruns": 0, "dropped_s": 0.0}
+        return {
+            "budget_ms": STEP_BUDGET_MS,
+            "mean_ms": sum(times) / len(times),
+            "p99_ms": times[min(len(times) - 1, int(len(times) * 0.99))],
+            "max_ms": times[-1],
+            "overruns": self.overruns,
+            "dropped_s": self.dropped_time
+        }
@@ -1,10 +1,22 @@
+import importlib
 import pygame as pg
 from src.constants import *
 from src.game.player import Player
-from src.ui.widgets import Button
-from src.ui.menu_settings import PlayerSettingsMenu
-from src.ui.menu_garage import GarageMenu
+from src.game.catalog import load_catalog
+from src.ui.widgets import Button, draw_dirty_buttons
 from src.core.assets import get_car_sprite
+from src.core.fonts import render_text
+
+# Sub-views by session state: (module, class), imported and built on first visit
+SUB_VIEWS = {
+    'PLAYER_SETTINGS': ('src.ui.menu_settings', 'PlayerSettingsMenu'),
+    'GARAGE': ('src.ui.menu_garage', 'GarageMenu'),
+    'SHOP': ('src.ui.menu_shop', 'ShopMenu'),
+    'RACE': ('src.ui.race_view', 'RaceView')
+}
+
+# Music per session state; anything else plays the main theme
+STATE_MUSIC = {'GARAGE': 'garage_theme', 'SHOP': 'garage_theme', 'RACE': 'race_theme'}
 
 class GameSession:
     """
@@ -15,20 +27,33 @@ class GameSession:
         self.slot_id = slot_id
         
         # Load Data
-        self.game_db = app.data_manager.load_game_data()
+        self.catalog = load_catalog(app.data_manager)
         self.player_data = app.data_manager.load_player_state(slot_id)
-        self.player = Player(self.player_data, self.game_db)
+        self.player = Player(self.player_data, self.catalog)
         
         self.state = 'HUB'
         self.buttons = []
         
-        # Sub-menus
-        self.player_menu = PlayerSettingsMenu(app, self.player, self.return_to_hub)
-        self.garage_menu = GarageMenu(app, self.player, self.return_to_hub)
+        # Sub-menus (see SUB_VIEWS)
+        self.views = {}
         
         self.init_hub()
         print(f"[GAME] Started. Player: {self.player.name}")
 
+    def view(self, state):
+        """Sub-view for state, constructed on first use."""
+        view = self.views.get(state)
+        if view is None:
+            module, cls = SUB_VIEWS[state]
+            view = getattr(importlib.import_module(module), cls)(self.app, self.player, self.return_to_hub)
+            self.views[state] = view
+        return view
+
+    player_menu = property(lambda self: self.view('PLAYER_SETTINGS'))
+    garage_menu = property(lambda self: self.view('GARAGE'))
+    shop_menu = property(lambda self: self.view('SHOP'))
+    race_view = property(lambda self: self.view('RACE'))
+
     def init_hub(self):
         """Initializes buttons for the main hub view."""
         self.buttons = []
@@ -46,11 +71,20 @@ class GameSession:
 
     def set_state(self, st):
         """Switches sub-state within the session."""
+        if self.state == 'RACE' and st != 'RACE':
+            self.race_view.stop_audio()
         self.state = st
+        self.app.request_redraw()
+        self.app.audio.play_music(STATE_MUSIC.get(st, 'main_theme'))
         if st == 'PLAYER_SETTINGS': 
             self.player_menu.init_ui()
         elif st == 'GARAGE':
             self.garage_menu.init_ui() # Re-calculate grid in case inventory changed
+        elif st == 'SHOP':
+            self.shop_menu.init_ui()
+        elif st == 'RACE':
+            self.app.load_scene('race')
+            self.race_view.start()
 
     def return_to_hub(self):
         self.set_state('HUB')
@@ -69,6 +103,12 @@ class GameSession:
             for e in events: self.player_menu.update(e)
         elif self.state == 'GARAGE':
             for e in events: self.garage_menu.update(e)
+            self.garage_menu.tick()
+        elif self.state == 'SHOP':
+            for e in events: self.shop_menu.update(e)
+        elif self.state == 'RACE':
+            for e in events: self.race_view.update(e)
+            self.race_view.tick()
         
         # Global ESC to back/exit
         for e in events:
@@ -86,19 +126,44 @@ class GameSession:
             self.player_menu.draw(self.app.screen)
         elif self.state == 'GARAGE':
             self.garage_menu.draw(self.app.screen)
+        elif self.state == 'SHOP':
+            self.shop_menu.draw(self.app.screen)
+        elif self.state == 'RACE':
+            self.race_view.draw(self.app.screen)
         else:
             self.draw_placeholder(self.state)
 
+    def is_animating(self):
+        """Views that change without input and need every frame."""
+        if self.state == 'GARAGE':
+            return self.garage_menu.is_scrolling
+        return self.state == 'RACE'
+
+    def draw_dirty(self):
+        """
+        Partial redraw for frames without state-changing input.
+        Returns changed rects, or None when the current view needs a full redraw.
+        """
+        if self.state == 'HUB':
+            return draw_dirty_buttons(self.app.screen, self.buttons)
+        elif self.state == 'PLAYER_SETTINGS':
+            return self.player_menu.draw_dirty(self.app.screen)
+        elif self.state == 'GARAGE':
+            return self.garage_menu.draw_dirty(self.app.screen)
+        elif self.state == 'SHOP':
+            return self.shop_menu.draw_dirty(self.app.screen)
+        elif self.state == 'RACE':
+            return None # Animated every frame
+        return []
+
     def draw_info(self):
         """Draws top status bar."""
         w = self.app.screen.get_width()
         pg.draw.rect(self.app.screen, PANEL_BG, (0,0,w,60))
         pg.draw.line(self.app.screen, ACCENT_BLUE, (0,60), (w,60), 2)
-        f = pg.font.SysFont('Consolas', 24)
-        
-        ns = f.render(f"{self.app.lang.get('info_driver')}: {self.player.name}", True, TEXT_MAIN)
+        ns = render_text(f"{self.app.lang.get('info_driver')}: {self.player.name}", 24, TEXT_MAIN)
         self.app.screen.blit(ns, (20, 18))
-        ms = f.render(f"${self.player.money}", True, ACCENT_GOLD)
+        ms = render_text(f"${self.player.money}", 24, ACCENT_GOLD)
         self.app.screen.blit(ms, ms.get_rect(topright=(w-20, 18)))
 
     def draw_hub(self):
@@ -107,22 +172,19 @@ class GameSession:
         
         # Draw CURRENT CAR Preview on the left
         if self.player.current_car:
-            sprite = get_car_sprite(self.app.assets, self.player.current_car)
+            sprite = get_car_sprite(self.app.assets, self.player.current_car, (160, 160))
             if sprite:
-                # Scale up for display
-                scaled = pg.transform.scale(sprite, (160, 160))
                 # Position on the left side
-                self.app.screen.blit(scaled, (100, 250))
+                self.app.screen.blit(sprite, (100, 250))
                 
                 # Draw label "Current Ride"
-                f = pg.font.SysFont('Consolas', 20)
-                lbl = f.render(self.app.lang.get("lbl_current_car"), True, TEXT_DIM)
+                lbl = render_text(self.app.lang.get("lbl_current_car"), 20, TEXT_DIM)
                 self.app.screen.blit(lbl, (120, 420))
                 
                 # Draw Car Name
-                name_s = pg.font.SysFont('Consolas', 24, bold=True).render(self.player.current_car, True, TEXT_MAIN)
+                name_s = render_text(self.player.current_car, 24, TEXT_MAIN, bold=True)
                 self.app.screen.blit(name_s, name_s.get_rect(center=(180, 450)))
 
     def draw_placeholder(self, txt):
-        s = pg.font.SysFont('Consolas',32,bold=True).render(txt,True,TEXT_DIM)
+        s = render_text(txt, 32, TEXT_DIM, bold=True)
         self.app.screen.blit(s, s.get_rect(center=(self.app.screen.get_width()//2, self.app.screen.get_height()//2)))
\ No newline at end of file
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+import numpy as np
+import pygame as pg
+from src.constants import *
+from src.core.assets import get_asset_path
+
+# Bump when SURFACE_PALETTE or the classifier changes to invalidate old caches
+MASK_VERSION = 1
+
+# In-process cache: (image path, mmap) -> TrackMask
+_loaded_masks = {}
+
+class TrackMask:
+    """
+    Per-pixel surface classes of a track image (uint8, indexed [y, x]).
+    Built once from the map PNG and cached next to it, so collision and
+    friction lookups in the race loop are plain array indexing.
+    """
+    def __init__(self, grid, source_hash=None):
+        self.grid = grid
+        self.source_hash = source_hash
+        self.height, self.width = grid.shape
+
+def file_hash(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def build_surface_grid(image):
+    """Classifies every pixel of a pygame Surface into SURFACE_* classes."""
+    rgb = pg.surfarray.array3d(image).transpose(1, 0, 2)
+    if image.get_flags() & pg.SRCALPHA:
+        alpha = pg.surfarray.array_alpha(image).T
+    else:
+        alpha = np.full(rgb.shape[:2], 255, dtype=np.uint8)
+
+    palette = np.array(list(SURFACE_PALETTE.keys()), dtype=np.int32)
+    classes = np.array(list(SURFACE_PALETTE.values()), dtype=np.uint8)
+
+    # Classify each distinct colour once, then scatter back to pixels
+    colours, inverse = np.unique(rgb.reshape(-1, 3), axis=0, return_inverse=True)
+    dist = ((colours[:, None, :].astype(np.int32) - palette[None, :, :]) ** 2).sum(axis=2)
+    colour_class = classes[dist.argmin(axis=1)]
+
+    grid = colour_class[inverse.reshape(-1)].reshape(rgb.shape[:2])
+    grid[alpha == 0] = SURFACE_WALL
+    return grid.astype(np.uint8)
+
+def mask_cache_paths(image_path):
+    base, _ = os.path.splitext(image_path)
+    return base + '.mask.npy', base + '.mask.json'
+
+def load_track_mask(filename, mmap=False):
+    """
+    Loads the surface mask for maps/<filename>.
+    Uses the on-disk cache when its recorded hash matches the PNG, otherwise rebuilds it.
+    mmap=True maps a valid cache read-only instead of reading it, so worker
+    processes share one copy through the OS page cache.
+    """
+    path = get_asset_path('images', os.path.join('maps', filename))
+    if (path, mmap) in _loaded_masks:
+        return _loaded_masks[(path, mmap)]
+    if not os.path.exists(path):
+        print(f"[TRACK] ERROR: Map not found: {path}")
+        return None
+
+    npy_path, meta_path = mask_cache_paths(path)
+    source_hash = file_hash(path)
+
+    grid = None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('source_hash') == source_hash and meta.get('version') == MASK_VERSION:
+            grid = np.load(npy_path, mmap_mode='r' if mmap else None)
+    except (OSError, ValueError):
+        grid = None
+
+    if grid is None:
+        try:
+            grid = build_surface_grid(pg.image.load(path))
+        except pg.error as e:
+            print(f"[TRACK] Error loading map {filename}: {e}")
+            return None
+        try:
+            np.save(npy_path, grid)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({"source_hash": source_hash, "version": MASK_VERSION,
+                           "shape": list(grid.shape)}, f, indent=4)
+            print(f"[TRACK] Built surface mask for {filename}")
+        except OSError as e:
+            print(f"[TRACK] Could not cache mask for {filename}: {e}")
+
+    mask = TrackMask(grid, source_hash)
+    _loaded_masks[(path, mmap)] = mask
+    return mask
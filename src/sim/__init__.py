@@ -0,0 +1,4 @@
+import os
+
+# Headless runs emit JSON lines on stdout; keep pygame's banner out of them.
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
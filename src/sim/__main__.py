@@ -0,0 +1,63 @@
+"""
+Headless batch races: no window, no audio device.
+
+    python -m src.sim --races 100 --slot 1 --out results.jsonl
+
+Each race is written as one JSON line. Log messages go to stderr.
+"""
+import argparse
+import contextlib
+import json
+import sys
+from src.constants import *
+from src.core.data_manager import DataManager
+from src.game.catalog import load_catalog
+from src.game.track import load_track_mask
+from src.sim.runner import build_entrants, run_race
+
+def parse_args(argv):
+    p = argparse.ArgumentParser(prog='python -m src.sim', description="Run races headless and emit JSON lines.")
+    p.add_argument('--races', type=int, default=1, help="number of races to run")
+    p.add_argument('--track', default='map_0', help="track id in data/tracks")
+    p.add_argument('--slot', type=int, default=1, help="save slot whose current car enters the races")
+    p.add_argument('--opponents', type=int, default=RACE_AI_OPPONENTS)
+    p.add_argument('--seed', type=int, default=0, help="seed of the first race; race n uses seed + n")
+    p.add_argument('--no-traffic', action='store_true', help="disable automaton traffic")
+    p.add_argument('--out', default='-', help="output file, '-' for stdout")
+    return p.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    out = sys.stdout if args.out == '-' else open(args.out, 'w', encoding='utf-8')
+
+    # Keep the repo's print() logging off stdout so it stays pure JSON lines
+    with contextlib.redirect_stdout(sys.stderr):
+        dm = DataManager()
+        catalog = load_catalog(dm)
+        track = dm.load_track(args.track)
+        if not track:
+            print(f"[SIM] Unknown track: {args.track}")
+            return 1
+        mask = load_track_mask(track.get('image', f'{args.track}.png'))
+
+        state = dm.load_player_state(args.slot)
+        garage = state.get('garage', [])
+        current = state.get('player', {}).get('current_car')
+        car = next((c for c in garage if isinstance(c, dict) and c.get('model_id') == current), None)
+        car = car or {"model_id": current or 'car_0', "mounted_parts": {}}
+        entrants = build_entrants(car, args.opponents)
+
+    try:
+        for n in range(args.races):
+            result = run_race(track, entrants, catalog, mask, seed=args.seed + n,
+                              traffic=not args.no_traffic)
+            result["race"] = n
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
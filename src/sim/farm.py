@@ -0,0 +1,153 @@
+"""
+Parameter sweeps over headless races on a process pool.
+
+    python -m src.sim.farm --spec sweep.json --out results.jsonl
+
+Spec (JSON):
+    {
+        "models": ["car_0", "car_5"],
+        "parts": {"engine": ["xs_0_engine"], "breaks": ["xs_0_breaks"], "boost": ["xs_0_boost"]},
+        "tracks": ["map_0"],
+        "seeds": 100,
+        "opponents": 3,
+        "traffic": true
+    }
+"parts" is either a list of mounted_parts dicts or a dict of per-slot lists
+(expanded to every combination). "seeds" is a count or an explicit list.
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from src.constants import *
+from src.core.data_manager import DataManager
+from src.game.catalog import load_catalog
+from src.game.physics import model_index
+from src.game.track import load_track_mask
+from src.sim.runner import build_entrants, run_race
+
+# Per-process state set once by _init_worker; tasks only carry small indices
+_worker = {}
+
+def expand_spec(spec):
+    """Normalises a sweep spec into index tables: (models, parts, tracks, seeds)."""
+    models = list(spec.get('models', ['car_0']))
+    parts = spec.get('parts', [{}])
+    if isinstance(parts, dict):
+        slots = list(parts.keys())
+        parts = [dict(zip(slots, combo)) for combo in itertools.product(*(parts[s] for s in slots))]
+    tracks = list(spec.get('tracks', ['map_0']))
+    seeds = spec.get('seeds', 1)
+    seeds = list(range(seeds)) if isinstance(seeds, int) else list(seeds)
+    return models, parts, tracks, seeds
+
+def iter_tasks(models, parts, tracks, seeds, chunk):
+    """Lazily yields (model_i, parts_i, track_i, seeds) tasks; nothing is materialised."""
+    for m, p, t in itertools.product(range(len(models)), range(len(parts)), range(len(tracks))):
+        for i in range(0, len(seeds), chunk):
+            yield (m, p, t, seeds[i:i + chunk])
+
+def _init_worker(tables, options):
+    # Worker logs must not interleave with the JSON lines on stdout
+    sys.stdout = sys.stderr
+    models, parts, tracks = tables
+    dm = DataManager()
+    layouts = {tid: dm.load_track(tid) for tid in tracks}
+    _worker.update(
+        models=models, parts=parts, tracks=tracks, options=options,
+        catalog=load_catalog(dm),
+        layouts=layouts,
+        # Masks were built by the parent; map the cache files read-only
+        masks={tid: load_track_mask(layouts[tid].get('image', f'{tid}.png'), mmap=True) for tid in tracks}
+    )
+
+def _run_task(task):
+    m, p, t, seeds = task
+    w = _worker
+    model_id, track_id = w['models'][m], w['tracks'][t]
+    car = {"model_id": model_id, "mounted_parts": w['parts'][p]}
+    entrants = build_entrants(car, w['options']['opponents'])
+
+    results = []
+    for seed in seeds:
+        result = run_race(w['layouts'][track_id], entrants, w['catalog'], w['masks'][track_id],
+                          seed=seed, traffic=w['options']['traffic'])
+        result.update(model_id=model_id, parts=w['parts'][p], track_id=track_id)
+        results.append(result)
+    return results
+
+def run_sweep(spec, out, workers=None, chunk=4, window=None):
+    """
+    Fans the sweep out over a process pool and streams result lines to out.
+    At most window tasks are in flight, so memory stays flat however large the sweep.
+    Returns the number of races written.
+    """
+    models, parts, tracks, seeds = expand_spec(spec)
+    options = {"opponents": spec.get('opponents', RACE_AI_OPPONENTS), "traffic": spec.get('traffic', True)}
+    workers = workers or os.cpu_count() or 1
+    window = window or workers * 4
+
+    # Every model must have a tile on the car sprite sheet
+    for model_id in models:
+        if not 0 <= model_index(model_id) < CAR_MODEL_COUNT:
+            raise ValueError(f"Car model not on the sprite sheet: {model_id}")
+
+    # Build (or validate) mask caches once in the parent so workers can mmap them
+    dm = DataManager()
+    for tid in tracks:
+        track = dm.load_track(tid)
+        if not track or not load_track_mask(track.get('image', f'{tid}.png')):
+            raise ValueError(f"Track not available: {tid}")
+
+    total = len(models) * len(parts) * len(tracks) * len(seeds)
+    print(f"[FARM] {total} races on {workers} workers")
+    tasks = iter_tasks(models, parts, tracks, seeds, chunk)
+    written = 0
+    t0 = last_report = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=((models, parts, tracks), options)) as pool:
+        pending = set()
+        for task in itertools.islice(tasks, window):
+            pending.add(pool.submit(_run_task, task))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                for result in fut.result():
+                    out.write(json.dumps(result) + "\n")
+                    written += 1
+                next_task = next(tasks, None)
+                if next_task is not None:
+                    pending.add(pool.submit(_run_task, next_task))
+            out.flush()
+            now = time.perf_counter()
+            if now - last_report >= 1.0 or not pending:
+                last_report = now
+                print(f"[FARM] {written}/{total} races ({written / (now - t0):.1f}/s)")
+    return written
+
+def main(argv=None):
+    p = argparse.ArgumentParser(prog='python -m src.sim.farm', description="Run a race parameter sweep.")
+    p.add_argument('--spec', required=True, help="sweep spec JSON file")
+    p.add_argument('--out', default='-', help="output file, '-' for stdout")
+    p.add_argument('--workers', type=int, default=None)
+    p.add_argument('--chunk', type=int, default=4, help="seeds per task")
+    args = p.parse_args(argv)
+
+    with open(args.spec, encoding='utf-8') as f:
+        spec = json.load(f)
+    out = sys.stdout if args.out == '-' else open(args.out, 'w', encoding='utf-8')
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            run_sweep(spec, out, args.workers, args.chunk)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+import random
+import time
+from src.constants import *
+from src.game.race import Race
+from src.game.automaton import TrafficLayer
+
+def build_entrants(car, opponents=RACE_AI_OPPONENTS):
+    """AI-only grid: the given garage car plus rivals on the same parts."""
+    parts = car.get('mounted_parts', {})
+    entrants = [{"model_id": car.get('model_id'), "mounted_parts": parts, "driver": 'ai'}]
+    for i in range(opponents):
+        entrants.append({"model_id": f"car_{(i + 1) % CAR_MODEL_COUNT}", "mounted_parts": parts, "driver": 'ai'})
+    return entrants
+
+def run_race(track, entrants, catalog, mask=None, seed=0, traffic=True, max_time=SIM_MAX_RACE_S):
+    """
+    Runs one race to completion as fast as possible, with no display or audio.
+    The seed shuffles the starting grid and drives the traffic automaton.
+    Returns a JSON-serialisable result dict.
+    """
+    rng = random.Random(seed)
+    grid = list(entrants)
+    rng.shuffle(grid)
+
+    layer = TrafficLayer(track, mask, seed=seed) if traffic else None
+    race = Race(track, grid, catalog, mask, layer)
+
+    t0 = time.perf_counter()
+    while not race.finished and race.time < max_time:
+        race.step()
+    wall_ms = (time.perf_counter() - t0) * 1000.0
+
+    results = []
+    for pos, i in enumerate(race.standings(), start=1):
+        entrant = race.entrants[i]
+        finish = race.finish_time(i)
+        results.append({
+            "position": pos,
+            "grid": int(i) + 1,
+            "model_id": entrant.get('model_id'),
+            "mounted_parts": entrant.get('mounted_parts', {}),
+            "finish_time": round(finish, 4) if finish is not None else None
+        })
+
+    return {
+        "seed": seed,
+        "track": track.get('name'),
+        "finished": race.finished,
+        "sim_time": round(race.time, 4),
+        "ticks": race.ticks,
+        "traffic": layer.count if layer else 0,
+        "wall_ms": round(wall_ms, 3),
+        "results": results
+    }
@@ -0,0 +1,26 @@
+import pygame as pg
+from src.constants import *
+from src.core.fonts import render_text
+
+class LoadingScreen:
+    """Progress bar shown while a scene's assets stream in."""
+    def __init__(self, app):
+        self.app = app
+
+    def draw(self, screen, loaded, total):
+        screen.fill(BG_COLOR)
+        w, h = screen.get_size()
+        title = render_text(self.app.lang.get("loading"), 40, TEXT_MAIN, bold=True)
+        screen.blit(title, title.get_rect(center=(w // 2, h // 2 - 50)))
+
+        bar = pg.Rect(0, 0, w // 2, 24)
+        bar.center = (w // 2, h // 2 + 10)
+        pg.draw.rect(screen, PANEL_BG, bar, border_radius=6)
+        if total:
+            fill = bar.copy()
+            fill.width = bar.width * loaded // total
+            pg.draw.rect(screen, ACCENT_BLUE, fill, border_radius=6)
+        pg.draw.rect(screen, TEXT_DIM, bar, 2, border_radius=6)
+
+        count = render_text(f"{loaded}/{total}", 20, TEXT_DIM)
+        screen.blit(count, count.get_rect(midtop=(w // 2, bar.bottom + 10)))
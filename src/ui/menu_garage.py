@@ -1,156 +1,292 @@
+import math
+import time
 import pygame as pg
 from src.constants import *
-from src.ui.widgets import Button
+from src.ui.widgets import Button, draw_dirty_buttons
 from src.core.assets import get_car_sprite
+from src.core.fonts import render_text
 
 class GarageMenu:
     """
     Displays the player's garage allowing them to select an active car.
-    Visualize cars in a grid system.
+    Cars sit in a virtualized, kinetically scrolled grid: only rows inside the
+    viewport are drawn, each from a cached cell surface, and the tile under the
+    pointer is found by row/column arithmetic.
     """
     def __init__(self, app, player, return_callback):
         self.app = app
         self.player = player
         self.return_callback = return_callback
         self.screen = app.screen
-        
-        self.title_font = pg.font.SysFont('Consolas', 50, bold=True)
-        self.info_font = pg.font.SysFont('Consolas', 24)
-        
-        # List of tuples: (pg.Rect, car_id_string)
-        self.car_rects = [] 
+
+        self.cars = []
         self.buttons = []
-        
+        self.hovered_index = None
+        self.viewport = pg.Rect(0, 0, 0, 0)
+        self.cols = 1
+        self.grid_left = 0
+
+        # Scroll state (px); velocity in px/s for kinetic scrolling
+        self.scroll = 0.0
+        self.velocity = 0.0
+        self.drawn_scroll = None
+        self.last_tick = None
+        self.drag_start = None
+        self.drag_moved = False
+        self.drag_samples = []
+
+        # (model_id, state) -> rendered cell surface
+        self.cell_cache = {}
+
         self.init_ui()
 
     def init_ui(self):
-        """Initializes buttons and calculates car grid positions."""
+        """Initializes buttons and lays out the car grid."""
         self.buttons = []
         cx = self.app.screen.get_width() // 2
         h = self.app.screen.get_height()
-        
+
         # Back button at the bottom
         self.buttons.append(Button(
-            self.app.lang.get("menu_back"), 
-            (cx, h - 80), 
-            self._on_back, 
-            app=self.app, 
+            self.app.lang.get("menu_back"),
+            (cx, h - 80),
+            self._on_back,
+            app=self.app,
             custom_color=ACCENT_RED
         ))
-        
-        # Calculate grid for cars
+
         self.calculate_car_grid()
 
     def calculate_car_grid(self):
-        """Calculates positions for owned cars to display in a grid layout."""
-        self.car_rects = []
-        
-        # Layout settings
-        start_x = 150
-        start_y = 180
-        gap_x = 220
-        gap_y = 200
-        cols_per_row = 4
-        
-        for i, item in enumerate(self.player.garage):
-            # FIX: Ensure we have the String ID, even if item is a Dict object
-            # Check model_id first (correct for new saves), then name
-            car_id = item
-            if isinstance(item, dict):
-                car_id = item.get('model_id') or item.get('name')
-            
-            row = i // cols_per_row
-            col = i % cols_per_row
-            
-            x = start_x + col * gap_x
-            y = start_y + row * gap_y
-            
-            # Target size for background panel
-            rect = pg.Rect(x, y, 160, 160)
-            self.car_rects.append((rect, car_id))
+        """Fits as many columns as the viewport allows; rows scroll vertically."""
+        w, h = self.app.screen.get_size()
+        self.cars = self.player.garage
+        self.viewport = pg.Rect(40, 120, w - 80, h - 120 - 130)
+        cell_w, _ = GARAGE_CELL
+        self.cols = max(1, self.viewport.width // cell_w)
+        self.grid_left = self.viewport.left + (self.viewport.width - self.cols * cell_w) // 2
+        # Labels may have changed language
+        self.cell_cache.clear()
+        self.scroll = min(self.scroll, self.max_scroll())
+        self.velocity = 0.0
+        self.drawn_scroll = None
 
     def _on_back(self):
         self.app.audio.play_sfx('ui_back')
         self.return_callback()
 
+    # --- SCROLLING ---
+    def max_scroll(self):
+        rows = math.ceil(len(self.cars) / self.cols)
+        return max(0, rows * GARAGE_CELL[1] - self.viewport.height)
+
+    def scroll_to(self, value):
+        self.scroll = max(0.0, min(float(self.max_scroll()), value))
+        if self.scroll in (0.0, self.max_scroll()):
+            self.velocity = 0.0
+
+    @property
+    def is_scrolling(self):
+        return self.velocity != 0.0 or self.drag_moved
+
+    def tick(self):
+        """Advances kinetic scrolling; call once per frame."""
+        now = time.perf_counter()
+        dt = min(0.1, now - self.last_tick) if self.last_tick is not None else 0.0
+        self.last_tick = now
+        if self.velocity and self.drag_start is None:
+            self.scroll_to(self.scroll + self.velocity * dt)
+            self.velocity *= math.exp(-GARAGE_FRICTION * dt)
+            if abs(self.velocity) < GARAGE_MIN_SPEED:
+                self.velocity = 0.0
+
+    # --- HIT TESTING ---
+    def tile_at(self, pos):
+        """Index of the car tile under pos, or None; O(1) whatever the garage size."""
+        if not self.viewport.collidepoint(pos):
+            return None
+        cell_w, cell_h = GARAGE_CELL
+        x = pos[0] - self.grid_left
+        y = pos[1] - self.viewport.top + int(self.scroll)
+        col, row = x // cell_w, y // cell_h
+        if not 0 <= col < self.cols:
+            return None
+        # Only the tile itself is clickable, not the label margins of its cell
+        tx, ty = x - col * cell_w, y - row * cell_h
+        ox, oy = self.tile_offset()
+        if not (ox <= tx < ox + GARAGE_TILE and oy <= ty < oy + GARAGE_TILE):
+            return None
+        index = row * self.cols + col
+        return index if index < len(self.cars) else None
+
+    def tile_offset(self):
+        """Top-left of the tile inside its cell."""
+        return (GARAGE_CELL[0] - GARAGE_TILE) // 2, 30
+
+    def cell_rect(self, index):
+        cell_w, cell_h = GARAGE_CELL
+        row, col = divmod(index, self.cols)
+        return pg.Rect(self.grid_left + col * cell_w,
+                       self.viewport.top + row * cell_h - int(self.scroll), cell_w, cell_h)
+
     def handle_click(self, mouse_pos):
-        """Checks if a car slot was clicked."""
-        for rect, car_id in self.car_rects:
-            if rect.collidepoint(mouse_pos):
-                if self.player.set_current_car(car_id):
-                    self.app.audio.play_sfx('ui_select')
-                else:
-                    self.app.audio.play_sfx('ui_error')
-                return
+        """Selects the car whose tile was clicked."""
+        index = self.tile_at(mouse_pos)
+        if index is None:
+            return
+        if self.player.set_current_car(self.cars[index].model_id):
+            self.app.audio.play_sfx('ui_select')
+            # Selection tints every tile of the old and new model
+            self.drawn_scroll = None
+        else:
+            self.app.audio.play_sfx('ui_error')
 
     def update(self, event):
         """Handles input events."""
         for btn in self.buttons:
             btn.handle_event(event)
-            
-        if event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
-            self.handle_click(event.pos)
+
+        if event.type == pg.MOUSEWHEEL:
+            self.velocity -= event.y * GARAGE_WHEEL_IMPULSE
+            # Motion starts now, not at the end of the idle wait
+            self.last_tick = time.perf_counter()
+        elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1 and self.viewport.collidepoint(event.pos):
+            # Grabbing the grid stops any fling
+            self.velocity = 0.0
+            self.drag_start = (event.pos[1], self.scroll)
+            self.drag_moved = False
+            self.drag_samples = [(time.perf_counter(), event.pos[1])]
+        elif event.type == pg.MOUSEMOTION and self.drag_start is not None:
+            y0, scroll0 = self.drag_start
+            if abs(event.pos[1] - y0) > GARAGE_DRAG_SLOP:
+                self.drag_moved = True
+            if self.drag_moved:
+                self.scroll_to(scroll0 - (event.pos[1] - y0))
+            self.drag_samples = (self.drag_samples + [(time.perf_counter(), event.pos[1])])[-5:]
+        elif event.type == pg.MOUSEBUTTONUP and event.button == 1 and self.drag_start is not None:
+            if self.drag_moved:
+                # Fling with the pointer speed over the last few motion samples
+                (t0, y0), (t1, y1) = self.drag_samples[0], self.drag_samples[-1]
+                if t1 > t0:
+                    self.velocity = -(y1 - y0) / (t1 - t0)
+                    self.last_tick = time.perf_counter()
+            else:
+                self.handle_click(event.pos)
+            self.drag_start = None
+            self.drag_moved = False
+
+    # --- DRAWING ---
+    def cell_surface(self, car, state):
+        """Cached cell (label, tile, name) for a model in 'idle', 'hover' or 'selected' state."""
+        key = (car.model_id, state)
+        surf = self.cell_cache.get(key)
+        if surf is None:
+            surf = pg.Surface(GARAGE_CELL, pg.SRCALPHA)
+            ox, oy = self.tile_offset()
+            rect = pg.Rect(ox, oy, GARAGE_TILE, GARAGE_TILE)
+            self.draw_tile(surf, rect, car.model_id, state == 'hover')
+            if state == 'selected':
+                sel_surf = render_text(self.app.lang.get("lbl_selected"), 24, ACCENT_GOLD)
+                surf.blit(sel_surf, sel_surf.get_rect(midbottom=(rect.centerx, rect.top - 5)))
+            name_surf = render_text(str(car.model_id), 24, TEXT_DIM)
+            surf.blit(name_surf, name_surf.get_rect(midtop=(rect.centerx, rect.bottom + 8)))
+            self.cell_cache[key] = surf
+        return surf
+
+    def tile_state(self, index, hovered):
+        if self.cars[index].model_id == self.player.current_car:
+            return 'selected'
+        return 'hover' if index == hovered else 'idle'
+
+    def draw_grid(self, screen):
+        """Draws only the rows intersecting the viewport."""
+        vp = self.viewport
+        screen.fill(BG_COLOR, vp)
+        cell_h = GARAGE_CELL[1]
+        scroll = int(self.scroll)
+        first = (scroll // cell_h) * self.cols
+        last = min(len(self.cars), ((scroll + vp.height) // cell_h + 1) * self.cols)
+        screen.set_clip(vp)
+        for i in range(first, last):
+            state = self.tile_state(i, self.hovered_index)
+            screen.blit(self.cell_surface(self.cars[i], state), self.cell_rect(i))
+        screen.set_clip(None)
+
+        # Scrollbar
+        max_scroll = self.max_scroll()
+        if max_scroll:
+            total = vp.height + max_scroll
+            bar_h = max(20, vp.height * vp.height // total)
+            bar_y = vp.top + int((vp.height - bar_h) * self.scroll / max_scroll)
+            pg.draw.rect(screen, BG_COLOR, (vp.right + 4, vp.top, 8, vp.height))
+            pg.draw.rect(screen, TEXT_DIM, (vp.right + 5, bar_y, 6, bar_h), border_radius=3)
+        self.drawn_scroll = self.scroll
 
     def draw(self, screen):
         """Draws the garage menu."""
         screen.fill(BG_COLOR)
-        
+
         # Title
-        title_surf = self.title_font.render(self.app.lang.get("title_garage"), True, TEXT_MAIN)
+        title_surf = render_text(self.app.lang.get("title_garage"), 50, TEXT_MAIN, bold=True)
         title_rect = title_surf.get_rect(center=(screen.get_width() // 2, 70))
         screen.blit(title_surf, title_rect)
-        
-        # Draw Cars Grid
-        mouse_pos = pg.mouse.get_pos()
-        
-        for rect, car_id in self.car_rects:
-            # 1. Get Sprite (Now safely handled in assets.py even if passed dict by mistake, 
-            # though calculate_car_grid tries to pass string)
-            sprite = get_car_sprite(self.app.assets, car_id)
-            
-            # 2. Determine state (Selected vs Hovered vs Idle)
-            is_selected = (car_id == self.player.current_car)
-            is_hovered = rect.collidepoint(mouse_pos)
-            
-            # 3. Draw Background
-            bg_color = (60, 60, 70)
-            if is_selected:
-                bg_color = (40, 70, 40) # Greenish tint
-            elif is_hovered:
-                bg_color = (70, 70, 80) # Lighter
-                
-            pg.draw.rect(screen, bg_color, rect, border_radius=10)
-            
-            # 4. Draw Border
-            border_col = TEXT_DIM
-            width = 2
-            if is_selected:
-                border_col = ACCENT_GOLD
-                width = 4
-            elif is_hovered:
-                border_col = TEXT_MAIN
-            
-            pg.draw.rect(screen, border_col, rect, width, border_radius=10)
-
-            # 5. Draw "Selected" Label if active
-            if is_selected:
-                sel_surf = self.info_font.render(self.app.lang.get("lbl_selected"), True, ACCENT_GOLD)
-                sel_rect = sel_surf.get_rect(midbottom=(rect.centerx, rect.top - 5))
-                screen.blit(sel_surf, sel_rect)
-
-            # 6. Draw Scaled Sprite
-            if sprite:
-                target_size = (128, 128) 
-                scaled = pg.transform.scale(sprite, target_size)
-                img_rect = scaled.get_rect(center=rect.center)
-                screen.blit(scaled, img_rect)
-                
-            # 7. Draw Name
-            # Ensure we display string name
-            name_surf = self.info_font.render(str(car_id), True, TEXT_DIM)
-            name_rect = name_surf.get_rect(midtop=(rect.centerx, rect.bottom + 8))
-            screen.blit(name_surf, name_rect)
+
+        self.hovered_index = None if self.is_scrolling else self.tile_at(pg.mouse.get_pos())
+        self.draw_grid(screen)
 
         # Draw UI Buttons
         for btn in self.buttons:
-            btn.draw(screen)
\ No newline at end of file
+            btn.draw(screen)
+
+    def draw_tile(self, screen, rect, car_id, is_hovered):
+        """Draws one car tile (background, border, sprite) inside rect."""
+        # 1. Get pre-scaled sprite from the atlas
+        sprite = get_car_sprite(self.app.assets, car_id, (128, 128))
+
+        # 2. Determine state (Selected vs Hovered vs Idle)
+        is_selected = (car_id == self.player.current_car)
+
+        # 3. Draw Background
+        bg_color = (60, 60, 70)
+        if is_selected:
+            bg_color = (40, 70, 40) # Greenish tint
+        elif is_hovered:
+            bg_color = (70, 70, 80) # Lighter
+
+        pg.draw.rect(screen, bg_color, rect, border_radius=10)
+
+        # 4. Draw Border
+        border_col = TEXT_DIM
+        width = 2
+        if is_selected:
+            border_col = ACCENT_GOLD
+            width = 4
+        elif is_hovered:
+            border_col = TEXT_MAIN
+
+        pg.draw.rect(screen, border_col, rect, width, border_radius=10)
+
+        # 5. Draw Sprite
+        if sprite:
+            img_rect = sprite.get_rect(center=rect.center)
+            screen.blit(sprite, img_rect)
+
+    def draw_dirty(self, screen):
+        """Partial redraw: the viewport while it scrolls, else hover changes of tiles and buttons."""
+        rects = draw_dirty_buttons(screen, self.buttons)
+        hovered = None if self.is_scrolling else self.tile_at(pg.mouse.get_pos())
+        if self.scroll != self.drawn_scroll:
+            self.hovered_index = hovered
+            self.draw_grid(screen)
+            rects.append(self.viewport.inflate(24, 0))
+        elif hovered != self.hovered_index:
+            screen.set_clip(self.viewport)
+            for i in (self.hovered_index, hovered):
+                if i is not None and i < len(self.cars):
+                    rect = self.cell_rect(i)
+                    screen.fill(BG_COLOR, rect)
+                    screen.blit(self.cell_surface(self.cars[i], self.tile_state(i, hovered)), rect)
+                    rects.append(rect.clip(self.viewport))
+            screen.set_clip(None)
+            self.hovered_index = hovered
+        return rects
@@ -1,13 +1,12 @@
-import pygame as pg
 from src.constants import *
-from src.ui.widgets import Button
+from src.ui.widgets import Button, draw_dirty_buttons
+from src.core.fonts import render_text
 
 class MainMenu:
     def __init__(self, app):
         self.app = app
         self.state = "main"
         self.buttons = []
-        self.title_font = pg.font.SysFont('Consolas', 60, bold=True)
         self.init_main_view()
 
     def _get_center_x(self):
@@ -63,9 +62,13 @@ class MainMenu:
         key = "title_slots" if self.state == "saves" else "title_main"
         title = self.app.lang.get(key)
         
-        t_surf = self.title_font.render(title, True, TEXT_MAIN)
+        t_surf = render_text(title, 60, TEXT_MAIN, bold=True)
         t_rect = t_surf.get_rect(center=(self._get_center_x(), 100))
         screen.blit(t_surf, t_rect)
         
         for btn in self.buttons:
-            btn.draw(screen)
\ No newline at end of file
+            btn.draw(screen)
+
+    def draw_dirty(self, screen):
+        """Partial redraw for idle frames; returns the changed rects."""
+        return draw_dirty_buttons(screen, self.buttons)
\ No newline at end of file
@@ -1,12 +1,11 @@
-import pygame as pg
 from src.constants import *
-from src.ui.widgets import Button, InputBox
+from src.ui.widgets import Button, InputBox, draw_dirty_buttons
+from src.core.fonts import render_text
 
 class GlobalSettingsMenu:
     def __init__(self, app, return_callback):
         self.app = app
         self.return_callback = return_callback
-        self.title_font = pg.font.SysFont('Consolas', 50, bold=True)
         self.buttons = []
         self.current_state = 'MAIN'
         self.init_main_view()
@@ -128,10 +127,14 @@ class GlobalSettingsMenu:
     def draw(self, screen):
         screen.fill(BG_COLOR)
         t_map = {'MAIN':'settings_global_title','GRAPHICS':'settings_graphics','AUDIO':'settings_audio','LANGUAGE':'settings_language'}
-        t_surf = self.title_font.render(self.app.lang.get(t_map.get(self.current_state)), True, TEXT_MAIN)
+        t_surf = render_text(self.app.lang.get(t_map.get(self.current_state)), 50, TEXT_MAIN, bold=True)
         screen.blit(t_surf, t_surf.get_rect(center=(self._get_cx(), 100)))
         for btn in self.buttons: btn.draw(screen)
 
+    def draw_dirty(self, screen):
+        """Partial redraw for idle frames; returns the changed rects."""
+        return draw_dirty_buttons(screen, self.buttons)
+
 class PlayerSettingsMenu:
     def __init__(self, app, player, return_cb):
         self.app = app
@@ -139,7 +142,6 @@ class PlayerSettingsMenu:
         self.return_cb = return_cb
         self.buttons = []
         self.input_box = None
-        self.font = pg.font.SysFont('Consolas', 50, bold=True)
         self.init_ui()
 
     def init_ui(self):
@@ -164,11 +166,19 @@ class PlayerSettingsMenu:
 
     def draw(self, screen):
         screen.fill(BG_COLOR)
-        t_surf = self.font.render(self.app.lang.get("settings_player_title"), True, TEXT_MAIN)
+        t_surf = render_text(self.app.lang.get("settings_player_title"), 50, TEXT_MAIN, bold=True)
         screen.blit(t_surf, t_surf.get_rect(center=(self.app.screen.get_width()//2, 80)))
         
-        lbl = pg.font.SysFont('Consolas', 28).render(self.app.lang.get("label_enter_name"), True, TEXT_DIM)
+        lbl = render_text(self.app.lang.get("label_enter_name"), 28, TEXT_DIM)
         screen.blit(lbl, lbl.get_rect(center=(self.app.screen.get_width()//2, 180)))
         
         self.input_box.draw(screen)
-        for b in self.buttons: b.draw(screen)
\ No newline at end of file
+        for b in self.buttons: b.draw(screen)
+
+    def draw_dirty(self, screen):
+        """Partial redraw for idle frames; returns the changed rects."""
+        rects = draw_dirty_buttons(screen, self.buttons)
+        if self.input_box.dirty:
+            self.input_box.draw(screen)
+            rects.append(self.input_box.rect)
+        return rects
\ No newline at end of file
@@ -0,0 +1,255 @@
+import numpy as np
+import pygame as pg
+from src.constants import *
+from src.ui.widgets import Button, InputBox, draw_dirty_buttons
+from src.core.fonts import get_font, render_text
+from src.game.catalog import PART_SLOTS, PART_TIERS, INVENTORY_CATEGORY
+
+SORT_KEYS = ('price', 'tier', 'stat')
+SLOT_FILTERS = (None,) + PART_SLOTS
+STAT_LABELS = {'accel': 'ACC', 'top_speed': 'TOP', 'brake': 'BRK', 'boost_power': 'PWR', 'boost_time': 'DUR'}
+ROW_HEIGHT = 40
+SCROLL_ROWS = 3  # Rows per mouse wheel notch
+
+class ShopMenu:
+    """
+    Parts shop over the game catalog.
+    Sorting masks one of the catalog's prebuilt sort indexes, search results are
+    narrowed from the previous query while the user keeps typing, and only the
+    rows inside the list viewport are ever rendered, so cost per frame does not
+    grow with the catalog.
+    """
+    def __init__(self, app, player, return_callback):
+        self.app = app
+        self.player = player
+        self.catalog = player.catalog
+        self.return_callback = return_callback
+
+        self.sort_key = 'price'
+        self.slot_filter = None
+        # (query, matching part indices) for each prefix of the current query
+        self.query_stack = [('', np.arange(len(self.catalog.part_ids)))]
+        self.rows = np.zeros(0, dtype=np.intp)
+        self.scroll = 0
+        self.hovered_row = None
+        self.stat_texts = {}
+        self.buttons = []
+        self.input_box = None
+        self.list_rect = pg.Rect(0, 0, 0, 0)
+
+        self.init_ui()
+
+    def init_ui(self):
+        """Builds widgets and the list viewport for the current screen size."""
+        w, h = self.app.screen.get_size()
+        cx = w // 2
+        text = self.input_box.text if self.input_box else ''
+        self.input_box = InputBox((260, 125), text, app=self.app)
+        self.list_rect = pg.Rect(60, 170, w - 120, h - 170 - 120)
+        lang = self.app.lang
+        sort_txt = f"{lang.get('shop_sort')}: {lang.get('sort_' + self.sort_key)}"
+        slot_txt = f"{lang.get('shop_slot')}: {lang.get('slot_' + (self.slot_filter or 'all'))}"
+        # Right-align the two toggles; Button pads its text by 30px
+        font = get_font(35, bold=True)
+        slot_w, sort_w = font.size(slot_txt)[0] + 30, font.size(sort_txt)[0] + 30
+        slot_x = self.list_rect.right - slot_w // 2
+        sort_x = self.list_rect.right - slot_w - 20 - sort_w // 2
+        self.buttons = [
+            Button(sort_txt, (sort_x, 125), self.cycle_sort, app=self.app),
+            Button(slot_txt, (slot_x, 125), self.cycle_slot, app=self.app),
+            Button(lang.get("menu_back"), (cx, h - 80), self._on_back, app=self.app, custom_color=ACCENT_RED)
+        ]
+        self.apply_query(text)
+
+    def _on_back(self):
+        self.app.audio.play_sfx('ui_back')
+        self.return_callback()
+
+    # --- FILTERING ---
+    def apply_query(self, text):
+        """
+        Narrows search results incrementally: a query extending the previous one
+        only re-checks the previous hits; deleting characters pops back to the
+        cached results of the shorter prefix.
+        """
+        query = text.lower().strip()
+        while not query.startswith(self.query_stack[-1][0]):
+            self.query_stack.pop()
+        base_query, base = self.query_stack[-1]
+        if query != base_query:
+            keys = self.catalog.search_keys
+            hits = np.fromiter((i for i in base if query in keys[i]), dtype=np.intp)
+            self.query_stack.append((query, hits))
+        self.refresh_rows()
+
+    def refresh_rows(self):
+        """Visible row order: the prebuilt sort index masked by search and slot filters."""
+        n = len(self.catalog.part_ids)
+        keep = np.zeros(n, dtype=bool)
+        keep[self.query_stack[-1][1]] = True
+        if self.slot_filter:
+            keep &= self.catalog.part_slot[:n] == PART_SLOTS.index(self.slot_filter)
+        order = self.catalog.sort_indexes[self.sort_key]
+        self.rows = order[keep[order]]
+        self.scroll = min(self.scroll, self.max_scroll())
+        self.hovered_row = None
+
+    def cycle_sort(self):
+        self.sort_key = SORT_KEYS[(SORT_KEYS.index(self.sort_key) + 1) % len(SORT_KEYS)]
+        self.scroll = 0
+        self.init_ui()
+
+    def cycle_slot(self):
+        self.slot_filter = SLOT_FILTERS[(SLOT_FILTERS.index(self.slot_filter) + 1) % len(SLOT_FILTERS)]
+        self.scroll = 0
+        self.init_ui()
+
+    # --- SCROLLING ---
+    def max_scroll(self):
+        return max(0, len(self.rows) * ROW_HEIGHT - self.list_rect.height)
+
+    def scroll_by(self, pixels):
+        self.scroll = max(0, min(self.max_scroll(), self.scroll + pixels))
+
+    def row_at(self, pos):
+        """Row under pos by arithmetic on the scroll offset, or None."""
+        if not self.list_rect.collidepoint(pos):
+            return None
+        row = (pos[1] - self.list_rect.top + self.scroll) // ROW_HEIGHT
+        return row if row < len(self.rows) else None
+
+    def row_rect(self, row):
+        return pg.Rect(self.list_rect.left, self.list_rect.top + row * ROW_HEIGHT - self.scroll,
+                       self.list_rect.width, ROW_HEIGHT)
+
+    # --- BUYING ---
+    def owned_count(self, part_id):
+        return self.player.part_counts[part_id] + len(self.player.by_part.get(part_id, ()))
+
+    def buy(self, row):
+        i = self.rows[row]
+        part_id = self.catalog.part_ids[i]
+        price = int(self.catalog.part_price[i])
+        if self.player.money < price:
+            self.app.audio.play_sfx('ui_error')
+            return False
+        self.player.money -= price
+        self.player.add_part(INVENTORY_CATEGORY[self.catalog.parts[part_id]['slot']], part_id)
+        self.app.audio.play_sfx('ui_select')
+        return True
+
+    def update(self, event):
+        """Handles input events."""
+        for btn in self.buttons:
+            btn.handle_event(event)
+
+        if event.type == pg.KEYDOWN:
+            if event.key in (pg.K_UP, pg.K_DOWN, pg.K_PAGEUP, pg.K_PAGEDOWN):
+                page = self.list_rect.height - ROW_HEIGHT
+                step = {pg.K_UP: -ROW_HEIGHT, pg.K_DOWN: ROW_HEIGHT, pg.K_PAGEUP: -page, pg.K_PAGEDOWN: page}
+                self.scroll_by(step[event.key])
+            elif event.key == pg.K_BACKSPACE or (event.unicode and event.unicode.isprintable()):
+                self.input_box.handle_event(event)
+                self.apply_query(self.input_box.text)
+        elif event.type == pg.MOUSEWHEEL:
+            self.scroll_by(-event.y * ROW_HEIGHT * SCROLL_ROWS)
+        elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
+            row = self.row_at(event.pos)
+            if row is not None:
+                self.buy(row)
+
+    # --- DRAWING ---
+    def stat_text(self, i):
+        """Short stat summary of part i, built once per part."""
+        if i not in self.stat_texts:
+            part = self.catalog.parts[self.catalog.part_ids[i]]
+            stats = dict(PART_DEFAULTS[part['slot']], **part['stats'])
+            self.stat_texts[i] = "  ".join(
+                f"{STAT_LABELS.get(k, k)} {v:.0f}" if v >= 10 else f"{STAT_LABELS.get(k, k)} {v:.2f}"
+                for k, v in stats.items())
+        return self.stat_texts[i]
+
+    def draw_row(self, screen, row, is_hovered):
+        """Draws one list row; callers clip to the list viewport."""
+        rect = self.row_rect(row)
+        i = self.rows[row]
+        part_id = self.catalog.part_ids[i]
+        price = int(self.catalog.part_price[i])
+
+        bg_color = (70, 70, 80) if is_hovered else (PANEL_BG if row % 2 else (42, 42, 46))
+        pg.draw.rect(screen, bg_color, rect)
+
+        cy = rect.centery
+        name_s = render_text(self.catalog.part_names[i], 22, TEXT_MAIN, bold=True)
+        screen.blit(name_s, name_s.get_rect(midleft=(rect.left + 15, cy)))
+        tier = self.catalog.part_tier[i]
+        tier_s = render_text(PART_TIERS[tier].upper() if tier < len(PART_TIERS) else '?', 22, ACCENT_BLUE, bold=True)
+        screen.blit(tier_s, tier_s.get_rect(midleft=(rect.left + 300, cy)))
+        stat_s = render_text(self.stat_text(i), 20, TEXT_DIM)
+        screen.blit(stat_s, stat_s.get_rect(midleft=(rect.left + 370, cy)))
+
+        owned = self.owned_count(part_id)
+        if owned:
+            own_s = render_text(f"{self.app.lang.get('shop_owned')}: {owned}", 20, ACCENT_GREEN)
+            screen.blit(own_s, own_s.get_rect(midright=(rect.right - 140, cy)))
+        price_col = ACCENT_GOLD if self.player.money >= price else ACCENT_RED
+        price_s = render_text(f"${price}", 22, price_col, bold=True)
+        screen.blit(price_s, price_s.get_rect(midright=(rect.right - 15, cy)))
+
+    def draw_list(self, screen):
+        """Renders only the rows intersecting the viewport."""
+        lr = self.list_rect
+        screen.fill(BG_COLOR, lr)
+        if not len(self.rows):
+            empty = render_text(self.app.lang.get("shop_empty"), 28, TEXT_DIM)
+            screen.blit(empty, empty.get_rect(center=lr.center))
+            return
+        first = self.scroll // ROW_HEIGHT
+        last = min(len(self.rows), (self.scroll + lr.height) // ROW_HEIGHT + 1)
+        screen.set_clip(lr)
+        for row in range(first, last):
+            self.draw_row(screen, row, row == self.hovered_row)
+        screen.set_clip(None)
+
+        # Scrollbar
+        total = len(self.rows) * ROW_HEIGHT
+        if total > lr.height:
+            bar_h = max(20, lr.height * lr.height // total)
+            bar_y = lr.top + (lr.height - bar_h) * self.scroll // self.max_scroll()
+            pg.draw.rect(screen, TEXT_DIM, (lr.right + 6, bar_y, 6, bar_h), border_radius=3)
+
+    def draw(self, screen):
+        """Draws the shop."""
+        screen.fill(BG_COLOR)
+        w = screen.get_width()
+
+        title_surf = render_text(self.app.lang.get("title_shop"), 50, TEXT_MAIN, bold=True)
+        screen.blit(title_surf, title_surf.get_rect(center=(w // 2, 50)))
+        money_s = render_text(f"${self.player.money}", 28, ACCENT_GOLD, bold=True)
+        screen.blit(money_s, money_s.get_rect(topright=(w - 60, 35)))
+
+        lbl = render_text(self.app.lang.get("shop_search"), 18, TEXT_DIM)
+        screen.blit(lbl, lbl.get_rect(midbottom=(self.input_box.rect.centerx, self.input_box.rect.top - 2)))
+        self.input_box.draw(screen)
+        count_s = render_text(f"{self.app.lang.get('shop_results')}: {len(self.rows)}", 18, TEXT_DIM)
+        screen.blit(count_s, count_s.get_rect(bottomleft=(self.list_rect.left, self.list_rect.bottom + 24)))
+
+        self.hovered_row = self.row_at(pg.mouse.get_pos())
+        self.draw_list(screen)
+
+        for btn in self.buttons:
+            btn.draw(screen)
+
+    def draw_dirty(self, screen):
+        """Partial redraw for idle frames: button and row hover changes."""
+        rects = draw_dirty_buttons(screen, self.buttons)
+        hovered = self.row_at(pg.mouse.get_pos())
+        if hovered != self.hovered_row:
+            screen.set_clip(self.list_rect)
+            for row in (self.hovered_row, hovered):
+                if row is not None and row < len(self.rows):
+                    self.draw_row(screen, row, row == hovered)
+                    rects.append(self.row_rect(row).clip(self.list_rect))
+            screen.set_clip(None)
+            self.hovered_row = hovered
+        return rects
@@ -0,0 +1,188 @@
+import math
+import time
+import pygame as pg
+from src.constants import *
+from src.game.race import Race
+from src.game.track import load_track_mask
+from src.game.automaton import TrafficLayer
+from src.core.assets import get_car_sprite, bank_frames
+from src.core.engine_audio import EngineAudio
+from src.core.fonts import get_glyph_atlas, render_text
+
+class RaceView:
+    """
+    Renders a Race and feeds it player input.
+    Physics advances in fixed steps inside Race.update(); this view only
+    interpolates between the last two steps, so any FPS limit gives the same race.
+    """
+    def __init__(self, app, player, return_callback, track_id='map_0'):
+        self.app = app
+        self.player = player
+        self.return_callback = return_callback
+        self.track_id = track_id
+
+        # Glyph atlases for per-frame numbers, which would only churn the text cache
+        self.hud_text = get_glyph_atlas(24, TEXT_MAIN, bold=True)
+        self.hud_gold = get_glyph_atlas(24, ACCENT_GOLD, bold=True)
+        self.debug_text = get_glyph_atlas(16, TEXT_DIM)
+
+        self.race = None
+        self.engine_audio = None
+        self.last_time = None
+        self.map_surf = None
+        self.map_scale = 1.0
+        self.car_size = (1, 1)
+        self.bank_frames = bank_frames('HIGH')
+
+    def start(self):
+        """Builds a fresh race from the player's current car and its mounted parts."""
+        track = self.app.data_manager.load_track(self.track_id)
+        car = self.player.get_car(self.player.current_car) or {"model_id": self.player.current_car}
+
+        entrants = [dict(car, driver='player')]
+        # AI rivals run the player's parts on different bodies
+        for i in range(RACE_AI_OPPONENTS):
+            entrants.append({
+                "model_id": f"car_{(i + 1) % CAR_MODEL_COUNT}",
+                "mounted_parts": car.get('mounted_parts', {}),
+                "driver": 'ai'
+            })
+
+        mask = load_track_mask(track.get('image', f'{self.track_id}.png'))
+        traffic = TrafficLayer(track, mask)
+        self.race = Race(track, entrants, self.player.catalog, mask, traffic)
+        self.last_time = None
+        self.stop_audio()
+        self.engine_audio = EngineAudio(self.app.audio)
+        self._prepare_map(track)
+        self._request_banks()
+
+    def _request_banks(self):
+        """Starts background builds of rotation banks for every car model on track."""
+        atlas = self.app.assets.get('car_atlas')
+        if not atlas:
+            return
+        self.bank_frames = bank_frames(self.app.global_settings.get('quality', 'HIGH'))
+        models = {e.get('model_id') for e in self.race.entrants}
+        if self.race.traffic:
+            models.update(self.race.traffic.model_ids)
+        for model_id in models:
+            atlas.bank(model_id, self.car_size, self.bank_frames)
+
+    def _prepare_map(self, track):
+        """Scales the track image to the screen once per race."""
+        self.map_surf = None
+        maps = self.app.assets.get('maps', [])
+        if not maps:
+            return
+        src = maps[0]
+        sw, sh = self.app.screen.get_size()
+        self.map_scale = min(sw / src.get_width(), sh / src.get_height())
+        size = (int(src.get_width() * self.map_scale), int(src.get_height() * self.map_scale))
+        self.map_surf = pg.transform.smoothscale(src, size)
+
+        # On-screen car size, keeping the tile aspect ratio
+        length = CAR_LENGTH_PX * self.map_scale
+        atlas = self.app.assets.get('car_atlas')
+        tile = atlas.tile('car_0') if atlas else None
+        aspect = tile.get_width() / tile.get_height() if tile else 0.6
+        self.car_size = (max(1, int(length * aspect)), max(1, int(length)))
+
+    def read_controls(self):
+        i = self.race.player_index
+        if i is None:
+            return
+        keys = pg.key.get_pressed()
+        self.race.set_controls(
+            i,
+            1.0 if (keys[pg.K_UP] or keys[pg.K_w]) else 0.0,
+            1.0 if (keys[pg.K_DOWN] or keys[pg.K_s]) else 0.0,
+            (keys[pg.K_RIGHT] or keys[pg.K_d]) - (keys[pg.K_LEFT] or keys[pg.K_a]),
+            bool(keys[pg.K_SPACE])
+        )
+
+    def player_finished(self):
+        i = self.race.player_index if self.race else None
+        return i is not None and self.race.finish_time(i) is not None
+
+    def tick(self):
+        """Called once per rendered frame; feeds real elapsed time to the simulation."""
+        if not self.race:
+            return
+        now = time.perf_counter()
+        frame_dt = 0.0 if self.last_time is None else now - self.last_time
+        self.last_time = now
+
+        self.read_controls()
+        self.race.update(frame_dt)
+        if self.engine_audio:
+            self.engine_audio.update(self.race)
+
+    def stop_audio(self):
+        """Silences race engines; called when leaving the race."""
+        if self.engine_audio:
+            self.engine_audio.stop()
+            self.engine_audio = None
+
+    def update(self, event):
+        if event.type == pg.KEYDOWN and event.key == pg.K_RETURN:
+            if self.player_finished():
+                self.app.audio.play_sfx('ui_select')
+                self.return_callback()
+
+    def draw(self, screen):
+        screen.fill(BG_COLOR)
+        if not self.race:
+            return
+        if self.map_surf:
+            screen.blit(self.map_surf, (0, 0))
+
+        if self.race.traffic:
+            t_pos, t_heading = self.race.traffic.positions()
+            for model_id, (x, y), h in zip(self.race.traffic.model_ids, t_pos, t_heading):
+                self.draw_car(screen, model_id, x, y, h)
+
+        pos, heading = self.race.interpolated()
+        for i, entrant in enumerate(self.race.entrants):
+            x, y = pos[i]
+            self.draw_car(screen, entrant.get('model_id'), x, y, heading[i])
+        self.draw_hud(screen)
+
+    def draw_car(self, screen, model_id, x, y, heading):
+        # Sprites face up (-90 deg); pygame rotates counter-clockwise
+        angle = -90 - math.degrees(heading)
+        center = (x * self.map_scale, y * self.map_scale)
+        atlas = self.app.assets.get('car_atlas')
+        bank = atlas.bank(model_id, self.car_size, self.bank_frames) if atlas else None
+        if bank:
+            bank.blit(screen, angle, center)
+            return
+        # Bank still building: fall back to the atlas' rotation cache
+        img = get_car_sprite(self.app.assets, model_id, self.car_size, angle)
+        if img:
+            screen.blit(img, img.get_rect(center=center))
+
+    def draw_hud(self, screen):
+        w, h = screen.get_size()
+        race = self.race
+        i = race.player_index
+
+        finish = race.finish_time(i) if i is not None else None
+        t = finish if finish is not None else race.time
+        self.hud_text.draw(screen, f"{self.app.lang.get('race_time')}: {t:6.2f}", (20, 18))
+
+        if i is not None:
+            speed = int(race.cars.speed[i])
+            self.hud_gold.draw(screen, f"P{race.position(i)}/{race.count}  {speed} px/s", (w - 20, 18), 'topright')
+
+            if finish is not None:
+                fs = render_text(self.app.lang.get('race_finished'), 24, ACCENT_GREEN, bold=True)
+                screen.blit(fs, fs.get_rect(center=(w // 2, h // 2 - 20)))
+                cs = render_text(self.app.lang.get('race_continue'), 16, TEXT_MAIN)
+                screen.blit(cs, cs.get_rect(center=(w // 2, h // 2 + 15)))
+
+        # Physics step budget (debug)
+        b = race.budget_stats()
+        self.debug_text.draw(
+            screen, f"step {b['mean_ms']:.3f}ms p99 {b['p99_ms']:.3f}/{b['budget_ms']:.1f}ms over {b['overruns']}",
+            (20, h - 30))
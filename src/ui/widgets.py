@@ -1,5 +1,6 @@
 import pygame as pg
 from src.constants import *
+from src.core.fonts import get_font, render_text
 
 class Button:
     def __init__(self, text, center_pos, action, app=None, custom_color=None):
@@ -9,7 +10,7 @@ class Button:
         self.text = text
         self.action = action
         self.app = app  # Needed for sound
-        self.font = pg.font.SysFont('Consolas', 35, bold=True)
+        self.font = get_font(35, bold=True)
         self.color_idle = custom_color if custom_color else BUTTON_COLOR
         self.color_hover = BUTTON_HOVER_COLOR
         self.text_color = TEXT_MAIN
@@ -23,21 +24,29 @@ class Button:
         self.shadow_rect.x += 3
         self.shadow_rect.y += 3
         
-        self.text_surf = self.font.render(self.text, True, self.text_color)
+        self.text_surf = render_text(self.text, 35, self.text_color, bold=True)
         self.text_rect = self.text_surf.get_rect(center=self.rect.center)
         
         self.is_hovered = False
+        # Area touched by draw(), reported for partial display updates
+        self.dirty_rect = self.rect.union(self.shadow_rect)
 
-    def draw(self, screen):
-        mouse_pos = pg.mouse.get_pos()
+    def update_hover(self, mouse_pos):
+        """Tracks hover state; returns True if it changed (the button needs a redraw)."""
         hover_now = self.rect.collidepoint(mouse_pos)
+        if hover_now == self.is_hovered:
+            return False
         
         # Play hover sound only on state change
-        if hover_now and not self.is_hovered:
+        if hover_now:
             if self.app and hasattr(self.app, 'audio'):
                 self.app.audio.play_sfx('ui_hover')
         
         self.is_hovered = hover_now
+        return True
+
+    def draw(self, screen):
+        self.update_hover(pg.mouse.get_pos())
         col = self.color_hover if self.is_hovered else self.color_idle
         
         pg.draw.rect(screen, (15, 15, 20), self.shadow_rect, border_radius=8)
@@ -61,13 +70,14 @@ class Button:
 class InputBox:
     def __init__(self, center_pos, initial_text='', app=None):
         self.app = app
-        self.font = pg.font.SysFont('Consolas', 35, bold=True)
+        self.font = get_font(35, bold=True)
         self.rect = pg.Rect(0, 0, 300, 50)
         self.rect.center = center_pos
         self.color = TEXT_DIM
         self.text = initial_text
-        self.txt_surface = self.font.render(self.text, True, TEXT_MAIN)
+        self.txt_surface = render_text(self.text, 35, TEXT_MAIN, bold=True)
         self.active = True
+        self.dirty = False
 
     def handle_event(self, event):
         if event.type == pg.KEYDOWN and self.active:
@@ -80,10 +90,26 @@ class InputBox:
                 if len(self.text) < 12:
                     self.text += event.unicode
                     if self.app: self.app.audio.play_sfx('ui_hover')
-            self.txt_surface = self.font.render(self.text, True, TEXT_MAIN)
+            self.txt_surface = render_text(self.text, 35, TEXT_MAIN, bold=True)
+            self.dirty = True
 
     def draw(self, screen):
+        self.dirty = False
         pg.draw.rect(screen, (0,0,0), self.rect)
         pg.draw.rect(screen, self.color, self.rect, 2)
         text_rect = self.txt_surface.get_rect(center=self.rect.center)
-        screen.blit(self.txt_surface, text_rect)
\ No newline at end of file
+        screen.blit(self.txt_surface, text_rect)
+
+def draw_dirty_buttons(screen, buttons, bg_color=BG_COLOR):
+    """
+    Redraws only the buttons whose hover state changed since the last frame.
+    Returns the screen rects touched, for pg.display.update().
+    """
+    mouse_pos = pg.mouse.get_pos()
+    rects = []
+    for btn in buttons:
+        if btn.update_hover(mouse_pos):
+            screen.fill(bg_color, btn.dirty_rect)
+            btn.draw(screen)
+            rects.append(btn.dirty_rect)
+    return rects
\ No newline at end of file